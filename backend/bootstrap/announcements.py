@@ -0,0 +1,22 @@
+from fastapi import FastAPI
+
+from backend.core.http.upstreams import TELEGRAM_WEB
+from backend.modules.announcements.service import get_latest_telegram_post_id
+from backend.modules.announcements.telegram_feed import LatestPostCache
+
+
+async def setup_telegram_post_cache(app: FastAPI) -> None:
+    """Start the background refresh of the channel's latest post id (see ``announcements``)."""
+    cache = LatestPostCache(
+        app.state.redis,
+        lambda: get_latest_telegram_post_id(app.state.http_clients.get(TELEGRAM_WEB)),
+    )
+    cache.start()
+    app.state.telegram_post_cache = cache
+
+
+async def cleanup_telegram_post_cache(app: FastAPI) -> None:
+    cache: LatestPostCache | None = getattr(app.state, "telegram_post_cache", None)
+    if cache:
+        await cache.aclose()
+    app.state.telegram_post_cache = None
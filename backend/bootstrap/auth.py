@@ -0,0 +1,17 @@
+from fastapi import FastAPI
+
+from backend.modules.auth.principal_cache import PrincipalCache
+from backend.modules.auth.refresh_singleflight import RefreshSingleFlight
+
+
+async def setup_auth_caches(app: FastAPI) -> None:
+    """Redis-backed principal cache and refresh-token single-flight (see ``modules/auth``)."""
+    app.state.principal_cache = PrincipalCache(app.state.redis)
+    app.state.refresh_singleflight = RefreshSingleFlight(
+        app.state.redis, secret=app.state.config.APP_JWT_SECRET_256
+    )
+
+
+async def cleanup_auth_caches(app: FastAPI) -> None:
+    app.state.principal_cache = None
+    app.state.refresh_singleflight = None
@@ -0,0 +1,22 @@
+from fastapi import FastAPI
+
+from backend.core.http.upstreams import QUALTRICS
+from backend.modules.elections.counter import ElectionCounterFeed
+from backend.modules.elections.service import get_survey_responses_count
+
+
+async def setup_election_counter(app: FastAPI) -> None:
+    """Start the shared Qualtrics poller behind the elections counter (see ``elections``)."""
+    feed = ElectionCounterFeed(
+        app.state.redis,
+        lambda: get_survey_responses_count(app.state.http_clients.get(QUALTRICS)),
+    )
+    feed.start()
+    app.state.election_counter = feed
+
+
+async def cleanup_election_counter(app: FastAPI) -> None:
+    feed: ElectionCounterFeed | None = getattr(app.state, "election_counter", None)
+    if feed:
+        await feed.aclose()
+    app.state.election_counter = None
@@ -0,0 +1,26 @@
+from fastapi import FastAPI
+
+from backend.modules.campuscurrent.events.attendee_counts import AttendeeCountReconciler
+from backend.modules.campuscurrent.events.listing_cache import EventListingCache
+
+
+async def setup_event_listings(app: FastAPI) -> None:
+    """Create the event listing cache and start the attendee-count reconciler."""
+    app.state.event_listing_cache = EventListingCache(app.state.redis)
+    reconciler = AttendeeCountReconciler(
+        app.state.db_manager,
+        app.state.redis,
+        listing_cache=app.state.event_listing_cache,
+    )
+    reconciler.start()
+    app.state.attendee_count_reconciler = reconciler
+
+
+async def cleanup_event_listings(app: FastAPI) -> None:
+    reconciler: AttendeeCountReconciler | None = getattr(
+        app.state, "attendee_count_reconciler", None
+    )
+    if reconciler:
+        await reconciler.aclose()
+    app.state.attendee_count_reconciler = None
+    app.state.event_listing_cache = None
@@ -0,0 +1,52 @@
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from backend.core.configs.config import config
+from backend.core.executor.pool import CpuExecutor, CpuExecutorBusyError, CpuJobTimeoutError
+
+
+async def setup_executor(app: FastAPI) -> None:
+    """Create the shared process pool for CPU-bound jobs (see ``core/executor``)."""
+    executor = CpuExecutor(
+        max_workers=config.CPU_EXECUTOR_WORKERS,
+        max_pending=config.CPU_EXECUTOR_MAX_PENDING,
+        max_tasks_per_child=config.CPU_EXECUTOR_MAX_TASKS_PER_CHILD,
+        inline=config.CPU_EXECUTOR_INLINE,
+    )
+    executor.start()
+    app.state.cpu_executor = executor
+
+
+async def cleanup_executor(app: FastAPI) -> None:
+    executor: CpuExecutor | None = getattr(app.state, "cpu_executor", None)
+    if executor:
+        executor.shutdown()
+    app.state.cpu_executor = None
+
+
+def register_executor_error_handlers(app: FastAPI) -> None:
+    """Map executor saturation/timeouts/pool failures to 503 so callers can retry later."""
+
+    async def _busy(request: Request, exc: CpuExecutorBusyError) -> JSONResponse:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "server_busy"},
+            headers={"Retry-After": "5"},
+        )
+
+    async def _timeout(request: Request, exc: CpuJobTimeoutError) -> JSONResponse:
+        return JSONResponse(status_code=503, content={"detail": "processing_timeout"})
+
+    async def _broken(request: Request, exc: BrokenProcessPool) -> JSONResponse:
+        # The executor already recreates the pool on the next job.
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "processing_unavailable"},
+            headers={"Retry-After": "5"},
+        )
+
+    app.add_exception_handler(CpuExecutorBusyError, _busy)
+    app.add_exception_handler(CpuJobTimeoutError, _timeout)
+    app.add_exception_handler(BrokenProcessPool, _broken)
@@ -138,6 +138,11 @@ def setup_gcp(app: FastAPI) -> None:
         print(f"⚠️  Warning: Could not cache signing credentials: {e}")
         app.state.signing_credentials = None
 
+    # Signed download URLs are reused per object until shortly before they expire.
+    from backend.modules.google_bucket.signed_url_cache import SignedUrlCache
+
+    app.state.signed_url_cache = SignedUrlCache()
+
     bucket = app.state.storage_client.bucket(config.BUCKET_NAME)
     bucket.cors = [
         {
@@ -0,0 +1,19 @@
+from fastapi import FastAPI
+
+from backend.modules.google_bucket.deletion_queue import GcsDeletionQueue, gcs_batch_deleter
+
+
+async def setup_gcs_deletion_queue(app: FastAPI) -> None:
+    """Start the background GCS deletion worker (see ``google_bucket/deletion_queue``)."""
+    queue = GcsDeletionQueue(
+        gcs_batch_deleter(app.state.storage_client, app.state.config.BUCKET_NAME)
+    )
+    queue.start()
+    app.state.gcs_deletion_queue = queue
+
+
+async def cleanup_gcs_deletion_queue(app: FastAPI) -> None:
+    queue: GcsDeletionQueue | None = getattr(app.state, "gcs_deletion_queue", None)
+    if queue:
+        await queue.aclose()
+    app.state.gcs_deletion_queue = None
@@ -0,0 +1,19 @@
+from fastapi import FastAPI
+
+from backend.core.http.clients import HttpClientRegistry
+from backend.core.http.upstreams import DEFAULT_UPSTREAMS, KEYCLOAK
+
+
+async def setup_http_clients(app: FastAPI) -> None:
+    """Create pooled upstream HTTP clients (see ``core/http``) and bind the Keycloak one."""
+    app.state.http_clients = HttpClientRegistry(DEFAULT_UPSTREAMS)
+    kc_manager = getattr(app.state, "kc_manager", None)
+    if kc_manager is not None:
+        kc_manager.bind_http_client(app.state.http_clients.get(KEYCLOAK))
+
+
+async def cleanup_http_clients(app: FastAPI) -> None:
+    registry: HttpClientRegistry | None = getattr(app.state, "http_clients", None)
+    if registry:
+        await registry.aclose()
+    app.state.http_clients = None
@@ -5,14 +5,22 @@ from typing import List, Optional, Type
 
 import httpx
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from prometheus_client import Gauge
 from sqlalchemy import Column
 from sqlalchemy.orm import DeclarativeBase
 
-from backend.common.utils import meilisearch
+from backend.common.utils import meilisearch, meilisearch_sync
+from backend.common.utils.search_cache import SearchResultCache
 from backend.core.configs.config import config
 
 MeilisearchHook = Callable[[FastAPI], Awaitable[None]]
 
+SEARCH_INDEXES_READY = Gauge(
+    "meilisearch_indexes_ready",
+    "1 once the startup sync finished and all required Meilisearch indexes are live",
+)
+
 
 @dataclass
 class MeilisearchIndexConfig:
@@ -40,36 +48,42 @@ class MeilisearchIndexConfig:
 async def _sync_index_configs(
     app: FastAPI, index_configs: Sequence[MeilisearchIndexConfig]
 ) -> None:
-    try:
-        response = await app.state.meilisearch_client.get("/indexes")
-        existing_indexes = response.json()
-        for index in existing_indexes.get("results", []):
-            await app.state.meilisearch_client.delete(f"/indexes/{index['uid']}")
-    except Exception as e:
-        print(f"Error clearing existing indexes: {str(e)}")
-
+    client = app.state.meilisearch_client
+    # Shadows left by crashed rebuilds are dropped by sync_index under the index lock.
     for index_config in index_configs:
+        settings = {"searchableAttributes": index_config.get_searchable_names()}
+        if index_config.filterable_attributes:
+            settings["filterableAttributes"] = index_config.get_filterable_names()
         try:
-            await meilisearch.sync_with_db(
-                meilisearch_client=app.state.meilisearch_client,
-                storage_name=index_config.model.__tablename__,
-                db_manager=app.state.db_manager,
-                model=index_config.model,
-                columns_for_searching=index_config.get_searchable_names(),
+            await meilisearch_sync.sync_index(
+                client,
+                getattr(app.state, "redis", None),
+                app.state.db_manager,
+                index_config.model,
+                index_config.get_searchable_names(),
                 primary_key=index_config.get_primary_key_name(),
+                settings=settings,
+                force_full=config.MEILISEARCH_FULL_REINDEX,
             )
-            await app.state.meilisearch_client.patch(
-                f"/indexes/{index_config.model.__tablename__}/settings",
-                json={"searchableAttributes": index_config.get_searchable_names()},
-            )
-            if index_config.filterable_attributes:
-                await app.state.meilisearch_client.patch(
-                    f"/indexes/{index_config.model.__tablename__}/settings",
-                    json={"filterableAttributes": index_config.get_filterable_names()},
-                )
         except Exception as e:
             print(f"Error syncing index {index_config.model.__tablename__}: {e}")
 
+    try:
+        await meilisearch_sync.prune_tombstones(app.state.db_manager)
+    except Exception as e:
+        print(f"Error pruning search tombstones: {e}")
+
+
+async def _missing_indexes(app: FastAPI, uids: Sequence[str]) -> list[str]:
+    missing = []
+    for uid in uids:
+        try:
+            if not await meilisearch.index_exists(app.state.meilisearch_client, uid):
+                missing.append(uid)
+        except Exception:
+            missing.append(uid)
+    return missing
+
 
 async def setup_meilisearch(
     app: FastAPI,
@@ -77,13 +91,26 @@ async def setup_meilisearch(
     index_configs: Sequence[MeilisearchIndexConfig] = (),
     after_sync: Sequence[MeilisearchHook] = (),
     on_cleanup: Sequence[MeilisearchHook] = (),
+    required_indexes: Sequence[str] = (),
 ) -> None:
-    """Create the Meilisearch client and sync indexes from module contributors."""
+    """
+    Create the Meilisearch client and sync indexes from module contributors.
+
+    Keyword searches go through a Redis result cache when Redis is set up.
+    Readiness (``app.state.search_ready``) flips once the initial sync is done and
+    every configured index plus ``required_indexes`` is live.
+    """
     app.state.meilisearch_client = httpx.AsyncClient(
         base_url=config.MEILISEARCH_URL,
         headers={"Authorization": f"Bearer {config.MEILISEARCH_MASTER_KEY}"},
     )
+    app.state.search_cache = SearchResultCache(getattr(app.state, "redis", None))
+    meilisearch.configure_result_cache(app.state.search_cache)
     app.state.meili_cleanup_hooks = list(on_cleanup)
+    app.state.search_ready = False
+    app.state.search_missing_indexes = []
+    SEARCH_INDEXES_READY.set(0)
+    required = [c.model.__tablename__ for c in index_configs] + list(required_indexes)
 
     async def _init_meili_indices() -> None:
         await _sync_index_configs(app, index_configs)
@@ -92,6 +119,12 @@ async def setup_meilisearch(
                 await hook(app)
             except Exception as e:
                 print(f"Error in Meilisearch after_sync hook: {e}")
+        missing = await _missing_indexes(app, required)
+        app.state.search_missing_indexes = missing
+        app.state.search_ready = not missing
+        SEARCH_INDEXES_READY.set(0 if missing else 1)
+        if missing:
+            print(f"Meilisearch indexes not live after startup sync: {missing}")
 
     app.state.meili_init_task: Optional[asyncio.Task] = asyncio.create_task(_init_meili_indices())
 
@@ -111,6 +144,24 @@ async def cleanup_meilisearch(app: FastAPI) -> None:
         except Exception as e:
             print(f"Error in Meilisearch cleanup hook: {e}")
 
+    meilisearch.configure_result_cache(None)
     client = getattr(app.state, "meilisearch_client", None)
     if client:
         await client.aclose()
+
+
+def register_readiness_route(app: FastAPI) -> None:
+    """``GET /health/ready``: 503 until the required Meilisearch indexes are live."""
+
+    async def _ready() -> JSONResponse:
+        if getattr(app.state, "search_ready", False):
+            return JSONResponse(status_code=200, content={"status": "ready"})
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "starting",
+                "missing_indexes": getattr(app.state, "search_missing_indexes", []),
+            },
+        )
+
+    app.add_api_route("/health/ready", _ready, methods=["GET"], include_in_schema=False)
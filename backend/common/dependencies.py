@@ -2,6 +2,7 @@ from typing import AsyncGenerator
 
 from backend.common.schemas import Infra
 from backend.core.database.manager import AsyncDatabaseManager
+from backend.core.http.clients import HttpClientRegistry
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,9 +16,18 @@ async def get_infra(request: Request) -> Infra:
         signing_credentials=request.app.state.signing_credentials,
         redis=request.app.state.redis,
         broker=request.app.state.broker,
+        cpu_executor=getattr(request.app.state, "cpu_executor", None),
+        signed_url_cache=getattr(request.app.state, "signed_url_cache", None),
+        gcs_deletion_queue=getattr(request.app.state, "gcs_deletion_queue", None),
+        event_listing_cache=getattr(request.app.state, "event_listing_cache", None),
     )
 
 
+def get_http_clients(request: Request) -> HttpClientRegistry:
+    """Pooled upstream HTTP clients created in ``backend/lifespan.py``."""
+    return request.app.state.http_clients
+
+
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Retrieve the database session from the shared db_manager."""
     db_manager: AsyncDatabaseManager = request.app.state.db_manager
@@ -1,6 +1,10 @@
 from typing import List
 
 from backend.core.configs.config import Config
+from backend.core.executor.pool import CpuExecutor
+from backend.modules.campuscurrent.events.listing_cache import EventListingCache
+from backend.modules.google_bucket.deletion_queue import GcsDeletionQueue
+from backend.modules.google_bucket.signed_url_cache import SignedUrlCache
 from google.auth.credentials import Credentials
 from google.cloud import storage
 from httpx import AsyncClient
@@ -36,5 +40,10 @@ class Infra(BaseModel):
     signing_credentials: Credentials | None = None
     redis: Redis
     broker: RabbitBroker
+    cpu_executor: CpuExecutor | None = None
+    signed_url_cache: SignedUrlCache | None = None
+    gcs_deletion_queue: GcsDeletionQueue | None = None
+    event_listing_cache: EventListingCache | None = None
+
     class Config:
         arbitrary_types_allowed = True
@@ -1,8 +1,19 @@
+import asyncio
+import contextlib
+import json
+import logging
+import secrets
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Sequence
+from datetime import datetime
 from enum import Enum
 from typing import Type
 
+from backend.common.utils.multi_search import batcher_for
+from backend.common.utils.search_cache import SearchResultCache
 from backend.core.database.manager import AsyncDatabaseManager
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
+from prometheus_client import Counter, Gauge
 from sqlalchemy import select
 from sqlalchemy.orm import DeclarativeBase
 
@@ -17,6 +28,36 @@ from sqlalchemy.orm import DeclarativeBase
     Use the id to get other values of the object.
 """
 
+logger = logging.getLogger(__name__)
+
+SHADOW_INDEX_SUFFIX = "__shadow"
+SYNC_BATCH_SIZE = 5000
+
+INGESTED_DOCUMENTS = Counter(
+    "meilisearch_ingested_documents_total",
+    "Documents uploaded to Meilisearch during index rebuilds and incremental syncs",
+    ["index"],
+)
+INGEST_TASKS_IN_FLIGHT = Gauge(
+    "meilisearch_ingest_tasks_in_flight",
+    "Document upload tasks enqueued but not yet confirmed",
+    ["index"],
+)
+
+# Set from bootstrap once Redis is up; None means searches always hit Meilisearch.
+_result_cache: SearchResultCache | None = None
+
+
+def configure_result_cache(cache: SearchResultCache | None) -> None:
+    global _result_cache
+    _result_cache = cache
+
+
+async def invalidate_search_cache(storage_name: str) -> None:
+    """Bump the index generation so no cached search result for it is served again."""
+    if _result_cache is not None:
+        await _result_cache.invalidate(storage_name)
+
 
 async def upsert(
     client: AsyncClient, storage_name: str, json_values: dict, primary_key: str = "id"
@@ -42,6 +83,7 @@ async def upsert(
         raise ValueError(f"Document must contain a '{primary_key}' field")
 
     response = await client.post(f"/indexes/{storage_name}/documents", json=json_values)
+    await invalidate_search_cache(storage_name)
     return response.json()
 
 
@@ -52,10 +94,14 @@ async def get(
     filters: list | None = None,
     page: int = 0,
     size: int = 20,
+    batched: bool = False,
 ) -> dict:
     """
     Search for documents in Meilisearch.
 
+    Successful responses are cached briefly per index, normalized keyword, filters
+    and page (see ``search_cache``); writes through this module invalidate them.
+
     Args:
         request: The FastAPI request object containing the Meilisearch client
         storage_name: The name of the Meilisearch index
@@ -63,6 +109,8 @@ async def get(
         filters: List of filters to apply
         page: The page number to return
         size: The number of results per page
+        batched: Send through ``/multi-search`` together with concurrent lookups
+            (see ``multi_search``); use it for fan-out over many keywords
 
     Returns:
         The Meilisearch response as JSON
@@ -80,8 +128,15 @@ async def get(
     if filters:
         payload["filter"] = filters
 
-    response = await client.post(f"/indexes/{storage_name}/search", json=payload)
-    return response.json()
+    async def _search() -> tuple[dict, bool]:
+        if batched:
+            return await batcher_for(client).search(storage_name, payload)
+        response = await client.post(f"/indexes/{storage_name}/search", json=payload)
+        return response.json(), response.is_success
+
+    if _result_cache is None:
+        return (await _search())[0]
+    return await _result_cache.get_or_search(storage_name, payload, _search)
 
 
 async def delete(
@@ -90,9 +145,236 @@ async def delete(
     primary_key: str,
 ):
     response = await client.delete(f"indexes/{storage_name}/documents/{primary_key}")
+    await invalidate_search_cache(storage_name)
     return response.json()
 
 
+class MeilisearchTaskError(RuntimeError):
+    """A Meilisearch task failed, was canceled or did not finish in time."""
+
+
+def _task_uid(response: Response) -> int:
+    response.raise_for_status()
+    return response.json()["taskUid"]
+
+
+async def wait_for_task(
+    client: AsyncClient,
+    task_uid: int,
+    *,
+    timeout: float = 300.0,
+    poll_interval: float = 0.05,
+) -> dict:
+    """Poll ``/tasks/{uid}`` until the task finishes; raise unless it succeeded."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = poll_interval
+    while True:
+        response = await client.get(f"/tasks/{task_uid}")
+        response.raise_for_status()
+        task = response.json()
+        status = task.get("status")
+        if status == "succeeded":
+            return task
+        if status in ("failed", "canceled"):
+            raise MeilisearchTaskError(f"Meilisearch task {task_uid} {status}: {task.get('error')}")
+        if loop.time() >= deadline:
+            raise MeilisearchTaskError(
+                f"Meilisearch task {task_uid} still {status} after {timeout}s"
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
+async def index_exists(client: AsyncClient, uid: str) -> bool:
+    response = await client.get(f"/indexes/{uid}")
+    if response.status_code == 404:
+        return False
+    response.raise_for_status()
+    return True
+
+
+async def _delete_index(client: AsyncClient, uid: str) -> None:
+    response = await client.delete(f"/indexes/{uid}")
+    if response.status_code == 404:
+        return
+    await wait_for_task(client, _task_uid(response))
+
+
+async def _create_index(client: AsyncClient, uid: str, primary_key: str) -> None:
+    response = await client.post("/indexes", json={"uid": uid, "primaryKey": primary_key})
+    await wait_for_task(client, _task_uid(response))
+
+
+def _shadow_prefix(uid: str) -> str:
+    return f"{uid}{SHADOW_INDEX_SUFFIX}_"
+
+
+async def drop_shadow_indexes(client: AsyncClient, uid: str) -> int:
+    """
+    Delete shadow indexes of ``uid`` left behind by crashed rebuilds.
+
+    Only call this while holding ``uid``'s sync lock: a rebuild running elsewhere
+    owns its shadow until it swaps it in. Returns the number of indexes deleted.
+    """
+    prefix = _shadow_prefix(uid)
+    leftovers: list[str] = []
+    offset = 0
+    while True:
+        response = await client.get("/indexes", params={"offset": offset, "limit": 1000})
+        response.raise_for_status()
+        page = response.json()
+        results = page.get("results", [])
+        leftovers += [index["uid"] for index in results if index["uid"].startswith(prefix)]
+        offset += len(results)
+        if not results or offset >= page.get("total", 0):
+            break
+    for shadow in leftovers:
+        await _delete_index(client, shadow)
+    return len(leftovers)
+
+
+async def upload_batches(
+    client: AsyncClient,
+    uid: str,
+    batches: Iterable[Sequence[dict]] | AsyncIterable[Sequence[dict]],
+    *,
+    metric_index: str | None = None,
+    max_in_flight: int = 4,
+) -> int:
+    """
+    Upsert ``batches`` into ``uid`` as NDJSON and wait until every task succeeded.
+
+    At most ``max_in_flight`` upload tasks are left unconfirmed, so a streaming
+    producer is back-pressured by Meilisearch. Returns the number of documents.
+    """
+    metric_index = metric_index or uid
+    in_flight: deque[int] = deque()
+    in_flight_gauge = INGEST_TASKS_IN_FLIGHT.labels(index=metric_index)
+    total = 0
+
+    async def _confirm_oldest() -> None:
+        # Tasks run in enqueue order; each is checked so a failed batch raises.
+        await wait_for_task(client, in_flight.popleft())
+        in_flight_gauge.dec()
+
+    async def _upload(batch: Sequence[dict]) -> None:
+        nonlocal total
+        if not batch:
+            return
+        while len(in_flight) >= max(max_in_flight, 1):
+            await _confirm_oldest()
+        body = "\n".join(json.dumps(doc, default=str) for doc in batch)
+        response = await client.post(
+            f"/indexes/{uid}/documents",
+            content=body.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        in_flight.append(_task_uid(response))
+        in_flight_gauge.inc()
+        total += len(batch)
+        INGESTED_DOCUMENTS.labels(index=metric_index).inc(len(batch))
+
+    try:
+        if isinstance(batches, AsyncIterable):
+            async for batch in batches:
+                await _upload(batch)
+        else:
+            for batch in batches:
+                await _upload(batch)
+        while in_flight:
+            await _confirm_oldest()
+    finally:
+        in_flight_gauge.dec(len(in_flight))
+        if total:
+            await invalidate_search_cache(uid)
+    return total
+
+
+async def delete_documents(client: AsyncClient, uid: str, ids: Sequence) -> None:
+    """Delete documents by primary key and wait for the task."""
+    if not ids:
+        return
+    response = await client.post(f"/indexes/{uid}/documents/delete-batch", json=list(ids))
+    try:
+        await wait_for_task(client, _task_uid(response))
+    finally:
+        await invalidate_search_cache(uid)
+
+
+async def rebuild_index(
+    client: AsyncClient,
+    uid: str,
+    batches: Iterable[Sequence[dict]] | AsyncIterable[Sequence[dict]],
+    *,
+    primary_key: str = "id",
+    settings: dict | None = None,
+    max_in_flight: int = 4,
+) -> int:
+    """
+    Rebuild ``uid`` without an empty window: fill ``{uid}__shadow_{token}``, then swap it in.
+
+    Each run gets its own shadow, so concurrent rebuilds never delete or write
+    into each other's. Settings are applied before documents so they are indexed
+    once. Batches go through :func:`upload_batches`. Every task is awaited; if any
+    step fails the live index is left untouched, the shadow is dropped and the
+    error is raised. Returns the number of documents uploaded.
+    """
+    shadow = f"{_shadow_prefix(uid)}{secrets.token_hex(4)}"
+    await _create_index(client, shadow, primary_key)
+    try:
+        if settings:
+            response = await client.patch(f"/indexes/{shadow}/settings", json=settings)
+            await wait_for_task(client, _task_uid(response))
+
+        total = await upload_batches(
+            client, shadow, batches, metric_index=uid, max_in_flight=max_in_flight
+        )
+
+        if not await index_exists(client, uid):
+            # /swap-indexes needs both sides to exist.
+            await _create_index(client, uid, primary_key)
+        response = await client.post("/swap-indexes", json=[{"indexes": [uid, shadow]}])
+        await wait_for_task(client, _task_uid(response))
+    except BaseException:
+        with contextlib.suppress(Exception):
+            await _delete_index(client, shadow)
+        raise
+    await invalidate_search_cache(uid)
+
+    # The shadow now holds the previous generation.
+    await _delete_index(client, shadow)
+    return total
+
+
+def _to_document(row) -> dict:
+    return {key: val.value if isinstance(val, Enum) else val for key, val in row.items()}
+
+
+async def stream_table(
+    db_manager: AsyncDatabaseManager,
+    model: Type[DeclarativeBase],
+    columns: list[str],
+    primary_key: str,
+    batch_size: int,
+    updated_since: datetime | None = None,
+) -> AsyncIterator[list[dict]]:
+    """Yield documents in ``batch_size`` chunks from a server-side cursor.
+
+    With ``updated_since`` only rows whose ``updated_at`` is at or after it are read.
+    """
+    async for session in db_manager.get_async_session():
+        pk_column = getattr(model, primary_key)
+        columns_to_select = [pk_column] + [getattr(model, col) for col in columns]
+        stmt = select(*columns_to_select)
+        if updated_since is not None:
+            stmt = stmt.where(model.updated_at >= updated_since)
+        stmt = stmt.order_by(pk_column).execution_options(yield_per=batch_size)
+        result = await session.stream(stmt)
+        async for partition in result.mappings().partitions(batch_size):
+            yield [_to_document(row) for row in partition]
+
+
 async def sync_with_db(
     meilisearch_client: AsyncClient,
     storage_name: str,
@@ -100,32 +382,24 @@ async def sync_with_db(
     model: Type[DeclarativeBase],
     columns_for_searching: list[str],
     primary_key: str = "id",
-):
-    async for session in db_manager.get_async_session():
-        pk_column = getattr(model, primary_key)
-        columns_to_select = [pk_column] + [getattr(model, col) for col in columns_for_searching]
-        result = await session.execute(select(*columns_to_select))
-        raw = result.mappings().all()  # list of RowMapping
-
-        # === NEW: convert enums to plain values ===
-        data = []
-        for row in raw:
-            doc = {}
-            for key, val in row.items():
-                if isinstance(val, Enum):
-                    doc[key] = val.value
-                else:
-                    doc[key] = val
-            data.append(doc)
-
-        try:
-            await meilisearch_client.delete(f"/indexes/{storage_name}")
-            await meilisearch_client.post(
-                "/indexes", json={"uid": storage_name, "primaryKey": primary_key}
-            )
-            await meilisearch_client.post(
-                f"/indexes/{storage_name}/documents",
-                json=data,
-            )
-        except Exception as e:
-            print(f"Meilisearch error: {e}")  # now you’ll at least see any JSON‐encoding problems
+    settings: dict | None = None,
+    batch_size: int = SYNC_BATCH_SIZE,
+) -> int:
+    """
+    Rebuild ``storage_name`` from the table behind ``model`` via a shadow-index swap.
+
+    Rows are streamed in ``batch_size`` chunks, so memory stays flat regardless of
+    table size.
+    """
+    batches = stream_table(db_manager, model, columns_for_searching, primary_key, batch_size)
+    # aclosing: release the cursor and session right away if the rebuild fails.
+    async with contextlib.aclosing(batches):
+        total = await rebuild_index(
+            meilisearch_client,
+            storage_name,
+            batches,
+            primary_key=primary_key,
+            settings=settings,
+        )
+    logger.info("Synced %s documents into Meilisearch index %s", total, storage_name)
+    return total
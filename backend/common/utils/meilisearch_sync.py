@@ -0,0 +1,360 @@
+"""Incremental Meilisearch sync driven by a per-index checkpoint.
+
+Rebuilding every index on every boot re-reads whole tables once per replica.
+``sync_index`` keeps a checkpoint in Redis (``meilisearch:checkpoint:{uid}``):
+the newest ``updated_at`` and tombstone ``deleted_at`` already pushed, plus a
+hash of the index settings. Later boots upsert only rows changed since the
+checkpoint into the live index and delete ids recorded in ``search_tombstones``.
+
+A full shadow rebuild (``meilisearch.sync_with_db``) still runs when there is no
+checkpoint, the settings hash changed, the live index is missing, the checkpoint
+is older than the tombstone retention, or it is requested explicitly.
+
+Watermarks are re-read with a ``lookback`` margin so rows stamped just before a
+checkpoint but committed after it are pushed again instead of missed; upserts
+and deletes are idempotent. A Redis lock (``meilisearch:sync_lock:{uid}``) keeps
+replicas that boot together from syncing the same index twice; its holder also
+drops shadow indexes of ``uid`` left behind by crashed rebuilds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import secrets
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Literal, Type
+
+from httpx import AsyncClient
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import DeclarativeBase
+
+from backend.common.datetime_utils import utc_now
+from backend.common.utils import meilisearch
+from backend.core.database.manager import AsyncDatabaseManager
+from backend.modules.search.models import SearchTombstone
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY_PREFIX = "meilisearch:checkpoint:"
+SYNC_LOCK_KEY_PREFIX = "meilisearch:sync_lock:"
+DEFAULT_LOOKBACK = timedelta(minutes=5)
+TOMBSTONE_RETENTION = timedelta(days=30)
+
+SEARCH_SYNC_RUNS = Counter(
+    "meilisearch_sync_runs_total",
+    "Startup index syncs by mode",
+    ["index", "mode"],  # full | incremental | skipped
+)
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+SyncMode = Literal["full", "incremental", "skipped"]
+
+
+async def acquire_sync_lock(redis: Redis, uid: str, *, lock_ttl: int = 900) -> str | None:
+    """Take ``meilisearch:sync_lock:{uid}``; returns the release token, or ``None`` if held."""
+    token = secrets.token_hex(8)
+    if await redis.set(f"{SYNC_LOCK_KEY_PREFIX}{uid}", token, nx=True, ex=lock_ttl):
+        return token
+    return None
+
+
+async def release_sync_lock(redis: Redis, uid: str, token: str) -> None:
+    try:
+        await redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"{SYNC_LOCK_KEY_PREFIX}{uid}", token)
+    except Exception as exc:
+        logger.warning("Failed to release Meilisearch sync lock for %s: %s", uid, exc)
+
+
+async def wait_for_sync_lock(
+    redis: Redis, uid: str, *, timeout: float = 900, poll_interval: float = 1.0
+) -> None:
+    """Wait (up to ``timeout``) until whoever holds ``uid``'s sync lock is done."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline and await redis.exists(f"{SYNC_LOCK_KEY_PREFIX}{uid}"):
+        await asyncio.sleep(poll_interval)
+
+
+@dataclass(frozen=True)
+class IndexCheckpoint:
+    """What a previous sync already pushed into an index."""
+
+    settings_hash: str
+    updated_at: datetime | None
+    deleted_at: datetime | None
+    synced_at: datetime
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "settings_hash": self.settings_hash,
+                "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+                "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
+                "synced_at": self.synced_at.isoformat(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "IndexCheckpoint":
+        data = json.loads(raw)
+
+        def _dt(value: str | None) -> datetime | None:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            settings_hash=data["settings_hash"],
+            updated_at=_dt(data.get("updated_at")),
+            deleted_at=_dt(data.get("deleted_at")),
+            synced_at=datetime.fromisoformat(data["synced_at"]),
+        )
+
+
+def settings_hash(primary_key: str, columns: Sequence[str], settings: dict | None) -> str:
+    """Fingerprint of everything that shapes the documents and index settings."""
+    payload = json.dumps(
+        {"primaryKey": primary_key, "columns": list(columns), "settings": settings or {}},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def load_checkpoint(redis: Redis, uid: str) -> IndexCheckpoint | None:
+    raw = await redis.get(f"{CHECKPOINT_KEY_PREFIX}{uid}")
+    if not raw:
+        return None
+    try:
+        return IndexCheckpoint.from_json(raw)
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Ignoring unreadable Meilisearch checkpoint for %s", uid)
+        return None
+
+
+async def save_checkpoint(redis: Redis, uid: str, checkpoint: IndexCheckpoint) -> None:
+    await redis.set(f"{CHECKPOINT_KEY_PREFIX}{uid}", checkpoint.to_json())
+
+
+async def _watermarks(
+    db_manager: AsyncDatabaseManager, model: Type[DeclarativeBase], table_name: str
+) -> tuple[datetime | None, datetime | None]:
+    async for session in db_manager.get_async_session():
+        updated_at = await session.scalar(select(func.max(model.updated_at)))
+        deleted_at = await session.scalar(
+            select(func.max(SearchTombstone.deleted_at)).where(
+                SearchTombstone.table_name == table_name
+            )
+        )
+        return updated_at, deleted_at
+    return None, None
+
+
+async def _tombstoned_ids(
+    db_manager: AsyncDatabaseManager, table_name: str, since: datetime | None
+) -> list[int]:
+    async for session in db_manager.get_async_session():
+        stmt = select(SearchTombstone.document_id).where(SearchTombstone.table_name == table_name)
+        if since is not None:
+            stmt = stmt.where(SearchTombstone.deleted_at >= since)
+        return list((await session.scalars(stmt.distinct())).all())
+    return []
+
+
+async def prune_tombstones(
+    db_manager: AsyncDatabaseManager, retention: timedelta = TOMBSTONE_RETENTION
+) -> int:
+    """Drop tombstones older than ``retention``; older checkpoints force a full rebuild."""
+    async for session in db_manager.get_async_session():
+        result = await session.execute(
+            delete(SearchTombstone).where(SearchTombstone.deleted_at < utc_now() - retention)
+        )
+        return result.rowcount or 0
+    return 0
+
+
+def _full_rebuild_reason(
+    checkpoint: IndexCheckpoint | None,
+    digest: str,
+    model: Type[DeclarativeBase],
+    force_full: bool,
+) -> str | None:
+    if force_full:
+        return "requested"
+    if not hasattr(model, "updated_at"):
+        return "no_updated_at"
+    if checkpoint is None:
+        return "no_checkpoint"
+    if checkpoint.settings_hash != digest:
+        return "settings_changed"
+    if utc_now() - checkpoint.synced_at > TOMBSTONE_RETENTION:
+        return "checkpoint_expired"
+    return None
+
+
+async def _apply_tombstones(
+    client: AsyncClient,
+    db_manager: AsyncDatabaseManager,
+    uid: str,
+    since: datetime | None,
+    batch_size: int,
+) -> int:
+    ids = await _tombstoned_ids(db_manager, uid, since)
+    for start in range(0, len(ids), batch_size):
+        await meilisearch.delete_documents(client, uid, ids[start : start + batch_size])
+    return len(ids)
+
+
+async def _sync_locked(
+    client: AsyncClient,
+    redis: Redis,
+    db_manager: AsyncDatabaseManager,
+    model: Type[DeclarativeBase],
+    columns: list[str],
+    *,
+    primary_key: str,
+    settings: dict | None,
+    force_full: bool,
+    lookback: timedelta,
+    batch_size: int,
+) -> SyncMode:
+    uid = model.__tablename__
+    # Holding the lock, no other rebuild of uid is running: any shadow is a leftover.
+    dropped = await meilisearch.drop_shadow_indexes(client, uid)
+    if dropped:
+        logger.info("Dropped %s leftover shadow indexes of %s", dropped, uid)
+    digest = settings_hash(primary_key, columns, settings)
+    checkpoint = await load_checkpoint(redis, uid)
+    reason = _full_rebuild_reason(checkpoint, digest, model, force_full)
+    if reason is None and not await meilisearch.index_exists(client, uid):
+        reason = "index_missing"
+
+    # Read before streaming: anything written meanwhile is picked up next time.
+    updated_at, deleted_at = (None, None)
+    if hasattr(model, "updated_at"):
+        updated_at, deleted_at = await _watermarks(db_manager, model, uid)
+
+    if reason is not None:
+        logger.info("Full Meilisearch rebuild of %s (%s)", uid, reason)
+        await meilisearch.sync_with_db(
+            meilisearch_client=client,
+            storage_name=uid,
+            db_manager=db_manager,
+            model=model,
+            columns_for_searching=columns,
+            primary_key=primary_key,
+            settings=settings,
+            batch_size=batch_size,
+        )
+        # Deletes that raced the rebuild; older tombstones refer to rows it never saw.
+        tombstones_since = deleted_at - lookback if deleted_at else None
+        if tombstones_since is not None:
+            await _apply_tombstones(client, db_manager, uid, tombstones_since, batch_size)
+        mode: SyncMode = "full"
+    else:
+        updated_since = checkpoint.updated_at - lookback if checkpoint.updated_at else None
+        batches = meilisearch.stream_table(
+            db_manager, model, columns, primary_key, batch_size, updated_since=updated_since
+        )
+        async with contextlib.aclosing(batches):
+            upserted = await meilisearch.upload_batches(client, uid, batches)
+        # Tombstones after upserts, so a row deleted mid-sync does not linger.
+        tombstones_since = checkpoint.deleted_at - lookback if checkpoint.deleted_at else None
+        deleted = await _apply_tombstones(client, db_manager, uid, tombstones_since, batch_size)
+        logger.info(
+            "Incremental Meilisearch sync of %s: %s upserted, %s deleted", uid, upserted, deleted
+        )
+        mode = "incremental"
+        updated_at = updated_at or checkpoint.updated_at
+        deleted_at = deleted_at or checkpoint.deleted_at
+
+    await save_checkpoint(
+        redis,
+        uid,
+        IndexCheckpoint(
+            settings_hash=digest,
+            updated_at=updated_at,
+            deleted_at=deleted_at,
+            synced_at=utc_now(),
+        ),
+    )
+    return mode
+
+
+async def sync_index(
+    client: AsyncClient,
+    redis: Redis | None,
+    db_manager: AsyncDatabaseManager,
+    model: Type[DeclarativeBase],
+    columns: list[str],
+    *,
+    primary_key: str = "id",
+    settings: dict | None = None,
+    force_full: bool = False,
+    lookback: timedelta = DEFAULT_LOOKBACK,
+    lock_ttl: int = 900,
+    lock_poll_interval: float = 1.0,
+    batch_size: int = meilisearch.SYNC_BATCH_SIZE,
+) -> SyncMode:
+    """
+    Bring the index for ``model`` up to date, incrementally when the checkpoint allows.
+
+    Without Redis there is nowhere to keep a checkpoint, so the index is rebuilt.
+    If another replica holds the sync lock this waits for it and returns ``"skipped"``.
+    """
+    uid = model.__tablename__
+    lock_token: str | None = None
+    if redis is not None:
+        try:
+            lock_token = await acquire_sync_lock(redis, uid, lock_ttl=lock_ttl)
+        except Exception as exc:
+            logger.warning("Meilisearch sync lock unavailable, rebuilding %s: %s", uid, exc)
+            redis = None
+
+    if redis is None:
+        await meilisearch.sync_with_db(
+            meilisearch_client=client,
+            storage_name=uid,
+            db_manager=db_manager,
+            model=model,
+            columns_for_searching=columns,
+            primary_key=primary_key,
+            settings=settings,
+            batch_size=batch_size,
+        )
+        SEARCH_SYNC_RUNS.labels(index=uid, mode="full").inc()
+        return "full"
+
+    if lock_token is None:
+        await wait_for_sync_lock(redis, uid, timeout=lock_ttl, poll_interval=lock_poll_interval)
+        SEARCH_SYNC_RUNS.labels(index=uid, mode="skipped").inc()
+        return "skipped"
+
+    try:
+        mode = await _sync_locked(
+            client,
+            redis,
+            db_manager,
+            model,
+            columns,
+            primary_key=primary_key,
+            settings=settings,
+            force_full=force_full,
+            lookback=lookback,
+            batch_size=batch_size,
+        )
+    finally:
+        await release_sync_lock(redis, uid, lock_token)
+    SEARCH_SYNC_RUNS.labels(index=uid, mode=mode).inc()
+    return mode
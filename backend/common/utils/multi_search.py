@@ -0,0 +1,108 @@
+"""Coalesce concurrent Meilisearch searches into ``/multi-search`` calls.
+
+Fan-out lookups (course priorities, a student's weekly schedule) used to fire one
+``/search`` per course. ``MultiSearchBatcher`` holds each query for a short
+window (``window`` seconds) or until ``max_batch`` queries are queued, then
+sends them all in a single ``/multi-search`` request and hands every caller its
+own result. Identical queries in the same batch are sent once.
+
+Use it through ``meilisearch.get(..., batched=True)``, which also applies the
+search result cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import weakref
+
+from httpx import AsyncClient
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+MULTI_SEARCH_BATCH_SIZE = Histogram(
+    "meilisearch_multi_search_batch_size",
+    "Distinct queries sent per /multi-search request",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+
+
+class MultiSearchBatcher:
+    """Groups searches issued within ``window`` seconds on one client."""
+
+    def __init__(self, client: AsyncClient, *, window: float = 0.002, max_batch: int = 32) -> None:
+        self.client = client
+        self.window = window
+        self.max_batch = max(max_batch, 1)
+        self._pending: dict[str, tuple[dict, asyncio.Future]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def search(self, index: str, payload: dict) -> tuple[dict, bool]:
+        """Queue one search; returns the per-query result and whether it succeeded."""
+        query = {"indexUid": index, **payload}
+        key = json.dumps(query, sort_keys=True, default=str)
+        pending = self._pending.get(key)
+        if pending is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = (query, future)
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.window, self._flush
+                )
+        else:
+            future = pending[1]
+        # shield: one cancelled caller must not cancel a result others share.
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch = list(self._pending.values())
+        self._pending = {}
+        if not batch:
+            return
+        task = asyncio.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        MULTI_SEARCH_BATCH_SIZE.observe(len(batch))
+        try:
+            response = await self.client.post(
+                "/multi-search", json={"queries": [query for query, _ in batch]}
+            )
+            body = response.json()
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        results = body.get("results") if response.is_success else None
+        for position, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if results is not None and position < len(results):
+                future.set_result((results[position], True))
+            else:
+                # Whole request failed: every caller sees the error body, as /search would.
+                future.set_result((body, False))
+
+
+_batchers: "weakref.WeakKeyDictionary[AsyncClient, MultiSearchBatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def batcher_for(client: AsyncClient) -> MultiSearchBatcher:
+    """One batcher per client, so batches never mix credentials or base URLs."""
+    batcher = _batchers.get(client)
+    if batcher is None:
+        batcher = _batchers[client] = MultiSearchBatcher(client)
+    return batcher
@@ -0,0 +1,168 @@
+"""Redis cache for Meilisearch keyword searches.
+
+Popular queries ("CSCI 151" at registration time) are fired by hundreds of
+students within seconds. ``SearchResultCache`` keeps each search response for a
+short TTL under ``search:result:{index}:{generation}:{hash}``, where the hash
+covers the normalized query, filters and page window.
+
+Writes never wait for TTLs: ``invalidate`` bumps the per-index generation
+(``search:gen:{index}``), so every older entry becomes unreachable. Meilisearch
+applies writes asynchronously, so ``invalidate`` also opens a short settle window
+(``search:settle:{index}``) during which results are not cached; otherwise a
+search racing the indexing task could pin the pre-write result under the new
+generation.
+
+Identical misses are coalesced per process, and a short Redis lock lets one
+process per key run the search while others poll for its result. Any Redis
+failure falls back to querying Meilisearch directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+RESULT_KEY_PREFIX = "search:result:"
+GENERATION_KEY_PREFIX = "search:gen:"
+SETTLE_KEY_PREFIX = "search:settle:"
+LOCK_KEY_PREFIX = "search:lock:"
+
+SEARCH_CACHE_LOOKUPS = Counter(
+    "meilisearch_search_cache_total",
+    "Keyword searches by result cache outcome",
+    ["index", "outcome"],  # hit | miss | joined | settling | bypass
+)
+
+# Returns the response body and whether it may be cached (e.g. not an error).
+Search = Callable[[], Awaitable[tuple[dict, bool]]]
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Meilisearch matching ignores case and extra whitespace; so does the cache key."""
+    return " ".join(keyword.lower().split())
+
+
+def payload_digest(payload: dict) -> str:
+    normalized = dict(payload)
+    normalized["q"] = normalize_keyword(normalized.get("q") or "")
+    raw = json.dumps(normalized, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache:
+    """Generation-invalidated, stampede-protected cache of search responses."""
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        *,
+        ttl: int = 30,
+        settle_seconds: int = 5,
+        lock_ttl: float = 2.0,
+        wait_timeout: float = 0.5,
+        poll_interval: float = 0.02,
+    ) -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.settle_seconds = settle_seconds
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def get_or_search(self, index: str, payload: dict, search: Search) -> dict:
+        if self.redis is None:
+            SEARCH_CACHE_LOOKUPS.labels(index=index, outcome="bypass").inc()
+            return (await search())[0]
+        try:
+            generation, settling = await self.redis.mget(
+                f"{GENERATION_KEY_PREFIX}{index}", f"{SETTLE_KEY_PREFIX}{index}"
+            )
+        except Exception as exc:
+            logger.warning("Search cache unavailable, querying Meilisearch: %s", exc)
+            SEARCH_CACHE_LOOKUPS.labels(index=index, outcome="bypass").inc()
+            return (await search())[0]
+        if settling:
+            SEARCH_CACHE_LOOKUPS.labels(index=index, outcome="settling").inc()
+            return (await search())[0]
+
+        key = f"{RESULT_KEY_PREFIX}{index}:{generation or 0}:{payload_digest(payload)}"
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(index, key, search))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            SEARCH_CACHE_LOOKUPS.labels(index=index, outcome="joined").inc()
+        # shield: a cancelled request must not abort a search others are awaiting.
+        return await asyncio.shield(task)
+
+    async def invalidate(self, index: str) -> None:
+        """Make every cached result for ``index`` unreachable."""
+        if self.redis is None:
+            return
+        try:
+            await self.redis.incr(f"{GENERATION_KEY_PREFIX}{index}")
+            if self.settle_seconds > 0:
+                await self.redis.set(
+                    f"{SETTLE_KEY_PREFIX}{index}", "1", ex=self.settle_seconds
+                )
+        except Exception as exc:
+            logger.warning("Failed to invalidate search cache for %s: %s", index, exc)
+
+    async def _load(self, index: str, key: str, search: Search) -> dict:
+        lock_key = f"{LOCK_KEY_PREFIX}{key[len(RESULT_KEY_PREFIX):]}"
+        owns_lock = False
+        try:
+            cached = await self._read(key)
+            if cached is None:
+                owns_lock = bool(
+                    await self.redis.set(lock_key, "1", nx=True, px=int(self.lock_ttl * 1000))
+                )
+                if not owns_lock:
+                    cached = await self._wait_for(key, lock_key)
+        except Exception as exc:
+            logger.warning("Search cache read failed, querying Meilisearch: %s", exc)
+            SEARCH_CACHE_LOOKUPS.labels(index=index, outcome="bypass").inc()
+            return (await search())[0]
+        if cached is not None:
+            SEARCH_CACHE_LOOKUPS.labels(index=index, outcome="hit").inc()
+            return cached
+
+        SEARCH_CACHE_LOOKUPS.labels(index=index, outcome="miss").inc()
+        try:
+            body, cacheable = await search()
+            if cacheable:
+                try:
+                    await self.redis.set(key, json.dumps(body), ex=self.ttl)
+                except Exception as exc:
+                    logger.warning("Failed to store search result: %s", exc)
+            return body
+        finally:
+            if owns_lock:
+                try:
+                    await self.redis.delete(lock_key)
+                except Exception as exc:
+                    logger.warning("Failed to release search cache lock: %s", exc)
+
+    async def _read(self, key: str) -> dict | None:
+        raw = await self.redis.get(key)
+        return json.loads(raw) if raw else None
+
+    async def _wait_for(self, key: str, lock_key: str) -> dict | None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+        while loop.time() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            cached = await self._read(key)
+            if cached is not None or not await self.redis.exists(lock_key):
+                return cached
+        return None
@@ -0,0 +1,184 @@
+"""Unit tests for shadow-index rebuilds against a fake Meilisearch."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from enum import Enum as PyEnum
+
+import httpx
+import pytest
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import String
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from backend.common.utils import meilisearch
+
+
+class _Kind(PyEnum):
+    talk = "talk"
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Event(_Base):
+    __tablename__ = "events"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String)
+    kind: Mapped[_Kind] = mapped_column(SQLEnum(_Kind))
+
+
+class _FakeMeilisearch:
+    """In-memory Meilisearch: every task succeeds immediately unless told to fail."""
+
+    def __init__(self) -> None:
+        self.indexes: dict[str, list[dict]] = {}
+        self.tasks: dict[int, dict] = {}
+        self.fail_documents = False
+        self.document_posts = 0
+        self.live_snapshots: list[list[dict] | None] = []
+
+    def _task(self, status: str = "succeeded") -> httpx.Response:
+        uid = len(self.tasks)
+        self.tasks[uid] = {"uid": uid, "status": status, "error": None}
+        return httpx.Response(202, json={"taskUid": uid})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.live_snapshots.append(self.indexes.get("events"))
+        if path.startswith("/tasks/"):
+            return httpx.Response(200, json=self.tasks[int(path.rsplit("/", 1)[1])])
+        if path == "/indexes" and request.method == "POST":
+            self.indexes[json.loads(request.content)["uid"]] = []
+            return self._task()
+        if path == "/indexes":
+            results = [{"uid": uid} for uid in self.indexes]
+            return httpx.Response(200, json={"results": results, "total": len(results)})
+        if path == "/swap-indexes":
+            a, b = json.loads(request.content)[0]["indexes"]
+            self.indexes[a], self.indexes[b] = self.indexes[b], self.indexes[a]
+            return self._task()
+        uid = path.split("/")[2]
+        if path.endswith("/documents"):
+            if self.fail_documents:
+                return self._task("failed")
+            self.document_posts += 1
+            lines = request.content.decode().splitlines()
+            self.indexes[uid].extend(json.loads(line) for line in lines)
+            return self._task()
+        if path.endswith("/settings"):
+            return self._task()
+        if uid not in self.indexes:
+            return httpx.Response(404, json={"code": "index_not_found"})
+        if request.method == "DELETE":
+            del self.indexes[uid]
+            return self._task()
+        return httpx.Response(200, json={"uid": uid})
+
+
+def _client(fake: _FakeMeilisearch) -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url="http://meili", transport=httpx.MockTransport(fake))
+
+
+@pytest.mark.asyncio
+async def test_rebuild_swaps_without_emptying_live_index():
+    fake = _FakeMeilisearch()
+    fake.indexes["events"] = [{"id": 1}]
+
+    async with _client(fake) as client:
+        total = await meilisearch.rebuild_index(
+            client, "events", [[{"id": 2}], [{"id": 3}]], settings={"searchableAttributes": ["x"]}
+        )
+
+    assert total == 2
+    assert fake.indexes == {"events": [{"id": 2}, {"id": 3}]}
+    assert all(snapshot for snapshot in fake.live_snapshots)
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_keeps_previous_generation_live():
+    fake = _FakeMeilisearch()
+    fake.indexes["events"] = [{"id": 1}]
+    fake.fail_documents = True
+
+    async with _client(fake) as client:
+        with pytest.raises(meilisearch.MeilisearchTaskError):
+            await meilisearch.rebuild_index(client, "events", [[{"id": 2}]])
+
+    assert fake.indexes == {"events": [{"id": 1}]}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rebuilds_use_their_own_shadows():
+    fake = _FakeMeilisearch()
+    fake.indexes["events"] = [{"id": 1}]
+
+    async def _slow(doc_id: int):
+        await asyncio.sleep(0.01)
+        yield [{"id": doc_id}]
+
+    async with _client(fake) as client:
+        await asyncio.gather(
+            meilisearch.rebuild_index(client, "events", _slow(2)),
+            meilisearch.rebuild_index(client, "events", _slow(3)),
+        )
+
+    assert list(fake.indexes) == ["events"]
+    assert fake.indexes["events"] in ([{"id": 2}], [{"id": 3}])
+
+
+@pytest.mark.asyncio
+async def test_drop_shadow_indexes_only_touches_that_index():
+    fake = _FakeMeilisearch()
+    fake.indexes = {
+        "events": [],
+        "events__shadow_dead": [],
+        "events_archive__shadow_abcd": [],
+        "clubs__shadow_beef": [],
+    }
+
+    async with _client(fake) as client:
+        assert await meilisearch.drop_shadow_indexes(client, "events") == 1
+
+    assert set(fake.indexes) == {"events", "events_archive__shadow_abcd", "clubs__shadow_beef"}
+
+
+@pytest.mark.asyncio
+async def test_first_build_creates_live_index_before_swap():
+    fake = _FakeMeilisearch()
+
+    async with _client(fake) as client:
+        await meilisearch.rebuild_index(client, "events", [[{"id": 1}]])
+
+    assert fake.indexes == {"events": [{"id": 1}]}
+
+
+@pytest.mark.asyncio
+async def test_sync_with_db_streams_rows_in_batches():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine)
+    async with session_maker() as session:
+        session.add_all([_Event(id=i, name=f"e{i}", kind=_Kind.talk) for i in range(1, 6)])
+        await session.commit()
+
+    class _DbManager:
+        async def get_async_session(self):
+            async with session_maker() as session:
+                yield session
+
+    fake = _FakeMeilisearch()
+    async with _client(fake) as client:
+        total = await meilisearch.sync_with_db(
+            client, "events", _DbManager(), _Event, ["name", "kind"], batch_size=2
+        )
+    await engine.dispose()
+
+    assert total == 5
+    assert fake.indexes["events"][0] == {"id": 1, "name": "e1", "kind": "talk"}
+    assert fake.document_posts == 3
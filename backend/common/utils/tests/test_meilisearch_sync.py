@@ -0,0 +1,236 @@
+"""Unit tests for checkpointed incremental Meilisearch syncs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import DateTime, String, delete, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from backend.common.utils import meilisearch_sync
+from backend.modules.search.models import SearchTombstone
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Post(_Base):
+    __tablename__ = "posts"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def eval(self, _script, _numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+class _FakeMeilisearch:
+    """Documents keyed by id; records which ids each upload carried."""
+
+    def __init__(self) -> None:
+        self.indexes: dict[str, dict[int, dict]] = {}
+        self.uploads: list[list[int]] = []
+        self.swaps = 0
+        self.tasks = 0
+
+    def _task(self) -> httpx.Response:
+        self.tasks += 1
+        return httpx.Response(202, json={"taskUid": self.tasks})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/tasks/"):
+            return httpx.Response(200, json={"status": "succeeded"})
+        if path == "/indexes" and request.method == "POST":
+            self.indexes[json.loads(request.content)["uid"]] = {}
+            return self._task()
+        if path == "/indexes":
+            results = [{"uid": uid} for uid in self.indexes]
+            return httpx.Response(200, json={"results": results, "total": len(results)})
+        if path == "/swap-indexes":
+            a, b = json.loads(request.content)[0]["indexes"]
+            self.indexes[a], self.indexes[b] = self.indexes[b], self.indexes[a]
+            self.swaps += 1
+            return self._task()
+        uid = path.split("/")[2]
+        if path.endswith("/documents/delete-batch"):
+            for doc_id in json.loads(request.content):
+                self.indexes[uid].pop(doc_id, None)
+            return self._task()
+        if path.endswith("/documents"):
+            docs = [json.loads(line) for line in request.content.decode().splitlines()]
+            self.uploads.append([doc["id"] for doc in docs])
+            self.indexes[uid].update({doc["id"]: doc for doc in docs})
+            return self._task()
+        if path.endswith("/settings"):
+            return self._task()
+        if uid not in self.indexes:
+            return httpx.Response(404, json={"code": "index_not_found"})
+        if request.method == "DELETE":
+            del self.indexes[uid]
+            return self._task()
+        return httpx.Response(200, json={"uid": uid})
+
+
+@pytest_asyncio.fixture
+async def session_maker():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+        await conn.run_sync(SearchTombstone.__table__.create)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as session:
+        session.add_all(
+            [_Post(id=i, title=f"p{i}", updated_at=_T0 - timedelta(hours=i)) for i in (1, 2, 3)]
+        )
+        await session.commit()
+    yield maker
+    await engine.dispose()
+
+
+def _db_manager(maker):
+    class _DbManager:
+        async def get_async_session(self):
+            async with maker() as session:
+                yield session
+                await session.commit()
+
+    return _DbManager()
+
+
+async def _sync(fake, redis, maker, **kwargs):
+    async with httpx.AsyncClient(
+        base_url="http://meili", transport=httpx.MockTransport(fake)
+    ) as client:
+        return await meilisearch_sync.sync_index(
+            client,
+            redis,
+            _db_manager(maker),
+            _Post,
+            ["title"],
+            settings={"searchableAttributes": ["title"]},
+            lookback=timedelta(0),
+            **kwargs,
+        )
+
+
+@pytest.mark.asyncio
+async def test_second_boot_pushes_only_changes_and_tombstones(session_maker):
+    fake, redis = _FakeMeilisearch(), _Redis()
+    assert await _sync(fake, redis, session_maker) == "full"
+    assert set(fake.indexes["posts"]) == {1, 2, 3}
+
+    async with session_maker() as session:
+        await session.execute(
+            update(_Post).where(_Post.id == 2).values(title="edited", updated_at=_T0)
+        )
+        await session.execute(delete(_Post).where(_Post.id == 3))
+        session.add(SearchTombstone(id=1, table_name="posts", document_id=3, deleted_at=_T0))
+        await session.commit()
+    fake.uploads.clear()
+
+    assert await _sync(fake, redis, session_maker) == "incremental"
+    # Row 1 sits exactly on the watermark (``>=``), so it is re-sent with the edit.
+    assert fake.uploads == [[1, 2]]
+    assert fake.swaps == 1
+    assert fake.indexes["posts"] == {
+        1: {"id": 1, "title": "p1"},
+        2: {"id": 2, "title": "edited"},
+    }
+    checkpoint = await meilisearch_sync.load_checkpoint(redis, "posts")
+    assert checkpoint.updated_at.replace(tzinfo=timezone.utc) == _T0
+
+
+@pytest.mark.asyncio
+async def test_settings_change_or_request_forces_full_rebuild(session_maker):
+    fake, redis = _FakeMeilisearch(), _Redis()
+    await _sync(fake, redis, session_maker)
+
+    assert await _sync(fake, redis, session_maker, force_full=True) == "full"
+    async with httpx.AsyncClient(
+        base_url="http://meili", transport=httpx.MockTransport(fake)
+    ) as client:
+        mode = await meilisearch_sync.sync_index(
+            client, redis, _db_manager(session_maker), _Post, ["title"], settings={}
+        )
+    assert mode == "full"
+    assert fake.swaps == 3
+
+
+@pytest.mark.asyncio
+async def test_missing_live_index_is_rebuilt(session_maker):
+    fake, redis = _FakeMeilisearch(), _Redis()
+    await _sync(fake, redis, session_maker)
+    del fake.indexes["posts"]
+
+    assert await _sync(fake, redis, session_maker) == "full"
+    assert set(fake.indexes["posts"]) == {1, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_replica_waits_while_another_holds_the_lock(session_maker):
+    fake, redis = _FakeMeilisearch(), _Redis()
+    lock_key = f"{meilisearch_sync.SYNC_LOCK_KEY_PREFIX}posts"
+    redis.data[lock_key] = "other"
+
+    async def _release_later():
+        await asyncio.sleep(0.05)
+        del redis.data[lock_key]
+
+    release = asyncio.create_task(_release_later())
+    mode = await _sync(fake, redis, session_maker, lock_poll_interval=0.01)
+    await release
+
+    assert mode == "skipped"
+    assert fake.indexes == {}
+
+
+@pytest.mark.asyncio
+async def test_lock_holder_drops_leftover_shadows(session_maker):
+    fake, redis = _FakeMeilisearch(), _Redis()
+    fake.indexes["posts__shadow_dead"] = {}
+
+    assert await _sync(fake, redis, session_maker) == "full"
+    assert set(fake.indexes) == {"posts"}
+
+
+@pytest.mark.asyncio
+async def test_waiting_replica_leaves_shadows_alone(session_maker):
+    fake, redis = _FakeMeilisearch(), _Redis()
+    fake.indexes["posts__shadow_live"] = {}
+    redis.data[f"{meilisearch_sync.SYNC_LOCK_KEY_PREFIX}posts"] = "other"
+
+    mode = await _sync(fake, redis, session_maker, lock_ttl=0)
+
+    assert mode == "skipped"
+    assert "posts__shadow_live" in fake.indexes
@@ -0,0 +1,77 @@
+"""Unit tests for coalescing searches into /multi-search calls."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from backend.common.utils import meilisearch
+from backend.common.utils.multi_search import MultiSearchBatcher
+
+
+class _Meilisearch:
+    def __init__(self, status: int = 200) -> None:
+        self.requests: list[list[dict]] = []
+        self.status = status
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/multi-search"
+        queries = json.loads(request.content)["queries"]
+        self.requests.append(queries)
+        if self.status != 200:
+            return httpx.Response(self.status, json={"code": "internal"})
+        results = [{"indexUid": q["indexUid"], "hits": [{"q": q["q"]}]} for q in queries]
+        return httpx.Response(200, json={"results": results})
+
+
+def _client(fake: _Meilisearch) -> httpx.AsyncClient:
+    return httpx.AsyncClient(base_url="http://meili", transport=httpx.MockTransport(fake))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_request():
+    fake = _Meilisearch()
+    async with _client(fake) as client:
+        codes = ["CSCI 151", "MATH 161", "PHYS 161", "CSCI 151"]
+        results = await asyncio.gather(
+            *(
+                meilisearch.get(client, "course_schedules", code, page=1, size=3, batched=True)
+                for code in codes
+            )
+        )
+
+    assert len(fake.requests) == 1
+    assert len(fake.requests[0]) == 3
+    assert [r["hits"][0]["q"] for r in results] == codes
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting_for_the_window():
+    fake = _Meilisearch()
+    async with _client(fake) as client:
+        batcher = MultiSearchBatcher(client, window=60, max_batch=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.search("courses", {"q": "a"}),
+                batcher.search("courses", {"q": "b"}),
+            ),
+            timeout=1,
+        )
+
+    assert [body["hits"][0]["q"] for body, ok in results] == ["a", "b"]
+    assert all(ok for _, ok in results)
+
+
+@pytest.mark.asyncio
+async def test_failed_request_returns_error_body_to_every_caller():
+    fake = _Meilisearch(status=500)
+    async with _client(fake) as client:
+        batcher = MultiSearchBatcher(client)
+        results = await asyncio.gather(
+            batcher.search("courses", {"q": "a"}), batcher.search("courses", {"q": "b"})
+        )
+
+    assert results == [({"code": "internal"}, False)] * 2
@@ -0,0 +1,116 @@
+"""Unit tests for the Redis-backed Meilisearch search result cache."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from backend.common.utils import meilisearch
+from backend.common.utils.search_cache import SearchResultCache
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def delete(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+
+class _Meilisearch:
+    def __init__(self) -> None:
+        self.searches = 0
+        self.status = 200
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/search"):
+            self.searches += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(self.status, json={"hits": [{"id": self.searches}]})
+        return httpx.Response(202, json={"taskUid": 1})
+
+
+@pytest.fixture
+def cached_search():
+    redis = _Redis()
+    fake = _Meilisearch()
+    meilisearch.configure_result_cache(SearchResultCache(redis, settle_seconds=0))
+    client = httpx.AsyncClient(base_url="http://meili", transport=httpx.MockTransport(fake))
+    yield client, fake, redis
+    meilisearch.configure_result_cache(None)
+
+
+@pytest.mark.asyncio
+async def test_normalized_repeat_queries_hit_the_cache(cached_search):
+    client, fake, _redis = cached_search
+
+    first = await meilisearch.get(client, "courses", "CSCI 151", page=1)
+    second = await meilisearch.get(client, "courses", "  csci   151 ", page=1)
+    await meilisearch.get(client, "courses", "CSCI 151", page=2)
+
+    assert first == second
+    assert fake.searches == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_search(cached_search):
+    client, fake, _redis = cached_search
+
+    results = await asyncio.gather(
+        *(meilisearch.get(client, "events", "party", page=1) for _ in range(10))
+    )
+
+    assert fake.searches == 1
+    assert all(result == results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_writes_bump_the_generation(cached_search):
+    client, fake, _redis = cached_search
+
+    await meilisearch.get(client, "events", "party", page=1)
+    await meilisearch.upsert(client, "events", {"id": 7})
+    refreshed = await meilisearch.get(client, "events", "party", page=1)
+    await meilisearch.get(client, "communities", "party", page=1)
+    await meilisearch.delete(client, "communities", "3")
+    await meilisearch.get(client, "communities", "party", page=1)
+
+    assert refreshed == {"hits": [{"id": 2}]}
+    assert fake.searches == 4
+
+
+@pytest.mark.asyncio
+async def test_error_responses_and_settle_window_are_not_cached(cached_search):
+    client, fake, redis = cached_search
+    fake.status = 500
+
+    await meilisearch.get(client, "events", "party", page=1)
+    fake.status = 200
+    await meilisearch.get(client, "events", "party", page=1)
+    assert fake.searches == 2
+
+    redis.data["search:settle:events"] = "1"
+    await meilisearch.get(client, "events", "other", page=1)
+    await meilisearch.get(client, "events", "other", page=1)
+    assert fake.searches == 4
@@ -0,0 +1,77 @@
+"""Background loops that run one step every few seconds for the life of the app.
+
+App-scoped helpers such as the elections counter poller need to call a coroutine
+on a fixed cadence from a task started in ``bootstrap`` and cancelled on shutdown,
+without letting one failed step end the loop. ``PeriodicTask`` is that loop.
+
+Work that only one replica should do per period is gated with
+``claim_interval_lease``: a Redis key taken with ``SET NX PX`` that is never
+released. It expires shortly before the next step is due, so a crashed holder
+cannot block the others for longer than one period and a slow one cannot be
+overlapped by the next.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs ``step`` every ``interval`` seconds (±``jitter`` as a fraction) until closed.
+
+    A step that raises is logged as ``"<name> failed"`` and the loop carries on.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        step: Callable[[], Awaitable[object]],
+        *,
+        interval: float,
+        jitter: float = 0.0,
+    ) -> None:
+        self.name = name
+        self._step = step
+        self.interval = interval
+        self.jitter = jitter
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def aclose(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def next_delay(self) -> float:
+        if not self.jitter:
+            return self.interval
+        return self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._step()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("%s failed: %s", self.name, exc)
+            await asyncio.sleep(self.next_delay())
+
+
+async def claim_interval_lease(redis: Redis, key: str, seconds: float) -> bool:
+    """Take ``key`` for ``seconds`` unless another replica holds it; never released."""
+    return bool(await redis.set(key, "1", nx=True, px=max(int(seconds * 1000), 1)))
@@ -0,0 +1,57 @@
+"""Unit tests for the shared periodic background loop and interval lease."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from backend.core.background.periodic import PeriodicTask, claim_interval_lease
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.data: dict[str, tuple[str, int]] = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = (value, px)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_failed_step_does_not_end_the_loop():
+    calls = 0
+
+    async def step():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("upstream down")
+
+    loop = PeriodicTask("test step", step, interval=0.01)
+    loop.start()
+    loop.start()  # already running: no second loop
+    await asyncio.sleep(0.05)
+    await loop.aclose()
+
+    assert calls >= 3
+    settled = calls
+    await asyncio.sleep(0.03)
+    assert calls == settled
+
+
+def test_jitter_stays_within_bounds():
+    loop = PeriodicTask("test step", lambda: None, interval=10.0, jitter=0.2)
+
+    assert all(8.0 <= loop.next_delay() <= 12.0 for _ in range(100))
+    assert PeriodicTask("test step", lambda: None, interval=10.0).next_delay() == 10.0
+
+
+@pytest.mark.asyncio
+async def test_interval_lease_is_taken_once_per_window():
+    redis = _Redis()
+
+    assert await claim_interval_lease(redis, "job:lease", 2.5) is True
+    assert await claim_interval_lease(redis, "job:lease", 2.5) is False
+    assert redis.data["job:lease"] == ("1", 2500)
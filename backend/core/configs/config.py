@@ -30,12 +30,17 @@ class Config(BaseSettings):
     SCHEDULE_SYNC_GCS_OBJECT: str = "registrar/course_schedule_catalog.json"
     MEILISEARCH_MASTER_KEY: str
     MEILISEARCH_URL: str
+    # Startup sync is incremental (see common/utils/meilisearch_sync.py); True forces
+    # a full shadow rebuild of every table-backed index on the next boot.
+    MEILISEARCH_FULL_REINDEX: bool = False
     CELERY_BROKER_URL: str
     IS_DEBUG: bool
     TELEGRAM_BOT_TOKEN: str
     TG_WEBHOOK_SECRET_TOKEN: str
     # Fallback Telegram chat (Grafana alerts + SG Otinish when ministry chat_id is null).
     TELEGRAM_CHAT_ID: int | None = None
+    # Notifications handled concurrently per consumer process (RabbitMQ prefetch).
+    NOTIFICATIONS_PREFETCH: int = 32
     NUSPACE: str
     DEV_APP_URL: str = "http://localhost"
     GCP_PROJECT_ID: str
@@ -74,6 +79,12 @@ class Config(BaseSettings):
     _COOKIE_REFRESH_NAME: str = "refresh_token"
     _COOKIE_APP_NAME: str = "app_token"
     APP_TOKEN_EXPIRY_MINUTES: int = 5
+    # Process pool for CPU-bound handlers (PDF parsing, degree audit, xlsx export).
+    # CPU_EXECUTOR_INLINE runs jobs in the request thread (tests / local tooling).
+    CPU_EXECUTOR_WORKERS: int = 2
+    CPU_EXECUTOR_MAX_PENDING: int = 32
+    CPU_EXECUTOR_MAX_TASKS_PER_CHILD: int = 200
+    CPU_EXECUTOR_INLINE: bool = False
     # OpenTelemetry (OTLP → Alloy → Tempo). Empty endpoint disables trace export.
     OTEL_SERVICE_NAME: str = "fastapi"
     OTEL_EXPORTER_OTLP_ENDPOINT: str = "http://alloy:4317"
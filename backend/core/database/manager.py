@@ -1,19 +1,82 @@
+import time
 from typing import AsyncGenerator
 
 from backend.core.configs.config import config
 from backend.core.database.model_registry import import_models
 from backend.core.database.models.base import Base
 from backend.telemetry import instrument_async_engine
+from prometheus_client import Counter, Histogram
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 import_models()
 
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled DB connection (includes opening new ones)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_SESSION_ENDINGS = Counter(
+    "db_session_endings_total",
+    "Request-scoped sessions by how they ended",
+    ["outcome"],  # committed | read_only | rolled_back
+)
+
+_WRITES_KEY = "has_writes"
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that reports how long checkouts wait for a free connection."""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started_at)
+
+
+class TrackedSession(Session):
+    """Session that remembers whether the current transaction wrote anything."""
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _mark_write_statement(orm_execute_state: ORMExecuteState) -> None:
+    # Anything that is not a plain SELECT (ORM DML, text(), ...) counts as a write.
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_WRITES_KEY] = True
+
+
+@event.listens_for(TrackedSession, "after_flush")
+def _mark_flush(session: Session, _flush_context) -> None:
+    session.info[_WRITES_KEY] = True
+
+
+@event.listens_for(TrackedSession, "after_commit")
+@event.listens_for(TrackedSession, "after_rollback")
+def _clear_writes(session: Session) -> None:
+    session.info.pop(_WRITES_KEY, None)
+
+
+def session_has_writes(session: AsyncSession) -> bool:
+    """True if the transaction flushed/executed writes or still holds pending ORM changes."""
+    sync_session = session.sync_session
+    return bool(
+        sync_session.info.get(_WRITES_KEY)
+        or sync_session.new
+        or sync_session.dirty
+        or sync_session.deleted
+    )
+
 
 class AsyncDatabaseManager:
     def __init__(self):
         self.async_engine = create_async_engine(
             config.DATABASE_URL,
             query_cache_size=1200,
+            poolclass=TimedAsyncAdaptedQueuePool,
             pool_size=20,
             max_overflow=20,
             future=True,
@@ -23,16 +86,25 @@ class AsyncDatabaseManager:
         self.async_session_maker = async_sessionmaker(
             bind=self.async_engine,
             expire_on_commit=False,
+            sync_session_class=TrackedSession,
         )
 
-    # this function returns async session used in fastapi dependency injections
+    # this function returns async session used in fastapi dependency injections.
+    # AsyncSession checks a connection out of the pool only on its first statement,
+    # so routes that never query (e.g. guest auth paths) do not hold a pool slot.
     async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.async_session_maker() as session:
             try:
                 yield session
-                await session.commit()
+                if session_has_writes(session):
+                    await session.commit()
+                    DB_SESSION_ENDINGS.labels(outcome="committed").inc()
+                else:
+                    # Read-only: no COMMIT; close() below ends the transaction.
+                    DB_SESSION_ENDINGS.labels(outcome="read_only").inc()
             except Exception:
                 await session.rollback()
+                DB_SESSION_ENDINGS.labels(outcome="rolled_back").inc()
                 raise
             finally:
                 await session.close()
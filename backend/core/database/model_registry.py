@@ -11,6 +11,7 @@ def import_models() -> None:
     from backend.modules.auth import models as _auth_models  # noqa: F401
     from backend.modules.media import models as _media_models  # noqa: F401
     from backend.modules.notification import models as _notification_models  # noqa: F401
+    from backend.modules.search import models as _search_models  # noqa: F401
 
     # Domain
     from backend.modules.campuscurrent import models as _campuscurrent_models  # noqa: F401
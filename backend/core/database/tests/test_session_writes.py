@@ -0,0 +1,57 @@
+"""Unit tests for read-only detection on request-scoped sessions."""
+
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Integer, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from backend.core.database.manager import TrackedSession, session_has_writes
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Row(_Base):
+    __tablename__ = "rows"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+    async with AsyncSession(bind=engine, sync_session_class=TrackedSession) as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_select_only_session_is_read_only(session):
+    await session.execute(select(_Row))
+
+    assert not session_has_writes(session)
+
+
+@pytest.mark.asyncio
+async def test_pending_and_flushed_changes_are_writes(session):
+    session.add(_Row(id=1))
+    assert session_has_writes(session)
+
+    await session.flush()
+    assert session_has_writes(session)
+
+    await session.commit()
+    assert not session_has_writes(session)
+
+
+@pytest.mark.asyncio
+async def test_textual_statements_count_as_writes(session):
+    await session.execute(text("INSERT INTO rows (id) VALUES (2)"))
+
+    assert session_has_writes(session)
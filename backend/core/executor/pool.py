@@ -0,0 +1,219 @@
+"""Bounded process pool for CPU-bound work that must not run on the event loop.
+
+The API runs as a single uvicorn process, so PDF parsing, degree audits and
+spreadsheet builds executed inline stall every other request. ``CpuExecutor``
+runs ``CpuJob`` callables in a small pool of spawned worker processes and awaits
+their results without blocking the loop.
+
+Job callables and their arguments cross a process boundary: they must be
+module-level functions taking and returning picklable values (no ORM instances,
+sessions or clients).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Generic, ParamSpec, TypeVar
+
+from prometheus_client import Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+CPU_QUEUE_DEPTH = Gauge(
+    "cpu_executor_queue_depth",
+    "CPU jobs waiting for a free worker process",
+)
+CPU_JOBS_IN_FLIGHT = Gauge(
+    "cpu_executor_jobs_in_flight",
+    "CPU jobs currently running in worker processes",
+)
+CPU_JOB_WAIT = Histogram(
+    "cpu_executor_job_wait_seconds",
+    "Time a CPU job spent queued before a worker picked it up",
+    ["job"],
+)
+CPU_JOB_DURATION = Histogram(
+    "cpu_executor_job_duration_seconds",
+    "CPU job run time in seconds",
+    ["job", "status"],
+)
+
+
+class CpuExecutorBusyError(RuntimeError):
+    """The pending queue is full; the caller should shed load."""
+
+
+class CpuJobTimeoutError(TimeoutError):
+    """A job did not finish within its timeout."""
+
+
+@dataclass(frozen=True)
+class CpuJob(Generic[P, R]):
+    """A picklable module-level callable plus its submission policy."""
+
+    name: str
+    fn: Callable[P, R]
+    timeout: float | None = 30.0
+
+
+class CpuExecutor:
+    """
+    Shared process pool with a bounded wait queue.
+
+    At most ``max_workers`` jobs are handed to the pool at once; up to
+    ``max_pending`` more wait for a slot, beyond that ``run`` raises
+    ``CpuExecutorBusyError``. With ``inline=True`` jobs run directly in the
+    calling thread (tests, local tooling). Services built without the shared
+    pool fall back to ``CpuExecutor.unwired``, which also runs inline but logs a
+    warning for every job so missing wiring does not go unnoticed.
+
+    A timed-out or cancelled job that already started keeps its worker until it
+    finishes (processes cannot be interrupted mid-call); its slot is released
+    only then, so the pool is never oversubscribed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        inline: bool = False,
+        max_tasks_per_child: int | None = None,
+    ) -> None:
+        self.max_workers = max(max_workers, 1)
+        self.max_pending = max(max_pending, 0)
+        self.inline = inline
+        self.max_tasks_per_child = max_tasks_per_child
+        self._pool: ProcessPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._pending = 0
+        self._unwired_owner: str | None = None
+
+    @classmethod
+    def unwired(cls, owner: str) -> CpuExecutor:
+        """Inline fallback for ``owner`` built without the shared pool; warns on every job."""
+        executor = cls(inline=True)
+        executor._unwired_owner = owner
+        return executor
+
+    def start(self) -> None:
+        if self.inline or self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            # fork would copy the event loop, OTel exporter threads and open sockets.
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=self.max_tasks_per_child,
+        )
+
+    def shutdown(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _discard_broken(self, pool: ProcessPoolExecutor) -> None:
+        # Every job in flight on a broken pool fails; the first to get here drops it and
+        # the next ``run`` starts a fresh one, which the later failures must not shut down.
+        if self._pool is pool:
+            self.shutdown()
+
+    async def run(self, job: CpuJob[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run ``job`` with the given arguments and return its result."""
+        if self.inline:
+            if self._unwired_owner is not None:
+                logger.warning(
+                    "%s has no shared CPU executor; running %s on the event loop",
+                    self._unwired_owner,
+                    job.name,
+                )
+            return self._run_inline(job, *args, **kwargs)
+
+        if self._pending >= self.max_pending and self._slots.locked():
+            raise CpuExecutorBusyError(f"cpu executor queue full ({self.max_pending} pending)")
+
+        queued_at = time.perf_counter()
+        self._pending += 1
+        CPU_QUEUE_DEPTH.inc()
+        try:
+            await self._slots.acquire()
+        finally:
+            self._pending -= 1
+            CPU_QUEUE_DEPTH.dec()
+        CPU_JOB_WAIT.labels(job=job.name).observe(time.perf_counter() - queued_at)
+
+        try:
+            self.start()
+            pool = self._pool
+            future = pool.submit(job.fn, *args, **kwargs)
+        except BrokenProcessPool:
+            # The pool broke while idle (e.g. a worker was OOM-killed).
+            self._slots.release()
+            self._discard_broken(pool)
+            raise
+        except BaseException:
+            self._slots.release()
+            raise
+
+        loop = asyncio.get_running_loop()
+        CPU_JOBS_IN_FLIGHT.inc()
+        future.add_done_callback(lambda _: self._release_slot_threadsafe(loop))
+
+        started_at = time.perf_counter()
+        status = "ok"
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=job.timeout)
+        except asyncio.TimeoutError as exc:
+            status = "timeout"
+            future.cancel()
+            raise CpuJobTimeoutError(f"{job.name} exceeded {job.timeout}s") from exc
+        except asyncio.CancelledError:
+            status = "cancelled"
+            future.cancel()
+            raise
+        except BrokenProcessPool:
+            status = "error"
+            logger.exception("CPU worker pool broke while running %s; recreating", job.name)
+            self._discard_broken(pool)
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            CPU_JOB_DURATION.labels(job=job.name, status=status).observe(
+                time.perf_counter() - started_at
+            )
+
+    def _release_slot_threadsafe(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            loop.call_soon_threadsafe(self._release_slot)
+        except RuntimeError:
+            # Loop already closed during shutdown; nothing left to wake up.
+            pass
+
+    def _release_slot(self) -> None:
+        CPU_JOBS_IN_FLIGHT.dec()
+        self._slots.release()
+
+    @staticmethod
+    def _run_inline(job: CpuJob[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        started_at = time.perf_counter()
+        status = "ok"
+        try:
+            return job.fn(*args, **kwargs)
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            CPU_JOB_DURATION.labels(job=job.name, status=status).observe(
+                time.perf_counter() - started_at
+            )
+
@@ -0,0 +1,138 @@
+"""Unit tests for the shared CPU process pool."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from backend.core.executor import pool as pool_module
+from backend.core.executor.pool import (
+    CpuExecutor,
+    CpuExecutorBusyError,
+    CpuJob,
+    CpuJobTimeoutError,
+)
+
+SUM_JOB = CpuJob("sum", sum, timeout=30.0)
+SLEEP_JOB = CpuJob("sleep", time.sleep, timeout=0.2)
+
+
+@pytest.mark.asyncio
+async def test_inline_mode_runs_in_caller():
+    executor = CpuExecutor(inline=True)
+
+    assert await executor.run(SUM_JOB, [1, 2, 3]) == 6
+    assert executor._pool is None
+
+
+@pytest.mark.asyncio
+async def test_unwired_fallback_warns_on_every_job(caplog):
+    executor = CpuExecutor.unwired("SomeService")
+
+    with caplog.at_level(logging.WARNING, logger="backend.core.executor.pool"):
+        assert await executor.run(SUM_JOB, [1, 2]) == 3
+        assert await executor.run(SUM_JOB, [3]) == 3
+
+    warnings = [r for r in caplog.records if "SomeService" in r.getMessage()]
+    assert len(warnings) == 2
+    assert "sum" in warnings[0].getMessage()
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_job_in_worker_process():
+    executor = CpuExecutor(max_workers=1)
+    try:
+        assert await executor.run(SUM_JOB, range(10)) == 45
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_raises_and_keeps_slot_until_worker_finishes():
+    executor = CpuExecutor(max_workers=1, max_pending=0)
+    try:
+        with pytest.raises(CpuJobTimeoutError):
+            await executor.run(SLEEP_JOB, 1.0)
+        # The worker is still sleeping, so no slot is free and nothing may queue.
+        with pytest.raises(CpuExecutorBusyError):
+            await executor.run(SUM_JOB, [1])
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_releases_waiting_position():
+    executor = CpuExecutor(max_workers=1, max_pending=1)
+    await executor._slots.acquire()  # occupy the only worker slot
+
+    waiter = asyncio.create_task(executor.run(SUM_JOB, [1]))
+    await asyncio.sleep(0)
+    assert executor._pending == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert executor._pending == 0
+
+
+class _FakePool:
+    def __init__(self) -> None:
+        self.futures: list[Future] = []
+        self.shut_down = False
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_running_or_notify_cancel()  # running jobs are not cancelled on shutdown
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        self.shut_down = True
+        if cancel_futures:
+            for future in self.futures:
+                future.cancel()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_late_broken_pool_failure_does_not_shut_down_the_new_pool(monkeypatch):
+    pools: list[_FakePool] = []
+
+    def new_pool(**kwargs) -> _FakePool:
+        pools.append(_FakePool())
+        return pools[-1]
+
+    monkeypatch.setattr(pool_module, "ProcessPoolExecutor", new_pool)
+    executor = CpuExecutor(max_workers=3)
+    first = asyncio.create_task(executor.run(SUM_JOB, [1]))
+    second = asyncio.create_task(executor.run(SUM_JOB, [2]))
+    await _settle()
+    broken = pools[0]
+
+    broken.futures[0].set_exception(BrokenProcessPool("worker died"))
+    await _settle()
+    with pytest.raises(BrokenProcessPool):
+        await first
+    third = asyncio.create_task(executor.run(SUM_JOB, [3]))
+    await _settle()
+    fresh = pools[1]
+
+    # The slower job on the old pool only now sees the breakage.
+    broken.futures[1].set_exception(BrokenProcessPool("worker died"))
+    with pytest.raises(BrokenProcessPool):
+        await second
+    assert broken.shut_down
+    assert not fresh.shut_down
+    assert executor._pool is fresh
+
+    fresh.futures[0].set_result(3)
+    assert await third == 3
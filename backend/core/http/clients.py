@@ -0,0 +1,139 @@
+"""App-scoped pooled HTTP clients for third-party upstreams.
+
+Opening an ``httpx.AsyncClient`` per call pays DNS + TCP + TLS on every request,
+which is most visible on the Keycloak calls in the auth path. ``HttpClientRegistry``
+keeps one long-lived client per upstream (created in ``backend/lifespan.py``)
+with its own connection pool, keep-alive, timeouts and connect retries, and
+records per-upstream latency and error metrics.
+
+HTTP/2 is negotiated for upstreams that enable it when the optional ``h2``
+package is installed; otherwise those clients fall back to HTTP/1.1.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import httpx
+from prometheus_client import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+UPSTREAM_REQUEST_DURATION = Histogram(
+    "upstream_http_request_duration_seconds",
+    "Outbound HTTP request latency per upstream",
+    ["upstream", "method", "status_class"],
+)
+UPSTREAM_REQUEST_ERRORS = Counter(
+    "upstream_http_request_errors_total",
+    "Outbound HTTP requests that failed before a response (timeouts, connect errors)",
+    ["upstream", "error"],
+)
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Connection policy for one upstream service."""
+
+    name: str
+    base_url: str = ""
+    timeout: httpx.Timeout = field(default_factory=lambda: httpx.Timeout(10.0, connect=5.0))
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    # Transport-level retries only cover connection failures, so they are safe
+    # for non-idempotent calls (token refresh, revoke).
+    connect_retries: int = 2
+    http2: bool = False
+    follow_redirects: bool = False
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Wraps the pooled transport to record per-upstream latency and errors."""
+
+    def __init__(self, upstream: str, transport: httpx.AsyncBaseTransport) -> None:
+        self.upstream = upstream
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TransportError as exc:
+            UPSTREAM_REQUEST_ERRORS.labels(upstream=self.upstream, error=type(exc).__name__).inc()
+            raise
+        UPSTREAM_REQUEST_DURATION.labels(
+            upstream=self.upstream,
+            method=request.method,
+            status_class=f"{response.status_code // 100}xx",
+        ).observe(time.perf_counter() - started_at)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def build_client(
+    upstream: UpstreamConfig,
+    *,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Create the pooled client for ``upstream``; ``transport`` overrides the network (tests)."""
+    http2 = upstream.http2 and HTTP2_AVAILABLE
+    limits = httpx.Limits(
+        max_connections=upstream.max_connections,
+        max_keepalive_connections=upstream.max_keepalive_connections,
+        keepalive_expiry=upstream.keepalive_expiry,
+    )
+    inner = transport or httpx.AsyncHTTPTransport(
+        limits=limits,
+        http2=http2,
+        retries=upstream.connect_retries,
+    )
+    return httpx.AsyncClient(
+        base_url=upstream.base_url,
+        timeout=upstream.timeout,
+        headers=upstream.headers,
+        follow_redirects=upstream.follow_redirects,
+        transport=_InstrumentedTransport(upstream.name, inner),
+    )
+
+
+class HttpClientRegistry:
+    """Lazily created, long-lived ``httpx.AsyncClient`` per named upstream."""
+
+    def __init__(
+        self,
+        upstreams: Iterable[UpstreamConfig],
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._upstreams = {upstream.name: upstream for upstream in upstreams}
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._transport = transport
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            try:
+                upstream = self._upstreams[name]
+            except KeyError:
+                raise KeyError(f"Unknown HTTP upstream: {name}") from None
+            client = build_client(upstream, transport=self._transport)
+            self._clients[name] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for name, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as exc:
+                logger.warning("Failed to close HTTP client %s: %s", name, exc)
@@ -0,0 +1,68 @@
+"""Unit tests for the pooled upstream HTTP client registry."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from backend.core.http.clients import (
+    UPSTREAM_REQUEST_DURATION,
+    UPSTREAM_REQUEST_ERRORS,
+    HttpClientRegistry,
+    UpstreamConfig,
+)
+
+
+def _sample(metric, name: str, labels: dict) -> float:
+    for family in metric.collect():
+        for sample in family.samples:
+            if sample.name == name and sample.labels == labels:
+                return sample.value
+    return 0.0
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_one_client_per_upstream():
+    registry = HttpClientRegistry(
+        [UpstreamConfig(name="a"), UpstreamConfig(name="b")],
+        transport=httpx.MockTransport(lambda request: httpx.Response(204)),
+    )
+
+    assert registry.get("a") is registry.get("a")
+    assert registry.get("a") is not registry.get("b")
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+    client = registry.get("a")
+    await registry.aclose()
+    assert client.is_closed
+    assert registry.get("a") is not client
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_requests_are_recorded_per_upstream():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    registry = HttpClientRegistry(
+        [UpstreamConfig(name="metrics_test", base_url="https://upstream.test")],
+        transport=httpx.MockTransport(handler),
+    )
+    client = registry.get("metrics_test")
+    ok_labels = {"upstream": "metrics_test", "method": "GET", "status_class": "2xx"}
+    error_labels = {"upstream": "metrics_test", "error": "ConnectError"}
+    duration_count = "upstream_http_request_duration_seconds_count"
+    errors_total = "upstream_http_request_errors_total"
+    ok_before = _sample(UPSTREAM_REQUEST_DURATION, duration_count, ok_labels)
+    errors_before = _sample(UPSTREAM_REQUEST_ERRORS, errors_total, error_labels)
+
+    assert (await client.get("/up")).json() == {"ok": True}
+    with pytest.raises(httpx.ConnectError):
+        await client.get("/down")
+
+    assert _sample(UPSTREAM_REQUEST_DURATION, duration_count, ok_labels) == ok_before + 1
+    assert _sample(UPSTREAM_REQUEST_ERRORS, errors_total, error_labels) == errors_before + 1
+    await registry.aclose()
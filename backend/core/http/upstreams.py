@@ -0,0 +1,37 @@
+"""Named upstreams served by the shared ``HttpClientRegistry``."""
+
+import httpx
+
+from backend.core.http.clients import UpstreamConfig
+
+KEYCLOAK = "keycloak"
+QUALTRICS = "qualtrics"
+TELEGRAM_WEB = "telegram_web"
+GOOGLE_APIS = "google_apis"
+
+DEFAULT_UPSTREAMS: tuple[UpstreamConfig, ...] = (
+    # Token refresh / userinfo / JWKS sit on the authenticated request path.
+    UpstreamConfig(
+        name=KEYCLOAK,
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        max_connections=50,
+        max_keepalive_connections=20,
+        http2=True,
+    ),
+    UpstreamConfig(name=QUALTRICS, timeout=httpx.Timeout(10.0, connect=5.0)),
+    UpstreamConfig(
+        name=TELEGRAM_WEB,
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        max_connections=5,
+        max_keepalive_connections=2,
+        follow_redirects=True,
+    ),
+    # Calendar sync pushes events concurrently with asyncio.gather.
+    UpstreamConfig(
+        name=GOOGLE_APIS,
+        timeout=httpx.Timeout(20.0),
+        max_connections=50,
+        max_keepalive_connections=20,
+        http2=True,
+    ),
+)
@@ -4,9 +4,19 @@ from fastapi import FastAPI
 from google.auth.credentials import Credentials
 
 # Register Rabbit subscribers before the broker starts.
-import backend.modules.notification.tasks  # noqa: F401
+import backend.modules.notification.tasks as notification_tasks
+from backend.bootstrap.announcements import (
+    cleanup_telegram_post_cache,
+    setup_telegram_post_cache,
+)
+from backend.bootstrap.auth import cleanup_auth_caches, setup_auth_caches
 from backend.bootstrap.db import cleanup_db, setup_db
+from backend.bootstrap.elections import cleanup_election_counter, setup_election_counter
+from backend.bootstrap.events import cleanup_event_listings, setup_event_listings
+from backend.bootstrap.executor import cleanup_executor, setup_executor
 from backend.bootstrap.gcp import setup_gcp
+from backend.bootstrap.gcs_deletions import cleanup_gcs_deletion_queue, setup_gcs_deletion_queue
+from backend.bootstrap.http import cleanup_http_clients, setup_http_clients
 from backend.bootstrap.meilisearch import cleanup_meilisearch, setup_meilisearch
 from backend.bootstrap.rbq import cleanup_rbq, setup_rbq
 from backend.bootstrap.redis import cleanup_redis, setup_redis
@@ -17,6 +27,9 @@ from backend.modules.bot.startup import cleanup_bot, setup_bot
 from backend.modules.campuscurrent.search_indexes import (
     MEILISEARCH_INDEXES as CAMPUSCURRENT_MEILI_INDEXES,
 )
+from backend.modules.courses.registrar.schedule_index import ScheduleCodeIndex
+from backend.modules.courses.registrar.schedule_sync import SCHEDULE_INDEX_UID
+from backend.modules.courses.registrar.semester_registry import ActiveSemesterRegistry
 from backend.modules.courses.registrar.startup import (
     cleanup_schedule_catalog,
     setup_schedule_catalog,
@@ -37,10 +50,22 @@ async def lifespan(app: FastAPI):
         app.state.config = Config()  # type: ignore
         app.state.app_token_manager = AppTokenManager()
         app.state.signing_credentials: Credentials | None = None
+        app.state.semester_registry = ActiveSemesterRegistry()
+        await setup_http_clients(app)
+        if not app.state.config.MOCK_KEYCLOAK:
+            await app.state.kc_manager.jwks_store.start()
         setup_gcp(app)
-        await setup_rbq(app)
+        await setup_gcs_deletion_queue(app)
         await setup_db(app)
+        await setup_executor(app)
         await setup_redis(app)
+        await setup_auth_caches(app)
+        app.state.schedule_code_index = ScheduleCodeIndex(app.state.redis)
+        await setup_event_listings(app)
+        await setup_election_counter(app)
+        await setup_telegram_post_cache(app)
+        notification_tasks.configure_rate_limiter(app.state.redis)
+        await setup_rbq(app)
         await setup_meilisearch(
             app,
             index_configs=[
@@ -50,6 +75,7 @@ async def lifespan(app: FastAPI):
             ],
             after_sync=[setup_schedule_catalog],
             on_cleanup=[cleanup_schedule_catalog],
+            required_indexes=[SCHEDULE_INDEX_UID],
         )
 
         await setup_bot(app)
@@ -60,7 +86,18 @@ async def lifespan(app: FastAPI):
 
     finally:
         await cleanup_rbq(app)
+        await notification_tasks.close_sender_bot()
         await cleanup_bot(app)
         await cleanup_meilisearch(app)
+        await cleanup_election_counter(app)
+        await cleanup_telegram_post_cache(app)
+        await cleanup_event_listings(app)
+        await cleanup_auth_caches(app)
+        notification_tasks.configure_rate_limiter(None)
         await cleanup_redis(app)
+        await cleanup_executor(app)
         await cleanup_db(app)
+        if kc_manager := getattr(app.state, "kc_manager", None):
+            await kc_manager.jwks_store.aclose()
+        await cleanup_http_clients(app)
+        await cleanup_gcs_deletion_queue(app)
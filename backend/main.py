@@ -2,6 +2,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
+from backend.bootstrap.executor import register_executor_error_handlers
+from backend.bootstrap.meilisearch import register_readiness_route
 from backend.core.configs.config import config
 from backend.lifespan import lifespan
 
@@ -25,6 +27,8 @@ app = FastAPI(
 )
 
 app.mount("/metrics", metrics_app)
+register_executor_error_handlers(app)
+register_readiness_route(app)
 
 app.add_middleware(
     CORSMiddleware,
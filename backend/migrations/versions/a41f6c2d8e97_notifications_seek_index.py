@@ -0,0 +1,39 @@
+"""composite index for notification cursor pagination
+
+Revision ID: a41f6c2d8e97
+Revises: d7f2c9a41e63
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "a41f6c2d8e97"
+down_revision: Union[str, Sequence[str], None] = "d7f2c9a41e63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so building it on a large notifications table does not block inserts.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_notifications_receiver_created_id",
+            "notifications",
+            ["receiver_sub", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_notifications_receiver_created_id",
+            table_name="notifications",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
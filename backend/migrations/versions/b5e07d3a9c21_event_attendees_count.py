@@ -0,0 +1,45 @@
+"""denormalized attendees_count on events
+
+Revision ID: b5e07d3a9c21
+Revises: a41f6c2d8e97
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b5e07d3a9c21"
+down_revision: Union[str, Sequence[str], None] = "a41f6c2d8e97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column("attendees_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    # Backfill without touching updated_at (search sync watermarks key off it).
+    op.execute(
+        """
+        UPDATE events AS e
+        SET attendees_count = counts.total
+        FROM (
+            SELECT event_id, count(*) AS total
+            FROM event_attendees
+            GROUP BY event_id
+        ) AS counts
+        WHERE counts.event_id = e.id
+        """
+    )
+    op.create_check_constraint(
+        "ck_events_attendees_count_nonnegative", "events", "attendees_count >= 0"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_events_attendees_count_nonnegative", "events", type_="check")
+    op.drop_column("events", "attendees_count")
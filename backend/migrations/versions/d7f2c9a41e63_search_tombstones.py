@@ -0,0 +1,70 @@
+"""search tombstones for incremental meilisearch sync
+
+Revision ID: d7f2c9a41e63
+Revises: c3e8a1b4f902
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "d7f2c9a41e63"
+down_revision: Union[str, Sequence[str], None] = "c3e8a1b4f902"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables mirrored into Meilisearch indexes of the same name.
+INDEXED_TABLES = ("events", "communities", "grade_reports", "courses", "opportunities")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_tombstones",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=False), nullable=False),
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("document_id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_search_tombstones_table_deleted_at",
+        "search_tombstones",
+        ["table_name", "deleted_at"],
+    )
+
+    # A trigger (not an ORM hook) so FK cascades and raw SQL deletes are recorded too.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION record_search_tombstone() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO search_tombstones (table_name, document_id)
+            VALUES (TG_TABLE_NAME, OLD.id);
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for table in INDEXED_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_search_tombstone
+            AFTER DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION record_search_tombstone();
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in INDEXED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_search_tombstone ON {table};")
+    op.execute("DROP FUNCTION IF EXISTS record_search_tombstone();")
+    op.drop_index("ix_search_tombstones_table_deleted_at", table_name="search_tombstones")
+    op.drop_table("search_tombstones")
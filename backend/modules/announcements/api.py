@@ -3,11 +3,17 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
 
-from backend.common.dependencies import get_infra
+from backend.common.dependencies import get_http_clients, get_infra
 from backend.common.schemas import Infra
+from backend.core.http.clients import HttpClientRegistry
+from backend.core.http.upstreams import TELEGRAM_WEB
 from backend.modules.announcements import schemas
-from backend.modules.announcements.dependencies import get_announcements_service
+from backend.modules.announcements.dependencies import (
+    get_announcements_service,
+    get_latest_post_cache,
+)
 from backend.modules.announcements.service import AnnouncementsService, get_latest_telegram_post_id
+from backend.modules.announcements.telegram_feed import LatestPostCache
 from backend.modules.auth.dependencies import get_creds_or_guest
 
 router = APIRouter(
@@ -18,11 +24,16 @@ router = APIRouter(
 @router.get("/telegram")
 async def get_announcements_from_telegram(
     _user: Annotated[tuple[dict, dict], Depends(get_creds_or_guest)],
+    http_clients: Annotated[HttpClientRegistry, Depends(get_http_clients)],
+    post_cache: Annotated[LatestPostCache | None, Depends(get_latest_post_cache)],
 ):
     """
     Get latest announcements from the public Telegram channel.
     """
-    latest_id = await get_latest_telegram_post_id()
+    if post_cache is not None:
+        latest_id = await post_cache.get()
+    else:
+        latest_id = await get_latest_telegram_post_id(http_clients.get(TELEGRAM_WEB))
     return {"latest_post_id": latest_id}
 
 
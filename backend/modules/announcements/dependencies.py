@@ -1,10 +1,32 @@
-from fastapi import Depends
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
+from fastapi import Depends, Request
+
+from backend.common.dependencies import get_infra
+from backend.common.schemas import Infra
+from backend.core.database.manager import AsyncDatabaseManager
 from backend.modules.announcements.service import AnnouncementsService
-from backend.modules.campuscurrent.events.dependencies import get_event_service
+from backend.modules.announcements.telegram_feed import LatestPostCache
+from backend.modules.campuscurrent.events.dependencies import build_event_service
+from backend.modules.campuscurrent.events.service import EventService
 
 
 def get_announcements_service(
-    event_catalog=Depends(get_event_service),
+    request: Request,
+    infra: Infra = Depends(get_infra),
 ) -> AnnouncementsService:
-    return AnnouncementsService(event_catalog=event_catalog)
+    db_manager: AsyncDatabaseManager = request.app.state.db_manager
+
+    # Read-only sections: closing the session ends the transaction, no commit needed.
+    @asynccontextmanager
+    async def event_catalog_scope() -> AsyncIterator[EventService]:
+        async with db_manager.async_session_maker() as session:
+            yield build_event_service(session, infra)
+
+    return AnnouncementsService(event_catalog_factory=event_catalog_scope)
+
+
+def get_latest_post_cache(request: Request) -> LatestPostCache | None:
+    """App-scoped cache of the Telegram channel's latest post id (created in ``lifespan``)."""
+    return getattr(request.app.state, "telegram_post_cache", None)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Protocol
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Protocol
 
 from backend.common.schemas import Infra
 from backend.modules.campuscurrent.events import schemas as event_schemas
@@ -13,3 +14,8 @@ class EventCatalog(Protocol):
         event_filter: event_schemas.EventFilter,
         infra: Infra,
     ) -> event_schemas.ListEventResponse: ...
+
+
+# Opens an EventCatalog bound to its own short-lived session, so bundle sections
+# can query concurrently.
+EventCatalogFactory = Callable[[], AbstractAsyncContextManager[EventCatalog]]
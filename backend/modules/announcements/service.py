@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import re
 from typing import Optional
@@ -5,7 +6,7 @@ from typing import Optional
 import httpx
 
 from backend.modules.announcements import schemas
-from backend.modules.announcements.interfaces import EventCatalog
+from backend.modules.announcements.interfaces import EventCatalogFactory
 from backend.modules.campuscurrent.events import schemas as event_schemas
 from backend.modules.campuscurrent.models.events import EventType
 
@@ -15,18 +16,17 @@ CHANNEL_URL = "https://t.me/s/nuspacechannel"
 POST_ID_PATTERN = re.compile(r'data-post="[^"]+/(\d+)"')
 
 
-async def get_latest_telegram_post_id() -> Optional[int]:
+async def get_latest_telegram_post_id(client: httpx.AsyncClient) -> Optional[int]:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(CHANNEL_URL, follow_redirects=True)
-            response.raise_for_status()
+        response = await client.get(CHANNEL_URL, follow_redirects=True)
+        response.raise_for_status()
 
-            matches = POST_ID_PATTERN.findall(response.text)
+        matches = POST_ID_PATTERN.findall(response.text)
 
-            if not matches:
-                return None
+        if not matches:
+            return None
 
-            return int(matches[-1])
+        return int(matches[-1])
 
     except Exception as e:
         logger.error(f"Failed to fetch telegram posts: {e}")
@@ -34,8 +34,8 @@ async def get_latest_telegram_post_id() -> Optional[int]:
 
 
 class AnnouncementsService:
-    def __init__(self, event_catalog: EventCatalog):
-        self.event_catalog = event_catalog
+    def __init__(self, event_catalog_factory: EventCatalogFactory):
+        self.event_catalog_factory = event_catalog_factory
 
     async def get_bundle(
         self,
@@ -50,8 +50,8 @@ class AnnouncementsService:
         """
         Aggregate data required by the announcements landing page into a single response.
 
-        NOTE: We intentionally run these sequentially because SQLAlchemy AsyncSession is
-        not safe to use concurrently across tasks.
+        Sections run concurrently, each on its own short-lived session (an AsyncSession
+        is not safe to share across tasks), so latency is that of the slowest section.
         """
         event_filter = event_schemas.EventFilter(
             page=events_page,
@@ -59,10 +59,6 @@ class AnnouncementsService:
             event_status=event_schemas.EventStatus.approved,
             time_filter=event_schemas.TimeFilter.UPCOMING,
         )
-        events = await self.event_catalog.get_events(
-            user=user, event_filter=event_filter, infra=infra
-        )
-
         recruitment_filter = event_schemas.EventFilter(
             page=recruitment_events_page,
             size=recruitment_events_size,
@@ -70,8 +66,17 @@ class AnnouncementsService:
             event_type=EventType.recruitment,
             time_filter=event_schemas.TimeFilter.UPCOMING,
         )
-        recruitment_events = await self.event_catalog.get_events(
-            user=user, event_filter=recruitment_filter, infra=infra
+
+        async def list_events(
+            section_filter: event_schemas.EventFilter,
+        ) -> event_schemas.ListEventResponse:
+            async with self.event_catalog_factory() as event_catalog:
+                return await event_catalog.get_events(
+                    user=user, event_filter=section_filter, infra=infra
+                )
+
+        events, recruitment_events = await asyncio.gather(
+            list_events(event_filter), list_events(recruitment_filter)
         )
 
         return schemas.AnnouncementsBundleResponse(
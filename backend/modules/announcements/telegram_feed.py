@@ -0,0 +1,70 @@
+"""Background-refreshed cache of the latest post in the public Telegram channel.
+
+Scraping ``t.me/s/nuspacechannel`` means downloading and regex-scanning the
+whole channel page, yet the latest post id changes only a few times a day.
+``LatestPostCache`` keeps the id in Redis and refreshes it from a background
+task every ``interval`` seconds (±``jitter``), so requests only read Redis:
+
+- replicas share the work: a refresh first takes ``announcements:telegram:refresh``
+  for most of an interval and is skipped if another replica already holds it;
+- a failed scrape leaves the previous id in place (stale beats missing);
+- only a cold cache makes a request wait on t.me, once per process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from backend.core.background.periodic import PeriodicTask, claim_interval_lease
+from redis.asyncio import Redis
+
+LATEST_POST_KEY = "announcements:telegram:latest_post_id"
+REFRESH_LOCK_KEY = "announcements:telegram:refresh"
+
+
+class LatestPostCache:
+    """Stale-while-revalidate holder for the channel's latest post id."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        fetch: Callable[[], Awaitable[int | None]],
+        *,
+        interval: float = 300.0,
+        jitter: float = 0.2,
+    ) -> None:
+        self.redis = redis
+        self._fetch = fetch
+        self.interval = interval
+        self.jitter = jitter
+        self._cold_lock = asyncio.Lock()
+        self._loop = PeriodicTask(
+            "Telegram latest-post refresh", self.refresh, interval=interval, jitter=jitter
+        )
+
+    def start(self) -> None:
+        self._loop.start()
+
+    async def aclose(self) -> None:
+        await self._loop.aclose()
+
+    async def get(self) -> int | None:
+        value = await self.redis.get(LATEST_POST_KEY)
+        if value is not None:
+            return int(value)
+        async with self._cold_lock:
+            value = await self.redis.get(LATEST_POST_KEY)
+            if value is not None:
+                return int(value)
+            return await self.refresh(force=True)
+
+    async def refresh(self, *, force: bool = False) -> int | None:
+        """Scrape and store the latest id; unless ``force``, skip if another replica just did."""
+        lease = self.interval * (1 - self.jitter)
+        if not await claim_interval_lease(self.redis, REFRESH_LOCK_KEY, lease) and not force:
+            return None
+        post_id = await self._fetch()
+        if post_id is not None:
+            await self.redis.set(LATEST_POST_KEY, str(post_id))
+        return post_id
@@ -0,0 +1,52 @@
+"""Unit tests for the concurrent announcements bundle."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from backend.modules.announcements.service import AnnouncementsService
+from backend.modules.campuscurrent.events import schemas as event_schemas
+
+
+class _Catalog:
+    def __init__(self, started: asyncio.Event, peers: int) -> None:
+        self.started = started
+        self.peers = peers
+        self.running = 0
+
+    async def get_events(self, user, event_filter, infra):
+        self.running += 1
+        if self.running == self.peers:
+            self.started.set()
+        # Only completes when every section is in flight at once.
+        await asyncio.wait_for(self.started.wait(), timeout=1)
+        return event_schemas.ListEventResponse(
+            items=[],
+            total_pages=1,
+            total=0,
+            page=event_filter.page,
+            size=event_filter.size,
+            has_next=False,
+        )
+
+
+@pytest.mark.asyncio
+async def test_bundle_sections_run_concurrently_on_separate_sessions():
+    catalog = _Catalog(asyncio.Event(), peers=2)
+    opened: list[int] = []
+
+    @asynccontextmanager
+    async def factory():
+        opened.append(len(opened))
+        yield catalog
+
+    service = AnnouncementsService(event_catalog_factory=factory)
+    bundle = await service.get_bundle(
+        infra=None, user=({}, {}), events_size=11, recruitment_events_size=5
+    )
+
+    assert len(opened) == 2
+    assert (bundle.events.size, bundle.recruitment_events.size) == (11, 5)
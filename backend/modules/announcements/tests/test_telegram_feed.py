@@ -0,0 +1,60 @@
+"""Unit tests for the background-refreshed Telegram latest-post cache."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.modules.announcements.telegram_feed import LATEST_POST_KEY, LatestPostCache
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+
+class _Scraper:
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.results.pop(0) if self.results else None
+
+
+@pytest.mark.asyncio
+async def test_requests_read_the_cache_and_cold_start_scrapes_once():
+    scraper = _Scraper(120)
+    cache = LatestPostCache(_Redis(), scraper)
+
+    ids = await asyncio.gather(*(cache.get() for _ in range(10)))
+
+    assert ids == [120] * 10
+    assert scraper.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_shared_across_replicas_and_keeps_stale_on_failure():
+    redis = _Redis()
+    scraper = _Scraper(7, None)
+    first, second = LatestPostCache(redis, scraper), LatestPostCache(redis, scraper)
+
+    assert await first.refresh() == 7
+    assert await second.refresh() is None  # another replica refreshed this interval
+    assert scraper.calls == 1
+
+    assert await second.refresh(force=True) is None  # scrape failed
+    assert redis.data[LATEST_POST_KEY] == "7"
+    assert await first.get() == 7
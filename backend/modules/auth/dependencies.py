@@ -8,6 +8,8 @@ from backend.modules.auth.app_token import AppTokenManager
 from backend.modules.auth.cookies import set_app_token_cookie, set_kc_auth_cookies
 from backend.modules.auth.keycloak_manager import KeyCloakManager
 from backend.modules.auth.mock import get_mock_user_by_sub
+from backend.modules.auth.principal_cache import PrincipalCache
+from backend.modules.auth.refresh_singleflight import RefreshSingleFlight
 from backend.modules.auth.service import AuthService
 from fastapi import Cookie, Depends, HTTPException, Request, Response, status
 from jose import JWTError, jwt
@@ -62,15 +64,25 @@ def get_redis(request: Request) -> Redis:
     return request.app.state.redis
 
 
+def get_principal_cache(request: Request) -> PrincipalCache | None:
+    return getattr(request.app.state, "principal_cache", None)
+
+
+def get_refresh_singleflight(request: Request) -> RefreshSingleFlight | None:
+    return getattr(request.app.state, "refresh_singleflight", None)
+
+
 def get_auth_service(
     db_session: AsyncSession = Depends(get_db_session),
     kc_manager: KeyCloakManager = Depends(get_keycloak_manager),
     app_token_manager: AppTokenManager = Depends(get_app_token_manager),
+    refresh_singleflight: RefreshSingleFlight | None = Depends(get_refresh_singleflight),
 ) -> AuthService:
     return AuthService(
         db_session=db_session,
         kc_manager=kc_manager,
         app_token_manager=app_token_manager,
+        refresh_singleflight=refresh_singleflight,
     )
 
 
@@ -80,6 +92,8 @@ async def get_creds_or_401(
     db_session: AsyncSession = Depends(get_db_session),
     kc_manager: KeyCloakManager = Depends(get_keycloak_manager),
     app_token_manager: AppTokenManager = Depends(get_app_token_manager),
+    principal_cache: PrincipalCache | None = Depends(get_principal_cache),
+    refresh_singleflight: RefreshSingleFlight | None = Depends(get_refresh_singleflight),
     access_token: Annotated[str | None, Cookie(alias=config.COOKIE_ACCESS_NAME)] = None,
     refresh_token: Annotated[str | None, Cookie(alias=config.COOKIE_REFRESH_NAME)] = None,
     app_token_cookie: Annotated[str | None, Cookie(alias=config.COOKIE_APP_NAME)] = None,
@@ -97,10 +111,16 @@ async def get_creds_or_401(
 
     kc_principal: dict | None = None
     keycloak_token_refreshed = False
+    auth_service = AuthService(
+        db_session,
+        kc_manager,
+        app_token_manager,
+        refresh_singleflight=refresh_singleflight,
+    )
 
     if not access_token:
         try:
-            new_kc_creds = await kc_manager.refresh_access_token(refresh_token)
+            new_kc_creds = await auth_service.exchange_refresh_token(refresh_token)
             set_kc_auth_cookies(response, new_kc_creds)
             access_token = new_kc_creds["access_token"]
         except Exception as e:
@@ -124,7 +144,7 @@ async def get_creds_or_401(
             kc_principal = await kc_manager.validate_keycloak_token(access_token)
         except jwt.ExpiredSignatureError:
             try:
-                new_kc_creds = await kc_manager.refresh_access_token(refresh_token)
+                new_kc_creds = await auth_service.exchange_refresh_token(refresh_token)
                 set_kc_auth_cookies(response, new_kc_creds)
                 access_token = new_kc_creds["access_token"]
                 kc_principal = await kc_manager.validate_keycloak_token(access_token)
@@ -146,11 +166,9 @@ async def get_creds_or_401(
             detail="Could not establish Keycloak principal.",
         )
 
-    auth_service = AuthService(db_session, kc_manager, app_token_manager)
-    try:
-        await auth_service.ensure_user_from_access_token(access_token, kc_principal)
-    except HTTPException:
-        raise
+    request.state.principal = await auth_service.resolve_principal(
+        access_token, kc_principal, principal_cache
+    )
 
     app_principal: dict | None = None
     issue_new_app_token = False
@@ -207,6 +225,8 @@ async def get_creds_or_guest(
     db_session: AsyncSession = Depends(get_db_session),
     kc_manager: KeyCloakManager = Depends(get_keycloak_manager),
     app_token_manager: AppTokenManager = Depends(get_app_token_manager),
+    principal_cache: PrincipalCache | None = Depends(get_principal_cache),
+    refresh_singleflight: RefreshSingleFlight | None = Depends(get_refresh_singleflight),
     access_token: Annotated[str | None, Cookie(alias=config.COOKIE_ACCESS_NAME)] = None,
     refresh_token: Annotated[str | None, Cookie(alias=config.COOKIE_REFRESH_NAME)] = None,
     app_token_cookie: Annotated[str | None, Cookie(alias=config.COOKIE_APP_NAME)] = None,
@@ -230,6 +250,8 @@ async def get_creds_or_guest(
             db_session=db_session,
             kc_manager=kc_manager,
             app_token_manager=app_token_manager,
+            principal_cache=principal_cache,
+            refresh_singleflight=refresh_singleflight,
             access_token=access_token,
             refresh_token=refresh_token,
             app_token_cookie=app_token_cookie,
@@ -244,14 +266,23 @@ async def get_creds_or_guest(
 
 
 async def check_tg(
+    request: Request,
     creds: Annotated[tuple[dict, dict], Depends(get_creds_or_401)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> bool:
+    principal = getattr(request.state, "principal", None)
+    # Only trust a positive cached link; a fresh link may not be visible in the cache yet.
+    if principal is not None and principal.sub == creds[0]["sub"] and principal.telegram_id:
+        return True
     return await auth_service.ensure_telegram_linked(creds[0]["sub"])
 
 
 async def check_role(
+    request: Request,
     creds: Annotated[tuple[dict, dict], Depends(get_creds_or_401)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> UserRole:
+    principal = getattr(request.state, "principal", None)
+    if principal is not None and principal.sub == creds[0]["sub"]:
+        return principal.role
     return await auth_service.get_user_role_or_403(creds[0]["sub"])
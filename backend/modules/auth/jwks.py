@@ -0,0 +1,177 @@
+"""Async Keycloak JWKS key store.
+
+Token validation needs the realm's public signing key for the token's ``kid``.
+``JwksKeyStore`` keeps the JWKS indexed by ``kid`` and only ever fetches it with
+httpx on the event loop:
+
+- a background task re-fetches the set shortly before it goes stale;
+- an unknown ``kid`` (key rotation) triggers one shared re-fetch, rate limited so
+  forged ``kid`` values cannot be used to hammer Keycloak;
+- concurrent callers that need a fetch await the same in-flight request.
+
+If a refresh fails, the last known keys keep being served.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import httpx
+from jose import JWTError
+from jwt import PyJWK
+from jwt.exceptions import PyJWKError
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+JWKS_REFRESHES = Counter(
+    "keycloak_jwks_refreshes_total",
+    "Keycloak JWKS fetches",
+    ["reason", "status"],
+)
+JWKS_KEY_MISSES = Counter(
+    "keycloak_jwks_key_misses_total",
+    "Token kid lookups not found in the cached JWKS",
+)
+
+
+class JwksKeyStore:
+    """Public signing keys of one JWKS endpoint, indexed by ``kid``."""
+
+    def __init__(
+        self,
+        jwks_uri: str,
+        *,
+        ttl: float = 3600.0,
+        refresh_margin: float = 300.0,
+        min_refetch_interval: float = 30.0,
+        headers: dict[str, str] | None = None,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.jwks_uri = jwks_uri
+        self.ttl = ttl
+        self.refresh_margin = min(refresh_margin, ttl / 2)
+        self.min_refetch_interval = min_refetch_interval
+        self.headers = headers or {}
+        self._client = client
+        self._owns_client = client is None
+        self._keys: dict[str, Any] = {}
+        self._fetched_at: float | None = None
+        self._last_attempt: float | None = None
+        self._inflight: asyncio.Task | None = None
+        self._refresher: asyncio.Task | None = None
+
+    @property
+    def is_stale(self) -> bool:
+        return self._fetched_at is None or time.monotonic() - self._fetched_at >= self.ttl
+
+    async def start(self) -> None:
+        """Warm the key set and start the background refresher."""
+        if self._refresher is not None:
+            return
+        try:
+            await self.refresh(reason="startup")
+        except Exception as exc:
+            logger.warning("Initial JWKS fetch from %s failed: %s", self.jwks_uri, exc)
+        self._refresher = asyncio.create_task(self._refresh_periodically())
+
+    async def aclose(self) -> None:
+        refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            refresher.cancel()
+            try:
+                await refresher
+            except asyncio.CancelledError:
+                pass
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_key(self, kid: str | None) -> Any:
+        """Return the verification key for ``kid``; raises ``JWTError`` if it is unknown."""
+        if self._fetched_at is None:
+            await self.refresh(reason="cold")
+        elif self.is_stale and self._may_refetch():
+            await self._try_refresh(reason="expired")
+        key = self._lookup(kid)
+        if key is not None:
+            return key
+
+        JWKS_KEY_MISSES.inc()
+        if self._may_refetch():
+            await self._try_refresh(reason="unknown_kid")
+            key = self._lookup(kid)
+            if key is not None:
+                return key
+        raise JWTError(f"Unknown signing key id: {kid}")
+
+    async def refresh(self, *, reason: str = "manual") -> None:
+        """Fetch the key set; concurrent callers share one in-flight request."""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._fetch(reason))
+        # shield: a cancelled request must not abort the fetch other callers await.
+        await asyncio.shield(self._inflight)
+
+    async def _try_refresh(self, *, reason: str) -> None:
+        try:
+            await self.refresh(reason=reason)
+        except Exception as exc:
+            logger.warning("JWKS refresh (%s) failed; serving cached keys: %s", reason, exc)
+
+    def _lookup(self, kid: str | None) -> Any:
+        if kid is None and len(self._keys) == 1:
+            return next(iter(self._keys.values()))
+        return self._keys.get(kid) if kid is not None else None
+
+    def _may_refetch(self) -> bool:
+        if self._last_attempt is None:
+            return True
+        return time.monotonic() - self._last_attempt >= self.min_refetch_interval
+
+    async def _fetch(self, reason: str) -> None:
+        self._last_attempt = time.monotonic()
+        try:
+            if self._client is None:
+                self._client = httpx.AsyncClient(timeout=10.0)
+            response = await self._client.get(self.jwks_uri, headers=self.headers)
+            response.raise_for_status()
+            keys = self._parse_keys(response.json().get("keys", []))
+        except Exception:
+            JWKS_REFRESHES.labels(reason=reason, status="error").inc()
+            raise
+        if not keys:
+            JWKS_REFRESHES.labels(reason=reason, status="error").inc()
+            raise JWTError("JWKS response contained no usable signing keys")
+
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        JWKS_REFRESHES.labels(reason=reason, status="ok").inc()
+
+    @staticmethod
+    def _parse_keys(jwks: list[dict]) -> dict[str, Any]:
+        keys: dict[str, Any] = {}
+        for jwk in jwks:
+            if jwk.get("use", "sig") != "sig" or not jwk.get("kid"):
+                continue
+            try:
+                keys[jwk["kid"]] = PyJWK(jwk).key
+            except PyJWKError as exc:
+                logger.warning("Skipping unusable JWK %s: %s", jwk.get("kid"), exc)
+        return keys
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            if self._fetched_at is None:
+                delay = self.min_refetch_interval
+            else:
+                age = time.monotonic() - self._fetched_at
+                delay = max(self.ttl - self.refresh_margin - age, 0.0)
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh(reason="scheduled")
+            except Exception as exc:
+                logger.warning("Scheduled JWKS refresh failed; serving cached keys: %s", exc)
+                await asyncio.sleep(self.min_refetch_interval)
@@ -1,15 +1,16 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from functools import cached_property
 from pathlib import Path
 
 import httpx
 from authlib.integrations.starlette_client import OAuth
-from cachetools import TTLCache
 from dotenv import load_dotenv
 from jose import jwt
-from jwt import PyJWKClient
 from pydantic_settings import BaseSettings
 
 from backend.core.configs.config import ENV_DIR
+from backend.modules.auth.jwks import JwksKeyStore
 
 load_dotenv(ENV_DIR)
 
@@ -24,8 +25,7 @@ class KeyCloakManager(BaseSettings):
     }
 
     _oauth: OAuth | None = None
-    _jwks_client: PyJWKClient | None = None
-    _jwks_cache = TTLCache(maxsize=1, ttl=3600)  # Cache JWKS for 1 hour
+    _http_client: httpx.AsyncClient | None = None
 
     @staticmethod
     def redirect_uri(app_base_url: str) -> str:
@@ -60,38 +60,45 @@ class KeyCloakManager(BaseSettings):
             client_kwargs=self.client_kwargs,
         )
 
-    async def get_pub_key(self, token: str):
-        """Fetch and cache Keycloak's public key for JWT validation."""
-        if "keys" not in self._jwks_cache:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.JWKS_URI)
-                response.raise_for_status()
-                self._jwks_cache["keys"] = response.json()["keys"]
-
-        # Use PyJWKClient to extract the signing key from the cached keys
-        if not self._jwks_client:
-            custom_headers = {
+    def bind_http_client(self, client: httpx.AsyncClient) -> None:
+        """Use the app's pooled Keycloak client (``backend/bootstrap/http.py``)."""
+        self._http_client = client
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._http_client is not None:
+            yield self._http_client
+            return
+        async with httpx.AsyncClient() as client:
+            yield client
+
+    @cached_property
+    def jwks_store(self) -> JwksKeyStore:
+        """Realm signing keys; started/closed with the app in ``backend/lifespan.py``."""
+        return JwksKeyStore(
+            self.JWKS_URI,
+            ttl=3600,
+            client=self._http_client,
+            headers={
                 # Use a common browser User-Agent or one identifying your app
                 "User-Agent": (
                     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                     "AppleWebKit/537.36 (KHTML, like Gecko) "
                     "Chrome/135.0.0.0 Safari/537.36"
                 )
-                # Alternatively: "User-Agent": "NurosBackend/1.0 (Authentication Key Fetch)"
-            }
-
-            # Pass headers during PyJWKClient initialization
-            # Make sure to include any other options you were already using
-            # (like cache_jwk_set, lifespan)
-            self._jwks_client = PyJWKClient(self.JWKS_URI, headers=custom_headers)  # <-- Add this
+            },
+        )
 
-        return self._jwks_client.get_signing_key_from_jwt(token).key
+    async def get_pub_key(self, token: str):
+        """Resolve the cached Keycloak public key for the token's ``kid``."""
+        kid = jwt.get_unverified_header(token).get("kid")
+        return await self.jwks_store.get_key(kid)
 
     async def refresh_access_token(self, refresh_token: str) -> dict:
         """Request a new access token using a refresh token."""
         token_url = f"{self.KEYCLOAK_URL}/realms/{self.REALM}/protocol/openid-connect/token"
 
-        async with httpx.AsyncClient() as client:
+        async with self._session() as client:
             response = await client.post(
                 token_url,
                 data={
@@ -134,7 +141,7 @@ class KeyCloakManager(BaseSettings):
             "requested_token_type": "urn:ietf:params:oauth:token-type:access_token",
             "requested_issuer": requested_issuer,
         }
-        async with httpx.AsyncClient() as client:
+        async with self._session() as client:
             response = await client.post(token_url, data=data)
         if response.status_code == 400:
             # propagate structured error for account-link-url handling
@@ -150,7 +157,7 @@ class KeyCloakManager(BaseSettings):
         """Revoke the offline refresh token in Keycloak."""
         revoke_url = f"{self.KEYCLOAK_URL}/realms/{self.REALM}/protocol/openid-connect/revoke"
 
-        async with httpx.AsyncClient() as client:
+        async with self._session() as client:
             response = await client.post(
                 revoke_url,
                 data={
@@ -179,7 +186,7 @@ class KeyCloakManager(BaseSettings):
         userinfo_url = (
             f"{self.KEYCLOAK_URL}/realms/{self.REALM}/protocol/openid-connect/userinfo"
         )
-        async with httpx.AsyncClient() as client:
+        async with self._session() as client:
             response = await client.get(
                 userinfo_url,
                 headers={"Authorization": f"Bearer {access_token}"},
@@ -0,0 +1,164 @@
+"""Token-keyed cache of resolved user principals.
+
+``get_creds_or_401`` runs on every authenticated request and used to resolve the
+user row (and sometimes Keycloak userinfo) each time. Once an access token has
+been validated and its user resolved, the result only changes when the user's
+role, department or Telegram link changes, so ``PrincipalCache`` keeps it for
+the remaining lifetime of the token:
+
+- an in-process LRU with a short TTL for the hot path;
+- Redis (``auth:principal:{token_hash}``) expiring together with the token, so a
+  restarted process does not fall back to the DB for every live session.
+
+``invalidate(sub)`` drops every cached token of a user; call it after changing
+anything stored in ``UserPrincipal``. The cache is best-effort: Redis errors are
+logged and treated as a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+
+from cachetools import TLRUCache
+from redis.asyncio import Redis
+
+from backend.modules.auth.models import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_KEY_PREFIX = "auth:principal:"
+PRINCIPAL_TOKENS_KEY_PREFIX = "auth:principal_tokens:"
+
+# Tokens without ``exp`` (mock Keycloak) are cached for this long.
+DEFAULT_PRINCIPAL_TTL_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """The parts of a ``users`` row that authorization checks need."""
+
+    sub: str
+    role: UserRole
+    telegram_id: int | None = None
+    department_id: int | None = None
+    expires_at: float = 0.0
+
+    @classmethod
+    def from_user(cls, user: User, *, expires_at: float) -> "UserPrincipal":
+        return cls(
+            sub=user.sub,
+            role=UserRole(user.role),
+            telegram_id=user.telegram_id,
+            department_id=user.department_id,
+            expires_at=expires_at,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps({**asdict(self), "role": self.role.value})
+
+    @classmethod
+    def from_json(cls, raw: str) -> "UserPrincipal":
+        data = json.loads(raw)
+        return cls(**{**data, "role": UserRole(data["role"])})
+
+
+def token_hash(access_token: str) -> str:
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+
+def token_expires_at(kc_principal: dict, *, now: float | None = None) -> float:
+    """Absolute expiry of the access token, or a short default when it has no ``exp``."""
+    now = time.time() if now is None else now
+    exp = kc_principal.get("exp")
+    try:
+        return float(exp)
+    except (TypeError, ValueError):
+        return now + DEFAULT_PRINCIPAL_TTL_SECONDS
+
+
+class PrincipalCache:
+    """Two-level (process LRU + Redis) cache of ``UserPrincipal`` by access token."""
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        *,
+        maxsize: int = 10_000,
+        local_ttl: float = 60.0,
+    ) -> None:
+        self.redis = redis
+        self.local_ttl = local_ttl
+        self._local: TLRUCache[str, UserPrincipal] = TLRUCache(
+            maxsize=maxsize,
+            ttu=self._local_expiry,
+            timer=time.time,
+        )
+
+    def _local_expiry(self, _key: str, principal: UserPrincipal, now: float) -> float:
+        return min(principal.expires_at, now + self.local_ttl)
+
+    async def get(self, access_token: str) -> UserPrincipal | None:
+        key = token_hash(access_token)
+        principal = self._local.get(key)
+        if principal is not None:
+            return principal
+        if self.redis is None:
+            return None
+
+        try:
+            raw = await self.redis.get(f"{PRINCIPAL_KEY_PREFIX}{key}")
+        except Exception as exc:
+            logger.warning("Principal cache read failed: %s", exc)
+            return None
+        if not raw:
+            return None
+
+        try:
+            principal = UserPrincipal.from_json(raw)
+        except (TypeError, ValueError, KeyError) as exc:
+            logger.warning("Dropping malformed cached principal: %s", exc)
+            return None
+        if principal.expires_at <= time.time():
+            return None
+        self._local[key] = principal
+        return principal
+
+    async def set(self, access_token: str, principal: UserPrincipal) -> None:
+        ttl = int(principal.expires_at - time.time())
+        if ttl <= 0:
+            return
+        key = token_hash(access_token)
+        self._local[key] = principal
+        if self.redis is None:
+            return
+
+        tokens_key = f"{PRINCIPAL_TOKENS_KEY_PREFIX}{principal.sub}"
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(f"{PRINCIPAL_KEY_PREFIX}{key}", principal.to_json(), ex=ttl)
+                pipe.sadd(tokens_key, key)
+                # Newer tokens expire later, so the index follows the latest one.
+                pipe.expire(tokens_key, ttl)
+                await pipe.execute()
+        except Exception as exc:
+            logger.warning("Principal cache write failed: %s", exc)
+
+    async def invalidate(self, sub: str) -> None:
+        """Forget every cached token of ``sub`` (role / department / Telegram changed)."""
+        for key, principal in list(self._local.items()):
+            if principal.sub == sub:
+                self._local.pop(key, None)
+        if self.redis is None:
+            return
+
+        tokens_key = f"{PRINCIPAL_TOKENS_KEY_PREFIX}{sub}"
+        try:
+            hashes = await self.redis.smembers(tokens_key)
+            keys = [f"{PRINCIPAL_KEY_PREFIX}{h}" for h in hashes]
+            await self.redis.delete(tokens_key, *keys)
+        except Exception as exc:
+            logger.warning("Principal cache invalidation failed for %s: %s", sub, exc)
@@ -0,0 +1,181 @@
+"""Single-flight Keycloak refresh-token exchange.
+
+When an access token expires, a page load fires many API calls at once and each
+of them used to exchange the same refresh token with Keycloak. ``RefreshSingleFlight``
+lets one caller per refresh token do the exchange:
+
+- callers in the same process await the same in-flight exchange;
+- across processes a Redis lock (``auth:refresh:lock:{hash}``) elects the leader
+  and the new credentials are published under ``auth:refresh:result:{hash}`` for
+  a short window, so followers reuse them instead of exchanging again.
+
+Keys are derived from a SHA-256 of the refresh token. The published result
+holds a live access/refresh token pair, so it is never stored in plaintext: it
+is Fernet-encrypted with a key derived (HMAC-SHA256) from the app ``secret`` and
+the refresh token itself. Reading Redis alone is not enough to recover it; a
+follower needs the refresh token it already holds. If Redis is unavailable the
+exchange still happens, deduplicated per process only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+from collections.abc import Awaitable, Callable
+
+from cryptography.fernet import Fernet, InvalidToken
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+REFRESH_LOCK_KEY_PREFIX = "auth:refresh:lock:"
+REFRESH_RESULT_KEY_PREFIX = "auth:refresh:result:"
+
+KC_REFRESH_EXCHANGES = Counter(
+    "keycloak_refresh_exchanges_total",
+    "Refresh-token exchanges by single-flight outcome",
+    ["outcome"],  # leader | joined | reused | fallback
+)
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+Exchange = Callable[[str], Awaitable[dict]]
+
+
+def _result_cipher(secret: bytes, refresh_token: str) -> Fernet:
+    digest = hmac.new(secret, refresh_token.encode("utf-8"), hashlib.sha256).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+class RefreshSingleFlight:
+    """Coalesces concurrent exchanges of the same refresh token."""
+
+    def __init__(
+        self,
+        redis: Redis | None = None,
+        *,
+        secret: str | bytes = b"",
+        result_ttl: int = 30,
+        lock_ttl: float = 10.0,
+        wait_timeout: float = 5.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.redis = redis
+        self._secret = secret.encode("utf-8") if isinstance(secret, str) else secret
+        self.result_ttl = result_ttl
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    async def refresh(self, refresh_token: str, exchange: Exchange) -> dict:
+        """Return new Keycloak credentials for ``refresh_token``, exchanging at most once."""
+        key = hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._refresh(key, refresh_token, exchange))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            KC_REFRESH_EXCHANGES.labels(outcome="joined").inc()
+        # shield: one cancelled request must not abort the exchange others await.
+        return await asyncio.shield(task)
+
+    async def _refresh(self, key: str, refresh_token: str, exchange: Exchange) -> dict:
+        if self.redis is None:
+            KC_REFRESH_EXCHANGES.labels(outcome="leader").inc()
+            return await exchange(refresh_token)
+
+        result_key = f"{REFRESH_RESULT_KEY_PREFIX}{key}"
+        lock_key = f"{REFRESH_LOCK_KEY_PREFIX}{key}"
+        lock_token = secrets.token_hex(8)
+        cipher = _result_cipher(self._secret, refresh_token)
+        try:
+            cached = await self._read_result(result_key, cipher)
+            if cached is not None:
+                KC_REFRESH_EXCHANGES.labels(outcome="reused").inc()
+                return cached
+            acquired = await self.redis.set(
+                lock_key, lock_token, nx=True, px=int(self.lock_ttl * 1000)
+            )
+        except Exception as exc:
+            logger.warning("Refresh single-flight unavailable, exchanging directly: %s", exc)
+            KC_REFRESH_EXCHANGES.labels(outcome="fallback").inc()
+            return await exchange(refresh_token)
+
+        if acquired:
+            return await self._lead(
+                refresh_token, exchange, cipher, result_key, lock_key, lock_token
+            )
+
+        cached = await self._wait_for_result(result_key, lock_key, cipher)
+        if cached is not None:
+            KC_REFRESH_EXCHANGES.labels(outcome="reused").inc()
+            return cached
+        # Leader failed or timed out; do not leave this request without a token.
+        KC_REFRESH_EXCHANGES.labels(outcome="fallback").inc()
+        return await exchange(refresh_token)
+
+    async def _lead(
+        self,
+        refresh_token: str,
+        exchange: Exchange,
+        cipher: Fernet,
+        result_key: str,
+        lock_key: str,
+        lock_token: str,
+    ) -> dict:
+        KC_REFRESH_EXCHANGES.labels(outcome="leader").inc()
+        try:
+            creds = await exchange(refresh_token)
+            try:
+                payload = cipher.encrypt(json.dumps(creds).encode("utf-8"))
+                await self.redis.set(result_key, payload, ex=self.result_ttl)
+            except Exception as exc:
+                logger.warning("Failed to publish refreshed Keycloak credentials: %s", exc)
+            return creds
+        finally:
+            try:
+                await self.redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)
+            except Exception as exc:
+                logger.warning("Failed to release refresh lock: %s", exc)
+
+    async def _read_result(self, result_key: str, cipher: Fernet) -> dict | None:
+        raw = await self.redis.get(result_key)
+        if not raw:
+            return None
+        try:
+            return json.loads(cipher.decrypt(raw))
+        except InvalidToken:
+            # Written under another secret (e.g. mid-rotation); exchange instead.
+            return None
+
+    async def _wait_for_result(
+        self, result_key: str, lock_key: str, cipher: Fernet
+    ) -> dict | None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+        while loop.time() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                cached = await self._read_result(result_key, cipher)
+                if cached is not None:
+                    return cached
+                if not await self.redis.exists(lock_key):
+                    # Lock released without a result: the leader's exchange failed.
+                    return await self._read_result(result_key, cipher)
+            except Exception as exc:
+                logger.warning("Refresh single-flight wait failed: %s", exc)
+                return None
+        return None
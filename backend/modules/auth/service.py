@@ -22,6 +22,12 @@ from backend.modules.auth.cookies import (
 from backend.modules.auth.keycloak_manager import KeyCloakManager
 from backend.modules.auth.mock import build_mock_creds, get_mock_user_by_sub
 from backend.modules.auth.oauth import exchange_code_for_credentials
+from backend.modules.auth.principal_cache import (
+    PrincipalCache,
+    UserPrincipal,
+    token_expires_at,
+)
+from backend.modules.auth.refresh_singleflight import RefreshSingleFlight
 from backend.modules.auth.repository import UserRepository
 from backend.modules.auth.schemas import CurrentUserResponse, UserSchema
 
@@ -36,10 +42,13 @@ class AuthService:
         db_session: AsyncSession,
         kc_manager: KeyCloakManager,
         app_token_manager: AppTokenManager,
+        *,
+        refresh_singleflight: RefreshSingleFlight | None = None,
     ):
         self.db_session = db_session
         self.kc_manager = kc_manager
         self.app_token_manager = app_token_manager
+        self.refresh_singleflight = refresh_singleflight
         self.user_repository = UserRepository(db_session)
 
     async def ensure_login_state(
@@ -207,6 +216,26 @@ class AuthService:
         )
         return await self.ensure_user_from_kc_principal(profile)
 
+    async def resolve_principal(
+        self,
+        access_token: str,
+        kc_principal: dict,
+        principal_cache: PrincipalCache | None = None,
+    ) -> UserPrincipal:
+        """``ensure_user_from_access_token`` behind the token-keyed principal cache."""
+        if principal_cache is not None:
+            cached = await principal_cache.get(access_token)
+            if cached is not None and cached.sub == kc_principal.get("sub"):
+                return cached
+
+        user = await self.ensure_user_from_access_token(access_token, kc_principal)
+        principal = UserPrincipal.from_user(
+            user, expires_at=token_expires_at(kc_principal)
+        )
+        if principal_cache is not None:
+            await principal_cache.set(access_token, principal)
+        return principal
+
     async def ensure_telegram_linked(self, sub: str) -> bool:
         user = await self.user_repository.get_by_sub(sub)
         if not user or not user.telegram_id:
@@ -309,6 +338,14 @@ class AuthService:
         await redis.delete(csrf_key)
         return redirect_response
 
+    async def exchange_refresh_token(self, kc_refresh_token: str) -> dict:
+        """Keycloak refresh, coalesced with concurrent requests holding the same token."""
+        if self.refresh_singleflight is None:
+            return await self.kc_manager.refresh_access_token(kc_refresh_token)
+        return await self.refresh_singleflight.refresh(
+            kc_refresh_token, self.kc_manager.refresh_access_token
+        )
+
     async def refresh_tokens(self, kc_refresh_token: str) -> tuple[dict, dict, str]:
         if config.MOCK_KEYCLOAK:
             if not kc_refresh_token.startswith("mock_refresh_"):
@@ -319,7 +356,7 @@ class AuthService:
             sub = kc_refresh_token.removeprefix("mock_refresh_")
             new_kc_creds = build_mock_creds(get_mock_user_by_sub(sub))
         else:
-            new_kc_creds = await self.kc_manager.refresh_access_token(kc_refresh_token)
+            new_kc_creds = await self.exchange_refresh_token(kc_refresh_token)
 
         access_token = new_kc_creds["access_token"]
         if config.MOCK_KEYCLOAK:
@@ -0,0 +1,77 @@
+"""Unit tests for the async JWKS key store."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError, jwt
+from jwt.algorithms import RSAAlgorithm
+
+from backend.modules.auth.jwks import JwksKeyStore
+
+JWKS_URI = "https://kc.test/realms/nu/protocol/openid-connect/certs"
+
+
+def _rsa_jwk(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    return private_key, {**jwk, "kid": kid, "use": "sig", "alg": "RS256"}
+
+
+class _JwksServer:
+    def __init__(self, *jwks: dict) -> None:
+        self.keys = list(jwks)
+        self.calls = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return httpx.Response(200, json={"keys": self.keys})
+
+
+def _store(server: _JwksServer, **kwargs) -> JwksKeyStore:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return JwksKeyStore(JWKS_URI, client=client, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_lookups_share_one_fetch():
+    private_key, jwk = _rsa_jwk("k1")
+    server = _JwksServer(jwk)
+    store = _store(server)
+
+    keys = await asyncio.gather(*(store.get_key("k1") for _ in range(10)))
+
+    assert server.calls == 1
+    token = jwt.encode({"sub": "u"}, private_key, algorithm="RS256", headers={"kid": "k1"})
+    assert jwt.decode(token, key=keys[0], algorithms=["RS256"])["sub"] == "u"
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refetches_once_for_rotated_key():
+    _, old_jwk = _rsa_jwk("old")
+    _, new_jwk = _rsa_jwk("new")
+    server = _JwksServer(old_jwk)
+    store = _store(server, min_refetch_interval=0)
+    await store.get_key("old")
+
+    server.keys = [old_jwk, new_jwk]
+    assert await store.get_key("new") is not None
+    assert server.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refetch_is_rate_limited():
+    _, jwk = _rsa_jwk("k1")
+    server = _JwksServer(jwk)
+    store = _store(server, min_refetch_interval=60)
+    await store.get_key("k1")
+
+    for _ in range(3):
+        with pytest.raises(JWTError):
+            await store.get_key("forged")
+    assert server.calls == 1
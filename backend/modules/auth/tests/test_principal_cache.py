@@ -0,0 +1,74 @@
+"""Unit tests for the token-keyed principal cache."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.modules.auth.models import UserRole
+from backend.modules.auth.principal_cache import PrincipalCache, UserPrincipal
+from backend.modules.auth.service import AuthService
+
+
+class _UserRepository:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get_by_sub(self, sub: str):
+        self.calls += 1
+        return SimpleNamespace(sub=sub, role=UserRole.admin, telegram_id=42, department_id=None)
+
+
+def _auth_service(repository: _UserRepository) -> AuthService:
+    service = AuthService.__new__(AuthService)
+    service.user_repository = repository
+    return service
+
+
+@pytest.mark.asyncio
+async def test_resolve_principal_hits_db_once_per_token(monkeypatch):
+    monkeypatch.setattr("backend.modules.auth.service.config.MOCK_KEYCLOAK", True)
+    repository = _UserRepository()
+    service = _auth_service(repository)
+    cache = PrincipalCache()
+    kc_principal = {"sub": "user-1", "email": "u@nu.edu.kz", "exp": time.time() + 300}
+
+    first = await service.resolve_principal("token-a", kc_principal, cache)
+    second = await service.resolve_principal("token-a", kc_principal, cache)
+
+    assert first == second
+    assert first.role == UserRole.admin and first.telegram_id == 42
+    assert repository.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_all_tokens_of_user():
+    cache = PrincipalCache()
+    expires_at = time.time() + 300
+    for token, sub in (("token-a", "user-1"), ("token-b", "user-1"), ("token-c", "user-2")):
+        await cache.set(token, UserPrincipal(sub=sub, role=UserRole.default, expires_at=expires_at))
+
+    await cache.invalidate("user-1")
+
+    assert await cache.get("token-a") is None
+    assert await cache.get("token-b") is None
+    assert (await cache.get("token-c")).sub == "user-2"
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_not_cached():
+    cache = PrincipalCache()
+    expired = UserPrincipal(sub="user-1", role=UserRole.default, expires_at=time.time() - 1)
+    await cache.set("token-a", expired)
+
+    assert await cache.get("token-a") is None
+
+
+def test_principal_json_round_trip():
+    principal = UserPrincipal(
+        sub="s", role=UserRole.admin, telegram_id=1, department_id=3, expires_at=10.0
+    )
+
+    assert UserPrincipal.from_json(principal.to_json()) == principal
@@ -0,0 +1,115 @@
+"""Unit tests for the single-flight Keycloak refresh exchange."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.modules.auth.refresh_singleflight import RefreshSingleFlight
+
+
+class _Redis:
+    """Just enough of redis.asyncio.Redis for the lock/result protocol."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def eval(self, _script, _numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+class _Keycloak:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def refresh_access_token(self, refresh_token: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return {"access_token": f"new-{self.calls}", "refresh_token": "r2"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_exchange():
+    keycloak = _Keycloak()
+    singleflight = RefreshSingleFlight(_Redis())
+
+    results = await asyncio.gather(
+        *(singleflight.refresh("r1", keycloak.refresh_access_token) for _ in range(8))
+    )
+
+    assert keycloak.calls == 1
+    assert {r["access_token"] for r in results} == {"new-1"}
+
+
+@pytest.mark.asyncio
+async def test_other_process_reuses_published_result():
+    redis = _Redis()
+    keycloak = _Keycloak()
+    first = RefreshSingleFlight(redis, poll_interval=0.01)
+    second = RefreshSingleFlight(redis, poll_interval=0.01)
+
+    a, b = await asyncio.gather(
+        first.refresh("r1", keycloak.refresh_access_token),
+        second.refresh("r1", keycloak.refresh_access_token),
+    )
+
+    assert keycloak.calls == 1
+    assert a == b
+
+
+@pytest.mark.asyncio
+async def test_follower_exchanges_itself_when_leader_fails():
+    redis = _Redis()
+    calls = 0
+
+    async def flaky_exchange(refresh_token: str) -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        if calls == 1:
+            raise RuntimeError("keycloak down")
+        return {"access_token": "ok"}
+
+    leader = RefreshSingleFlight(redis, poll_interval=0.01)
+    follower = RefreshSingleFlight(redis, poll_interval=0.01)
+    failed, recovered = await asyncio.gather(
+        leader.refresh("r1", flaky_exchange),
+        follower.refresh("r1", flaky_exchange),
+        return_exceptions=True,
+    )
+
+    assert isinstance(failed, RuntimeError)
+    assert recovered == {"access_token": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_published_result_is_encrypted():
+    redis = _Redis()
+    keycloak = _Keycloak()
+    exchange = keycloak.refresh_access_token
+    await RefreshSingleFlight(redis, secret="s3cret").refresh("r1", exchange)
+
+    [payload] = [v for k, v in redis.data.items() if k.startswith("auth:refresh:result:")]
+    assert b"new-1" not in payload and b"r2" not in payload
+
+    # Same secret and refresh token: reused. Different secret: unreadable, exchanges again.
+    reused = await RefreshSingleFlight(redis, secret="s3cret").refresh("r1", exchange)
+    assert reused["access_token"] == "new-1"
+    await RefreshSingleFlight(redis, secret="other").refresh("r1", exchange)
+    assert keycloak.calls == 2
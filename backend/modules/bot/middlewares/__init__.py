@@ -8,6 +8,7 @@ from redis.asyncio import Redis
 
 from backend.core.configs.config import Config, config
 from backend.core.database.manager import AsyncDatabaseManager
+from backend.modules.auth.principal_cache import PrincipalCache
 
 from .bucket_client import BucketClientMiddleware
 from .db_session import DatabaseMiddleware
@@ -31,6 +32,7 @@ def setup_middlewares(
     broker,
     signing_credentials: Credentials | None = None,
     app_config: Config | None = None,
+    principal_cache: PrincipalCache | None = None,
 ) -> None:
     """Attach shared dependencies to every update handler."""
     cfg = app_config or config
@@ -39,7 +41,7 @@ def setup_middlewares(
         RedisMiddleware(redis),
         UrlMiddleware(config.PUBLIC_WEBHOOK_URL),
         I18N(),
-        TelegramLinkMiddleware(),
+        TelegramLinkMiddleware(principal_cache),
         OtinishMiddleware(),
         BucketClientMiddleware(storage_client),
         MeilisearchMiddleware(meilisearch_client),
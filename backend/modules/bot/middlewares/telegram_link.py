@@ -5,10 +5,14 @@ from typing import Any, Awaitable, Callable
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
 
+from backend.modules.auth.principal_cache import PrincipalCache
 from backend.modules.bot.services.link import TelegramLinkService
 
 
 class TelegramLinkMiddleware(BaseMiddleware):
+    def __init__(self, principal_cache: PrincipalCache | None = None) -> None:
+        self.principal_cache = principal_cache
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
@@ -17,5 +21,7 @@ class TelegramLinkMiddleware(BaseMiddleware):
     ) -> Any:
         db_session = data.get("db_session")
         if db_session is not None:
-            data["telegram_link_service"] = TelegramLinkService(db_session)
+            data["telegram_link_service"] = TelegramLinkService(
+                db_session, principal_cache=self.principal_cache
+            )
         return await handler(event, data)
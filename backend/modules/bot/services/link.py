@@ -6,6 +6,7 @@ from enum import Enum
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.modules.auth.principal_cache import PrincipalCache
 from backend.modules.bot.repository import BotUserRepository
 
 
@@ -20,8 +21,10 @@ class TelegramLinkService:
         self,
         db_session: AsyncSession,
         user_repository: BotUserRepository | None = None,
+        principal_cache: PrincipalCache | None = None,
     ) -> None:
         self.user_repository = user_repository or BotUserRepository(db_session)
+        self.principal_cache = principal_cache
 
     async def handle_deeplink_start(self, sub: str, telegram_id: int) -> DeeplinkStartResult:
         if not await self.user_repository.exists_by_sub(sub):
@@ -41,4 +44,6 @@ class TelegramLinkService:
         if picked_number != expected_number:
             return False
         await self.user_repository.link_telegram_id(sub, telegram_id)
+        if self.principal_cache is not None:
+            await self.principal_cache.invalidate(sub)
         return True
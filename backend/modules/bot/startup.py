@@ -39,6 +39,7 @@ async def setup_bot(
         broker=app.state.broker,
         signing_credentials=getattr(app.state, "signing_credentials", None),
         app_config=getattr(app.state, "config", config),
+        principal_cache=getattr(app.state, "principal_cache", None),
     )
 
     include_routers(app.state.dp)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List, Tuple, Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Tuple, Dict, Any
 
 import httpx
 
@@ -15,10 +16,21 @@ class GoogleCalendarService:
         *,
         calendar_id: str = "primary",
         timeout: float = 20.0,
+        http_client: httpx.AsyncClient | None = None,
     ):
         self.kc_manager = kc_manager
         self.calendar_id = calendar_id
         self.timeout = timeout
+        self.http_client = http_client
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """The app's pooled Google client when provided, else a one-off client."""
+        if self.http_client is not None:
+            yield self.http_client
+            return
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            yield client
 
     async def _fetch_google_token(
         self, kc_access_token: str | None, kc_refresh_token: str | None
@@ -66,7 +78,7 @@ class GoogleCalendarService:
             "privateExtendedProperty": "source=nuros_schedule",
             "showDeleted": "false",
         }
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._session() as client:
             while True:
                 q = dict(params)
                 if page_token:
@@ -100,7 +112,7 @@ class GoogleCalendarService:
         created = 0
         google_errors: List[str] = []
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._session() as client:
             async def push_event(event: dict, token: str):
                 response = await client.post(
                     f"https://www.googleapis.com/calendar/v3/calendars/{self.calendar_id}/events",
@@ -195,7 +207,7 @@ class GoogleCalendarService:
             if k:
                 existing_map[k] = ev
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._session() as client:
             async def insert(ev: dict):
                 resp = await client.post(
                     f"https://www.googleapis.com/calendar/v3/calendars/{self.calendar_id}/events",
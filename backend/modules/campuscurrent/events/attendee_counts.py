@@ -0,0 +1,119 @@
+"""Periodic reconciliation of the denormalized ``events.attendees_count``.
+
+``EventRepository`` adjusts the counter in the same transaction as each RSVP,
+but attendee rows can also disappear without it, e.g. through the ``ON DELETE
+CASCADE`` when a user is removed. ``AttendeeCountReconciler`` recounts every
+``interval`` seconds and rewrites only the rows that drifted, holding the
+``events:attendees_count:reconcile`` lease in Redis so that only one replica
+runs each pass. Fixed rows are exported as ``event_attendees_count_fixed_total``.
+
+Each batch of events is locked with ``SELECT ... FOR UPDATE`` before it is
+recounted. A single ``UPDATE ... SET attendees_count = (count)`` is not enough
+under READ COMMITTED: when an RSVP commits its ``+1`` mid-statement, Postgres
+re-checks the new row version but evaluates the count against the statement's
+older snapshot and writes the stale value back. With the rows locked first, an
+RSVP either committed before the recount (which then sees it) or waits for it.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.core.background.periodic import PeriodicTask, claim_interval_lease
+from backend.core.database.manager import AsyncDatabaseManager
+from backend.modules.campuscurrent.events.listing_cache import EventListingCache
+from backend.modules.campuscurrent.models import Event, EventAttendee
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_LEASE_KEY = "events:attendees_count:reconcile"
+RECONCILE_BATCH_SIZE = 500
+
+ATTENDEE_COUNTS_FIXED = Counter(
+    "event_attendees_count_fixed_total",
+    "Events whose denormalized attendees_count was corrected by reconciliation",
+)
+
+
+async def _lock_event_batch(session: AsyncSession, after_id: int, limit: int) -> list[int]:
+    stmt = (
+        select(Event.id)
+        .where(Event.id > after_id)
+        .order_by(Event.id)
+        .limit(limit)
+        .with_for_update()
+    )
+    return list((await session.scalars(stmt)).all())
+
+
+async def reconcile_attendee_counts(
+    session: AsyncSession, *, batch_size: int = RECONCILE_BATCH_SIZE
+) -> int:
+    """Set ``attendees_count`` to the real count where it drifted; returns rows fixed.
+
+    Walks ``events`` in id order and commits after every ``batch_size`` rows, so the
+    row locks are held only while their batch is recounted.
+    """
+    fixed = 0
+    after_id = 0
+    while ids := await _lock_event_batch(session, after_id, batch_size):
+        actual = (
+            select(func.count())
+            .select_from(EventAttendee)
+            .where(EventAttendee.event_id == Event.id)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(Event)
+            .where(Event.id.in_(ids), Event.attendees_count != actual)
+            .values(attendees_count=actual, updated_at=Event.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        await session.commit()
+        fixed += result.rowcount or 0
+        after_id = ids[-1]
+    return fixed
+
+class AttendeeCountReconciler:
+    """Runs ``reconcile_attendee_counts`` on one replica every ``interval`` seconds."""
+
+    def __init__(
+        self,
+        db_manager: AsyncDatabaseManager,
+        redis: Redis,
+        *,
+        interval: float = 3600.0,
+        listing_cache: EventListingCache | None = None,
+    ) -> None:
+        self.db_manager = db_manager
+        self.redis = redis
+        self.interval = interval
+        self.listing_cache = listing_cache
+        self._loop = PeriodicTask(
+            "Attendee count reconciliation", self.run_once, interval=interval
+        )
+
+    def start(self) -> None:
+        self._loop.start()
+
+    async def aclose(self) -> None:
+        await self._loop.aclose()
+
+    async def run_once(self) -> int | None:
+        """One pass, or ``None`` if another replica ran within the interval."""
+        if not await claim_interval_lease(self.redis, RECONCILE_LEASE_KEY, self.interval * 0.9):
+            return None
+        async with self.db_manager.async_session_maker() as session:
+            fixed = await reconcile_attendee_counts(session)
+        if fixed:
+            ATTENDEE_COUNTS_FIXED.inc(fixed)
+            logger.info("Corrected attendees_count on %s events", fixed)
+            if self.listing_cache is not None:
+                await self.listing_cache.invalidate()
+        return fixed
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import csv
 import io
+from dataclasses import dataclass
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -18,20 +19,47 @@ from backend.modules.campuscurrent.models import Event
 CAMPUS_TZ = ZoneInfo("Asia/Almaty")
 
 
+@dataclass(frozen=True)
+class ExportEvent:
+    name: str
+    place: str
+    start_datetime: datetime
+
+
+@dataclass(frozen=True)
+class ExportAttendee:
+    name: str
+    surname: str
+    email: str
+
+
+def export_snapshot(
+    event: Event, rows: list[tuple[User, datetime]]
+) -> tuple[ExportEvent, list[tuple[ExportAttendee, datetime]]]:
+    """Detach export data from ORM rows so the xlsx build can run in a worker process."""
+    return (
+        ExportEvent(name=event.name, place=event.place, start_datetime=event.start_datetime),
+        [
+            (ExportAttendee(name=user.name, surname=user.surname, email=user.email), going_at)
+            for user, going_at in rows
+        ],
+    )
+
+
 def _format_going_at(value: datetime) -> str:
     if value.tzinfo is None:
         value = value.replace(tzinfo=ZoneInfo("UTC"))
     return value.astimezone(CAMPUS_TZ).strftime("%Y-%m-%d %H:%M")
 
 
-def _format_event_when(event: Event) -> str:
+def _format_event_when(event: Event | ExportEvent) -> str:
     start = event.start_datetime
     if start.tzinfo is None:
         start = start.replace(tzinfo=ZoneInfo("UTC"))
     return start.astimezone(CAMPUS_TZ).strftime("%Y-%m-%d %H:%M")
 
 
-def _full_name(user: User) -> str:
+def _full_name(user: User | ExportAttendee) -> str:
     return f"{user.name} {user.surname}".strip()
 
 
@@ -59,7 +87,9 @@ def build_attendees_csv(event: Event, rows: list[tuple[User, datetime]]) -> byte
     return ("\ufeff" + buffer.getvalue()).encode("utf-8")
 
 
-def build_attendees_xlsx(event: Event, rows: list[tuple[User, datetime]]) -> bytes:
+def build_attendees_xlsx(
+    event: Event | ExportEvent, rows: list[tuple[User | ExportAttendee, datetime]]
+) -> bytes:
     wb = Workbook()
     ws = wb.active
     ws.title = "Attendance"
@@ -7,11 +7,17 @@ from backend.modules.campuscurrent.events.service import EventService
 from backend.modules.media.dependencies import build_media_service
 
 
-def get_event_service(
-    db_session: AsyncSession = Depends(get_db_session),
-    infra: Infra = Depends(get_infra),
-) -> EventService:
+def build_event_service(db_session: AsyncSession, infra: Infra) -> EventService:
     return EventService(
         db_session=db_session,
         media_attachment_resolver=build_media_service(db_session, infra),
+        cpu_executor=infra.cpu_executor,
+        listing_cache=infra.event_listing_cache,
     )
+
+
+def get_event_service(
+    db_session: AsyncSession = Depends(get_db_session),
+    infra: Infra = Depends(get_infra),
+) -> EventService:
+    return build_event_service(db_session, infra)
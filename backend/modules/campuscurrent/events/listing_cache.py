@@ -0,0 +1,97 @@
+"""Redis cache for the viewer-independent part of public event listings.
+
+The landing page asks for the same upcoming approved events for guests and
+most signed-in users alike, and each miss costs the listing query, media rows,
+attendee counts, creator joins and URL signing. ``EventListingCache`` keeps the
+built ``ListEventResponse`` as seen by an anonymous viewer for ``ttl`` seconds
+under ``events:listing:{generation}:{hash of the filter}``. The per-viewer bits
+(``is_going``, permissions) are layered on afterwards by ``EventService``.
+
+Only listings that do not depend on who asks are cached (no ``creator_sub`` and
+no keyword; keyword searches already go through the Meilisearch result cache).
+Event writes, RSVPs and every upload or deletion of event media (``MediaService``)
+call ``invalidate``, which bumps the generation and opens a ``settle_seconds``
+window without caching. The request's transaction commits after ``invalidate``
+runs, and a listing read during that window would otherwise pin the pre-commit
+rows. Any Redis failure falls back to building the listing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+LISTING_KEY_PREFIX = "events:listing:"
+GENERATION_KEY = "events:listing:gen"
+SETTLE_KEY = "events:listing:settle"
+
+EVENT_LISTING_CACHE_LOOKUPS = Counter(
+    "event_listing_cache_total",
+    "Public event listing lookups by cache outcome",
+    ["outcome"],  # hit | miss | settling | bypass
+)
+
+
+def filter_digest(filter_payload: dict) -> str:
+    raw = json.dumps(filter_payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class EventListingCache:
+    """Generation-invalidated cache of anonymous event listing responses."""
+
+    def __init__(self, redis: Redis | None = None, *, ttl: int = 60, settle_seconds: int = 5):
+        self.redis = redis
+        self.ttl = ttl
+        self.settle_seconds = settle_seconds
+
+    @staticmethod
+    def is_cacheable(filter_payload: dict) -> bool:
+        return not filter_payload.get("creator_sub") and not filter_payload.get("keyword")
+
+    async def get_or_build(
+        self, filter_payload: dict, build: Callable[[], Awaitable[dict]]
+    ) -> dict:
+        if self.redis is None:
+            EVENT_LISTING_CACHE_LOOKUPS.labels(outcome="bypass").inc()
+            return await build()
+        try:
+            generation, settling = await self.redis.mget(GENERATION_KEY, SETTLE_KEY)
+            key = f"{LISTING_KEY_PREFIX}{generation or 0}:{filter_digest(filter_payload)}"
+            cached = None if settling else await self.redis.get(key)
+        except Exception as exc:
+            logger.warning("Event listing cache unavailable: %s", exc)
+            EVENT_LISTING_CACHE_LOOKUPS.labels(outcome="bypass").inc()
+            return await build()
+        if settling:
+            EVENT_LISTING_CACHE_LOOKUPS.labels(outcome="settling").inc()
+            return await build()
+        if cached:
+            EVENT_LISTING_CACHE_LOOKUPS.labels(outcome="hit").inc()
+            return json.loads(cached)
+
+        EVENT_LISTING_CACHE_LOOKUPS.labels(outcome="miss").inc()
+        body = await build()
+        try:
+            await self.redis.set(key, json.dumps(body, default=str), ex=self.ttl)
+        except Exception as exc:
+            logger.warning("Failed to store event listing: %s", exc)
+        return body
+
+    async def invalidate(self) -> None:
+        """Make every cached listing unreachable."""
+        if self.redis is None:
+            return
+        try:
+            await self.redis.incr(GENERATION_KEY)
+            if self.settle_seconds > 0:
+                await self.redis.set(SETTLE_KEY, "1", ex=self.settle_seconds)
+        except Exception as exc:
+            logger.warning("Failed to invalidate event listing cache: %s", exc)
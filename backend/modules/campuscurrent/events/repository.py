@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Tuple
 
 from httpx import AsyncClient
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, case, delete, func, literal, select, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.common.utils import meilisearch
@@ -194,47 +194,63 @@ class EventRepository:
         attendee = EventAttendee(event_id=event_id, user_sub=user_sub)
         self.db_session.add(attendee)
         await self.db_session.flush()
+        await self._shift_attendees_count(event_id, 1)
         return attendee
 
     async def remove_attendee(self, event_id: int, user_sub: str) -> bool:
-        attendee = await self.get_attendee(event_id, user_sub)
-        if attendee is None:
-            return False
-        await self.db_session.delete(attendee)
-        await self.db_session.flush()
-        return True
-
-    async def count_attendees(self, event_id: int) -> int:
+        # Decrement only for a row this statement removed: two overlapping "not going"
+        # requests can both see the attendee, but only one DELETE returns it.
         stmt = (
-            select(func.count())
-            .select_from(EventAttendee)
-            .where(EventAttendee.event_id == event_id)
+            delete(EventAttendee)
+            .where(EventAttendee.event_id == event_id, EventAttendee.user_sub == user_sub)
+            .returning(EventAttendee.event_id)
         )
         result = await self.db_session.execute(stmt)
-        return result.scalar() or 0
-
-    async def count_attendees_by_event_ids(self, event_ids: List[int]) -> dict[int, int]:
-        if not event_ids:
-            return {}
+        if result.scalar() is None:
+            return False
+        await self._shift_attendees_count(event_id, -1)
+        return True
 
+    async def _shift_attendees_count(self, event_id: int, delta: int) -> None:
+        # Same transaction as the attendee row; updated_at is pinned so an RSVP does not
+        # look like an event edit (search sync watermarks, "recently updated").
+        shifted = Event.attendees_count + delta
         stmt = (
-            select(EventAttendee.event_id, func.count())
-            .where(EventAttendee.event_id.in_(event_ids))
-            .group_by(EventAttendee.event_id)
+            update(Event)
+            .where(Event.id == event_id)
+            .values(
+                attendees_count=case((shifted < 0, 0), else_=shifted),
+                updated_at=Event.updated_at,
+            )
+            .execution_options(synchronize_session="fetch")
         )
+        await self.db_session.execute(stmt)
+
+    async def count_attendees(self, event_id: int) -> int:
+        stmt = select(Event.attendees_count).where(Event.id == event_id)
         result = await self.db_session.execute(stmt)
-        return {event_id: count for event_id, count in result.all()}
+        return result.scalar() or 0
 
-    async def list_going_event_ids(self, event_ids: List[int], user_sub: str) -> set[int]:
+    async def list_viewer_event_ids(
+        self, event_ids: List[int], user_sub: str
+    ) -> Tuple[set[int], set[int]]:
+        """Going and attendee-viewer event ids for ``user_sub`` in one round-trip."""
         if not event_ids or not user_sub:
-            return set()
-
-        stmt = select(EventAttendee.event_id).where(
+            return set(), set()
+        going = select(EventAttendee.event_id, literal("going").label("kind")).where(
             EventAttendee.event_id.in_(event_ids),
             EventAttendee.user_sub == user_sub,
         )
-        result = await self.db_session.execute(stmt)
-        return set(result.scalars().all())
+        viewer = select(EventAttendeeViewer.event_id, literal("viewer").label("kind")).where(
+            EventAttendeeViewer.event_id.in_(event_ids),
+            EventAttendeeViewer.user_sub == user_sub,
+        )
+        result = await self.db_session.execute(union_all(going, viewer))
+        going_ids: set[int] = set()
+        viewer_ids: set[int] = set()
+        for event_id, kind in result.all():
+            (going_ids if kind == "going" else viewer_ids).add(event_id)
+        return going_ids, viewer_ids
 
     async def list_attendees(
         self, event_id: int, *, page: int = 1, size: int = 20
@@ -276,18 +292,6 @@ class EventRepository:
         result = await self.db_session.execute(stmt)
         return result.scalar_one_or_none() is not None
 
-    async def list_attendee_viewer_event_ids(
-        self, event_ids: List[int], user_sub: str
-    ) -> set[int]:
-        if not event_ids or not user_sub:
-            return set()
-        stmt = select(EventAttendeeViewer.event_id).where(
-            EventAttendeeViewer.event_id.in_(event_ids),
-            EventAttendeeViewer.user_sub == user_sub,
-        )
-        result = await self.db_session.execute(stmt)
-        return set(result.scalars().all())
-
     async def add_attendee_viewer(
         self, event_id: int, user_sub: str, granted_by_sub: str
     ) -> EventAttendeeViewer:
@@ -10,18 +10,28 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.common.datetime_utils import utc_now
 from backend.common.schemas import Infra, ShortUserResponse
 from backend.common.utils import response_builder
+from backend.core.executor.pool import CpuExecutor, CpuJob
+from backend.modules.auth.models import UserRole
 from backend.modules.campuscurrent.events import schemas, utils
 from backend.modules.campuscurrent.events.attendees_export import (
     build_attendees_csv,
     build_attendees_xlsx,
+    export_snapshot,
 )
 from backend.modules.campuscurrent.events.interfaces import MediaAttachmentResolver
+from backend.modules.campuscurrent.events.listing_cache import EventListingCache
 from backend.modules.campuscurrent.events.policy import EventPolicy
 from backend.modules.campuscurrent.events.repository import EventRepository
 from backend.modules.campuscurrent.models import Event, EventAccessPurpose
 from backend.modules.media.models import EntityType, Media, MediaFormat
 
 _ACCESS_INVITE_TTL = timedelta(days=7)
+_ATTENDEES_XLSX_JOB = CpuJob("attendees_xlsx", build_attendees_xlsx, timeout=30.0)
+# Viewer used to build the cacheable, viewer-independent part of listings.
+_ANONYMOUS_VIEWER: tuple[dict, dict] = (
+    {"sub": "guest"},
+    {"role": UserRole.default.value, "communities": [], "is_guest": True},
+)
 
 
 class EventService:
@@ -30,10 +40,18 @@ class EventService:
         db_session: AsyncSession,
         media_attachment_resolver: MediaAttachmentResolver,
         repo: EventRepository | None = None,
+        cpu_executor: CpuExecutor | None = None,
+        listing_cache: EventListingCache | None = None,
     ):
         self.db_session = db_session
         self.media_attachment_resolver = media_attachment_resolver
         self.repo = repo or EventRepository(db_session)
+        self.cpu_executor = cpu_executor or CpuExecutor.unwired("EventService")
+        self.listing_cache = listing_cache
+
+    async def _invalidate_listings(self) -> None:
+        if self.listing_cache is not None:
+            await self.listing_cache.invalidate()
 
     async def _get_event_or_404(self, event_id: int) -> Event:
         event = await self.repo.get_event_by_id(event_id)
@@ -64,6 +82,7 @@ class EventService:
 
         event: Event = await self.repo.create_event(event_data)
         await self.repo.upsert_search(infra.meilisearch_client, event)
+        await self._invalidate_listings()
 
         event_responses = await self._build_event_responses([event], infra, user)
         return event_responses[0]
@@ -84,6 +103,7 @@ class EventService:
 
         if media_ids_to_delete:
             await self._delete_event_media(infra, event, media_ids_to_delete)
+        await self._invalidate_listings()
 
         event_responses = await self._build_event_responses([event], infra, user)
         return event_responses[0]
@@ -127,10 +147,36 @@ class EventService:
         await self.repo.delete_from_search(
             meilisearch_client=infra.meilisearch_client, event_id=event_id
         )
+        await self._invalidate_listings()
 
     def _is_guest(self, user: tuple[dict, dict]) -> bool:
         return bool(user[1].get("is_guest")) or user[0].get("sub") == "guest"
 
+    async def _viewer_event_ids(
+        self, event_ids: List[int], user: tuple[dict, dict]
+    ) -> tuple[set[int], set[int]]:
+        """Events ``user`` is going to and events whose attendees they may view."""
+        if self._is_guest(user):
+            return set(), set()
+        return await self.repo.list_viewer_event_ids(event_ids, user[0].get("sub"))
+
+    async def _personalize(
+        self, response: schemas.ListEventResponse, user: tuple[dict, dict]
+    ) -> schemas.ListEventResponse:
+        """Layer ``user``'s RSVP state and permissions onto an anonymous listing."""
+        if self._is_guest(user) or not response.items:
+            return response
+        going_event_ids, viewer_event_ids = await self._viewer_event_ids(
+            [item.id for item in response.items], user
+        )
+        policy = EventPolicy(user=user)
+        for item in response.items:
+            item.is_going = item.id in going_event_ids
+            item.permissions = policy.get_permissions(
+                item, is_attendee_viewer=item.id in viewer_event_ids
+            )
+        return response
+
     async def _build_event_responses(
         self,
         events: List[Event],
@@ -153,16 +199,8 @@ class EventService:
             if media.entity_type == EntityType.community_events:
                 event_media_by_id[media.entity_id].append(media)
 
-        attendees_count_by_id = await self.repo.count_attendees_by_event_ids(event_ids)
         creators_by_event_id = await self.repo.list_creators_by_event_ids(event_ids)
-        going_event_ids: set[int] = set()
-        viewer_event_ids: set[int] = set()
-        if not self._is_guest(user):
-            user_sub = user[0].get("sub")
-            going_event_ids = await self.repo.list_going_event_ids(event_ids, user_sub)
-            viewer_event_ids = await self.repo.list_attendee_viewer_event_ids(
-                event_ids, user_sub
-            )
+        going_event_ids, viewer_event_ids = await self._viewer_event_ids(event_ids, user)
 
         event_responses: List[schemas.EventResponse] = []
         for event in events:
@@ -187,7 +225,7 @@ class EventService:
                         event,
                         is_attendee_viewer=event.id in viewer_event_ids,
                     ),
-                    attendees_count=attendees_count_by_id.get(event.id, 0),
+                    attendees_count=event.attendees_count,
                     is_going=event.id in going_event_ids,
                 )
             )
@@ -214,6 +252,7 @@ class EventService:
 
         user_sub = user[0]["sub"]
         await self.repo.add_attendee(event_id=event.id, user_sub=user_sub)
+        await self._invalidate_listings()
         return schemas.EventGoingResponse(
             attendees_count=await self.repo.count_attendees(event.id),
             is_going=True,
@@ -227,6 +266,7 @@ class EventService:
 
         user_sub = user[0]["sub"]
         await self.repo.remove_attendee(event_id=event.id, user_sub=user_sub)
+        await self._invalidate_listings()
         return schemas.EventGoingResponse(
             attendees_count=await self.repo.count_attendees(event.id),
             is_going=False,
@@ -292,7 +332,7 @@ class EventService:
             media_type = "text/csv; charset=utf-8"
             return content, filename, media_type
 
-        content = build_attendees_xlsx(event, rows)
+        content = await self.cpu_executor.run(_ATTENDEES_XLSX_JOB, *export_snapshot(event, rows))
         filename = f"nuspace_{safe_name}_attendance.xlsx"
         media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         return content, filename, media_type
@@ -318,6 +358,24 @@ class EventService:
             user[0].get("sub") if event_filter.creator_sub == "me" else event_filter.creator_sub
         )
 
+        filter_payload = event_filter.model_dump(mode="json")
+        if self.listing_cache is None or not self.listing_cache.is_cacheable(filter_payload):
+            return await self._list_events(event_filter, creator_sub, infra, user)
+
+        async def build() -> dict:
+            response = await self._list_events(event_filter, None, infra, _ANONYMOUS_VIEWER)
+            return response.model_dump(mode="json")
+
+        body = await self.listing_cache.get_or_build(filter_payload, build)
+        return await self._personalize(schemas.ListEventResponse.model_validate(body), user)
+
+    async def _list_events(
+        self,
+        event_filter: schemas.EventFilter,
+        creator_sub: str | None,
+        infra: Infra,
+        user: tuple[dict, dict],
+    ) -> schemas.ListEventResponse:
         events, count, keyword_no_results = await self.repo.list_events(
             event_filter=event_filter,
             creator_sub=creator_sub,
@@ -447,6 +505,7 @@ class EventService:
                     detail="You already own this event",
                 )
             await self.repo.transfer_event_ownership(event, policy.user_sub)
+            await self._invalidate_listings()
             invite.accepted_at = utc_now()
             invite.accepted_by_sub = policy.user_sub
             await self.db_session.flush()
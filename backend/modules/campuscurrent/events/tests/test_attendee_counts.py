@@ -0,0 +1,143 @@
+"""Unit tests for the denormalized events.attendees_count."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.core.database.model_registry import import_models
+from backend.modules.campuscurrent.events import attendee_counts
+from backend.modules.campuscurrent.events.attendee_counts import reconcile_attendee_counts
+from backend.modules.campuscurrent.events.repository import EventRepository
+from backend.modules.campuscurrent.models import Event, EventAttendee
+from backend.modules.campuscurrent.models.events import (
+    EventStatus,
+    EventType,
+    RegistrationPolicy,
+)
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    import_models()  # resolves the type of the users.sub foreign keys
+    # A file, not :memory:, so a second session gets its own connection.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'events.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Event.__table__.create)
+        await conn.run_sync(EventAttendee.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        await session.execute(
+            insert(Event),
+            [
+                {
+                    "id": event_id,
+                    "creator_sub": "owner",
+                    "policy": RegistrationPolicy.open,
+                    "name": f"event {event_id}",
+                    "place": "Atrium",
+                    "start_datetime": _T0,
+                    "end_datetime": _T0,
+                    "description": "",
+                    "type": EventType.academic,
+                    "status": EventStatus.approved,
+                    "created_at": _T0,
+                    "updated_at": _T0,
+                }
+                for event_id in (1, 2)
+            ],
+        )
+        await session.commit()
+        yield session
+
+
+async def _stored(session, event_id: int) -> tuple[int, datetime]:
+    row = (
+        await session.execute(
+            select(Event.attendees_count, Event.updated_at).where(Event.id == event_id)
+        )
+    ).one()
+    return row.attendees_count, row.updated_at.replace(tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_rsvps_move_the_counter_without_touching_updated_at(session):
+    repo = EventRepository(session)
+
+    await repo.add_attendee(1, "a")
+    await repo.add_attendee(1, "b")
+    await repo.add_attendee(1, "a")  # already going: no double count
+    await repo.remove_attendee(1, "b")
+    await repo.remove_attendee(1, "zz")  # not going: no-op
+
+    assert await repo.count_attendees(1) == 1
+    assert await _stored(session, 1) == (1, _T0)
+
+
+@pytest.mark.asyncio
+async def test_reconciliation_fixes_only_drifted_rows(session):
+    session.add_all([EventAttendee(event_id=2, user_sub=sub) for sub in ("a", "b", "c")])
+    await session.flush()
+    await session.execute(update(Event).where(Event.id == 1).values(attendees_count=0))
+
+    assert await reconcile_attendee_counts(session) == 1
+    assert await _stored(session, 2) == (3, _T0)
+    assert await reconcile_attendee_counts(session) == 0
+
+
+@pytest.mark.asyncio
+async def test_rsvp_committed_during_a_pass_is_counted(engine, session, monkeypatch):
+    await session.execute(
+        update(Event)
+        .where(Event.id == 1)
+        .values(attendees_count=5, updated_at=Event.updated_at)
+    )
+    await session.commit()
+    lock_event_batch = attendee_counts._lock_event_batch
+
+    async def lock_then_rsvp(session, after_id, limit):
+        ids = await lock_event_batch(session, after_id, limit)
+        if 2 in ids:
+            # Another request RSVPs after the batch is locked but before it is recounted.
+            async with async_sessionmaker(engine)() as other:
+                await EventRepository(other).add_attendee(2, "late")
+                await other.commit()
+        return ids
+
+    monkeypatch.setattr(attendee_counts, "_lock_event_batch", lock_then_rsvp)
+
+    assert await reconcile_attendee_counts(session, batch_size=1) == 1
+    assert await _stored(session, 1) == (0, _T0)
+    assert await _stored(session, 2) == (1, _T0)
+
+
+@pytest.mark.asyncio
+async def test_overlapping_removals_decrement_once(session):
+    repo = EventRepository(session)
+    await repo.add_attendee(1, "a")
+    # Both requests saw the attendee before either deleted it.
+    assert await repo.get_attendee(1, "a") is not None
+
+    assert await repo.remove_attendee(1, "a") is True
+    assert await repo.remove_attendee(1, "a") is False
+    assert await _stored(session, 1) == (0, _T0)
+
+
+@pytest.mark.asyncio
+async def test_decrement_never_goes_below_zero(session):
+    session.add(EventAttendee(event_id=1, user_sub="a"))
+    await session.flush()  # row exists, counter drifted to 0
+
+    assert await EventRepository(session).remove_attendee(1, "a") is True
+    assert await _stored(session, 1) == (0, _T0)
@@ -0,0 +1,178 @@
+"""Unit tests for the anonymous event listing cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from backend.modules.campuscurrent.events import schemas
+from backend.modules.campuscurrent.events.listing_cache import EventListingCache
+from backend.modules.campuscurrent.events.service import EventService
+from backend.modules.campuscurrent.models.events import (
+    EventStatus,
+    EventTag,
+    EventType,
+    RegistrationPolicy,
+)
+from backend.modules.media.models import EntityType
+from backend.modules.media.service import MediaService
+
+_NOW = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+
+def _event(event_id: int, creator_sub: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=event_id,
+        creator_sub=creator_sub,
+        policy=RegistrationPolicy.open,
+        registration_link=None,
+        name=f"event {event_id}",
+        place="Atrium",
+        start_datetime=_NOW,
+        end_datetime=_NOW,
+        description="",
+        type=EventType.academic,
+        status=EventStatus.approved,
+        tag=EventTag.regular,
+        attendees_count=3 if event_id == 1 else 0,
+        created_at=_NOW,
+        updated_at=_NOW,
+    )
+
+
+class _Repo:
+    def __init__(self) -> None:
+        self.list_calls = 0
+        self.going = {"alice": {1}}
+
+    async def list_events(self, event_filter, creator_sub, meilisearch_client):
+        self.list_calls += 1
+        return [_event(1, "bob"), _event(2, "alice")], 2, False
+
+    async def list_media(self, event_ids, event_media_formats):
+        return []
+
+    async def list_creators_by_event_ids(self, event_ids):
+        creator = SimpleNamespace(sub="bob", name="Bob", surname="B", picture="")
+        return {event_id: creator for event_id in event_ids}
+
+    async def list_viewer_event_ids(self, event_ids, user_sub):
+        return self.going.get(user_sub, set()), set()
+
+
+class _Media:
+    async def build_url_map(self, media):
+        return {}
+
+    def to_responses(self, media, url_map):
+        return []
+
+
+def _user(sub: str) -> tuple[dict, dict]:
+    return {"sub": sub}, {"role": "default", "communities": []}
+
+
+@pytest.mark.asyncio
+async def test_listing_is_built_once_and_personalized_per_viewer():
+    repo = _Repo()
+    cache = EventListingCache(_Redis())
+    service = EventService(
+        db_session=None, media_attachment_resolver=_Media(), repo=repo, listing_cache=cache
+    )
+    event_filter = schemas.EventFilter(event_status=schemas.EventStatus.approved)
+    infra = SimpleNamespace(meilisearch_client=None)
+
+    alice = await service.get_events(user=_user("alice"), event_filter=event_filter, infra=infra)
+    carol = await service.get_events(user=_user("carol"), event_filter=event_filter, infra=infra)
+
+    assert repo.list_calls == 1
+    assert [item.is_going for item in alice.items] == [True, False]
+    assert [item.permissions.can_edit for item in alice.items] == [False, True]
+    assert [item.is_going for item in carol.items] == [False, False]
+    assert not any(item.permissions.can_edit for item in carol.items)
+    assert alice.items[0].attendees_count == 3
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_a_rebuild_after_the_settle_window():
+    repo = _Repo()
+    redis = _Redis()
+    cache = EventListingCache(redis)
+    service = EventService(
+        db_session=None, media_attachment_resolver=_Media(), repo=repo, listing_cache=cache
+    )
+    event_filter = schemas.EventFilter(event_status=schemas.EventStatus.approved)
+    infra = SimpleNamespace(meilisearch_client=None)
+
+    await service.get_events(user=_user("carol"), event_filter=event_filter, infra=infra)
+    await cache.invalidate()
+    await service.get_events(user=_user("carol"), event_filter=event_filter, infra=infra)
+    redis.data.pop("events:listing:settle")
+    await service.get_events(user=_user("carol"), event_filter=event_filter, infra=infra)
+    await service.get_events(user=_user("carol"), event_filter=event_filter, infra=infra)
+
+    assert repo.list_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_own_and_keyword_listings_bypass_the_cache():
+    repo = _Repo()
+    cache = EventListingCache(_Redis())
+    service = EventService(
+        db_session=None, media_attachment_resolver=_Media(), repo=repo, listing_cache=cache
+    )
+    infra = SimpleNamespace(meilisearch_client=None)
+
+    for _ in range(2):
+        await service.get_events(
+            user=_user("alice"), event_filter=schemas.EventFilter(creator_sub="me"), infra=infra
+        )
+
+    assert repo.list_calls == 2
+
+
+class _MediaRepo:
+    async def delete(self, media):
+        pass
+
+
+class _Storage:
+    async def delete_objects(self, names):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_deleting_event_media_invalidates_listings():
+    redis = _Redis()
+    media_service = MediaService(
+        repository=_MediaRepo(), storage=_Storage(), event_listing_cache=EventListingCache(redis)
+    )
+
+    community_media = SimpleNamespace(name="c.jpg", entity_type=EntityType.communities)
+    await media_service.delete_many([community_media])
+    assert "events:listing:gen" not in redis.data
+
+    event_media = SimpleNamespace(name="e.jpg", entity_type=EntityType.community_events)
+    await media_service.delete_many([community_media, event_media])
+    assert redis.data["events:listing:gen"] == "1"
@@ -1,7 +1,16 @@
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, PrimaryKeyConstraint, String
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+)
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
@@ -82,6 +91,9 @@ class EventCollaborator(Base):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        CheckConstraint("attendees_count >= 0", name="ck_events_attendees_count_nonnegative"),
+    )
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, nullable=False)
     creator_sub: Mapped[str] = mapped_column(
         ForeignKey("users.sub", ondelete="SET NULL"), nullable=True, unique=False, index=True
@@ -108,6 +120,11 @@ class Event(Base):
     tag: Mapped[EventTag] = mapped_column(
         SQLEnum(EventTag, name="event_tag"), nullable=False, default=EventTag.regular
     )  # only admins can edit tag
+    # Denormalized count of event_attendees rows, kept in step by EventRepository
+    # and corrected by the periodic attendee-count reconciler.
+    attendees_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
@@ -1,10 +1,18 @@
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.common.dependencies import get_db_session, get_infra
+from backend.common.dependencies import get_db_session, get_http_clients, get_infra
 from backend.common.schemas import Infra
+from backend.core.http.clients import HttpClientRegistry
+from backend.core.http.upstreams import GOOGLE_APIS
 from backend.modules.auth.keycloak_manager import KeyCloakManager
 from backend.modules.calendar.google_calendar_service import GoogleCalendarService
+from backend.modules.courses.registrar.dependencies import (
+    get_schedule_code_index,
+    get_semester_registry,
+)
+from backend.modules.courses.registrar.schedule_index import ScheduleCodeIndex
+from backend.modules.courses.registrar.semester_registry import ActiveSemesterRegistry
 from backend.modules.courses.registrar.service import RegistrarService
 from backend.modules.courses.courses.repository import CourseRepository
 from backend.modules.courses.courses.service import StudentCourseService
@@ -14,13 +22,25 @@ async def get_student_course_service(
     request: Request,
     db_session: AsyncSession = Depends(get_db_session),
     infra: Infra = Depends(get_infra),
+    http_clients: HttpClientRegistry = Depends(get_http_clients),
+    semester_registry: ActiveSemesterRegistry | None = Depends(get_semester_registry),
+    schedule_code_index: ScheduleCodeIndex | None = Depends(get_schedule_code_index),
 ) -> StudentCourseService:
     repository = CourseRepository(db_session=db_session)
     kc_manager: KeyCloakManager = request.app.state.kc_manager if request else None
-    calendar_service = GoogleCalendarService(kc_manager=kc_manager) if kc_manager else None
+    calendar_service = (
+        GoogleCalendarService(kc_manager=kc_manager, http_client=http_clients.get(GOOGLE_APIS))
+        if kc_manager
+        else None
+    )
     return StudentCourseService(
         repository=repository,
-        registrar=RegistrarService(meilisearch_client=infra.meilisearch_client),
+        registrar=RegistrarService(
+            meilisearch_client=infra.meilisearch_client,
+            semester_registry=semester_registry,
+            schedule_code_index=schedule_code_index,
+            cpu_executor=infra.cpu_executor,
+        ),
         infra=infra,
         kc_manager=kc_manager,
         calendar_sync=calendar_service,
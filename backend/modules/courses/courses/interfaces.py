@@ -20,7 +20,7 @@ class StudentScheduleRegistrar(Protocol):
 
     async def search_courses_pcc(self, request: CourseSearchRequest) -> CourseSearchResponse: ...
 
-    def parse_schedule_pdf(self, pdf_file: bytes) -> ScheduleResponse: ...
+    async def parse_schedule_pdf(self, pdf_file: bytes) -> ScheduleResponse: ...
 
 
 class CalendarEventSync(Protocol):
@@ -504,7 +504,7 @@ class StudentCourseService:
         student_sub: str,
         pdf_file: bytes,
     ) -> schemas.RegistrarSyncResponse:
-        schedule_response = self._registrar.parse_schedule_pdf(
+        schedule_response = await self._registrar.parse_schedule_pdf(
             _normalize_pdf_bytes(pdf_file)
         )
         return await self._sync_courses_from_schedule_response(
@@ -729,6 +729,10 @@ class StudentCourseService:
                     code_lookup.setdefault(normalized, item.course_code)
 
         async def fetch_course_window(normalized_code: str, raw_code: str):
+            chosen = await self._registrar.find_catalog_entry(raw_code)
+            if chosen is not None:
+                return normalized_code, self._extract_course_window(chosen), chosen
+
             search_result = await meilisearch.get(
                 client=active_infra.meilisearch_client,
                 storage_name=self._registrar.schedule_index_uid,
@@ -736,6 +740,7 @@ class StudentCourseService:
                 page=1,
                 size=3,
                 filters=None,
+                batched=True,
             )
             hits = search_result.get("hits", []) if isinstance(search_result, dict) else []
             chosen = None
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 from functools import lru_cache
 
+from fastapi import Request
+
+from backend.core.executor.pool import CpuExecutor
 from backend.modules.courses.degree_audit.service import DegreeAuditService
 
 
-@lru_cache(maxsize=1)
-def get_degree_audit_service() -> DegreeAuditService:
-    return DegreeAuditService()
+def get_degree_audit_service(request: Request) -> DegreeAuditService:
+    return _degree_audit_service(getattr(request.app.state, "cpu_executor", None))
 
+
+@lru_cache(maxsize=1)
+def _degree_audit_service(cpu_executor: CpuExecutor | None) -> DegreeAuditService:
+    return DegreeAuditService(cpu_executor=cpu_executor)
@@ -2,8 +2,15 @@ from __future__ import annotations
 
 import base64
 import json
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, List, Optional, Tuple
 
+from backend.core.executor.pool import (
+    CpuExecutor,
+    CpuExecutorBusyError,
+    CpuJob,
+    CpuJobTimeoutError,
+)
 from backend.modules.courses.models.degree_audit import DegreeAuditResult
 from backend.modules.courses.degree_audit.degree_audit import (
     REQUIREMENTS_BASE,
@@ -17,6 +24,7 @@ from backend.modules.courses.degree_audit.degree_audit import (
     requirement_for_major_year,
 )
 from backend.modules.courses.degree_audit.schemas import (
+    AuditProgramResult,
     AuditRequirementResult,
     AuditResponse,
     AuditSummary,
@@ -41,10 +49,16 @@ class DegreeAuditService:
     """
     Service wrapper for degree audit logic. Keeps requirements cached in memory and
     pulls transcripts directly from the registrar when credentials are provided.
+    Transcript parsing and the audits themselves run on the shared CPU executor.
     """
 
-    def __init__(self, client_factory=RegistrarClient) -> None:
+    def __init__(
+        self,
+        client_factory=RegistrarClient,
+        cpu_executor: CpuExecutor | None = None,
+    ) -> None:
         self._client_factory = client_factory
+        self._cpu_executor = cpu_executor or CpuExecutor.unwired("DegreeAuditService")
         self._requirements_catalog: Dict[str, Dict[str, str]] | None = None
         self._minor_requirements_catalog: Dict[str, str] | None = None
         self._requirements_cache: Dict[Tuple[str, str], List] = {}
@@ -138,7 +152,7 @@ class DegreeAuditService:
     ) -> AuditResponse:
         transcript = await self._fetch_transcript_from_registrar(username, password)
         work, unmapped_tc = self._transcript_with_tc_mappings(transcript, tc_mappings or [])
-        response = self._run_audits(work, year=year, majors=majors, minors=minors)
+        response = await self._run_audits(work, year=year, majors=majors, minors=minors)
         response.unmapped_tc_courses = unmapped_tc
         await self._save_result(
             session=session,
@@ -161,15 +175,9 @@ class DegreeAuditService:
         session: AsyncSession,
         tc_mappings: List[TCMapping] | None = None,
     ) -> AuditResponse:
-        try:
-            transcript = parse_transcript_bytes(_normalize_pdf_bytes(pdf_file))
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail="invalid_transcript_pdf",
-            )
+        transcript = await self._parse_transcript(pdf_file)
         work, unmapped_tc = self._transcript_with_tc_mappings(transcript, tc_mappings or [])
-        response = self._run_audits(work, year=year, majors=majors, minors=minors)
+        response = await self._run_audits(work, year=year, majors=majors, minors=minors)
         response.unmapped_tc_courses = unmapped_tc
         await self._save_result(
             session=session,
@@ -213,8 +221,14 @@ class DegreeAuditService:
                 detail=exc.detail,
             ) from exc
 
+        return await self._parse_transcript(pdf_bytes)
+
+    async def _parse_transcript(self, pdf_bytes: bytes) -> Transcript:
         try:
-            return parse_transcript_bytes(_normalize_pdf_bytes(pdf_bytes))
+            return await self._cpu_executor.run(PARSE_TRANSCRIPT_JOB, pdf_bytes)
+        except (CpuExecutorBusyError, CpuJobTimeoutError, BrokenProcessPool):
+            # Executor failures are ours, not a bad upload; the app maps them to 503.
+            raise
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
@@ -240,81 +254,23 @@ class DegreeAuditService:
         self._minor_requirements_cache[minor] = requirements
         return requirements
 
-    def _run_audits(
+    async def _run_audits(
         self, transcript: Transcript, *, year: str, majors: List[str], minors: List[str]
     ) -> AuditResponse:
-        from backend.modules.courses.degree_audit.schemas import AuditProgramResult
-        audits = []
-        csv_b64 = None
-
-        for major in majors:
-            requirements = self._load_requirements(major, year)
-            audit_results = audit_transcript(transcript, requirements, expected_major=major)
-            summary_raw = compute_credit_summary(transcript, requirements, audit_results)
-
-            results_out = [
-                AuditRequirementResult(
-                    course_code=res.requirement.course_code,
-                    course_name=res.requirement.course_name,
-                    credits_required=format_credit(res.requirement.credits_need),
-                    min_grade=res.requirement.min_grade,
-                    status=res.status,
-                    used_courses="; ".join(res.used_courses),
-                    credits_applied=format_credit(res.credits_applied),
-                    credits_remaining=format_credit(res.credits_remaining),
-                    note=res.note or res.requirement.comments,
-                )
-                for res in audit_results
-            ]
-            summary = AuditSummary(**summary_raw) if summary_raw else None
-
-            if csv_b64 is None:
-                csv_data = audit_results_to_csv_string(audit_results, summary=summary_raw)
-                csv_b64 = base64.b64encode(csv_data.encode("utf-8")).decode("ascii")
-
-            audits.append(AuditProgramResult(
-                name=major,
-                type="major",
-                results=results_out,
-                summary=summary,
-                warnings=[],
-            ))
-
-        for minor in minors:
-            requirements = self._load_minor_requirements(minor)
-            audit_results = audit_transcript(transcript, requirements, expected_major=minor)
-            summary_raw = compute_credit_summary(transcript, requirements, audit_results)
-
-            results_out = [
-                AuditRequirementResult(
-                    course_code=res.requirement.course_code,
-                    course_name=res.requirement.course_name,
-                    credits_required=format_credit(res.requirement.credits_need),
-                    min_grade=res.requirement.min_grade,
-                    status=res.status,
-                    used_courses="; ".join(res.used_courses),
-                    credits_applied=format_credit(res.credits_applied),
-                    credits_remaining=format_credit(res.credits_remaining),
-                    note=res.note or res.requirement.comments,
-                )
-                for res in audit_results
-            ]
-            summary = AuditSummary(**summary_raw) if summary_raw else None
-
-            audits.append(AuditProgramResult(
-                name=minor,
-                type="minor",
-                results=results_out,
-                summary=summary,
-                warnings=[],
-            ))
-
-        return AuditResponse(
+        # Requirements are loaded (and cached) here; only the audit crosses to a worker.
+        programs: List[Tuple[str, str, List]] = [
+            (major, "major", self._load_requirements(major, year)) for major in majors
+        ]
+        programs += [
+            (minor, "minor", self._load_minor_requirements(minor)) for minor in minors
+        ]
+        return await self._cpu_executor.run(
+            RUN_AUDITS_JOB,
+            transcript,
+            programs,
             year=year,
             majors=majors,
             minors=minors,
-            audits=audits,
-            csv_base64=csv_b64,
         )
 
     async def _save_result(
@@ -401,6 +357,67 @@ class DegreeAuditService:
         )
 
 
+def _parse_transcript_payload(pdf_bytes: bytes) -> Transcript:
+    return parse_transcript_bytes(_normalize_pdf_bytes(pdf_bytes))
+
+
+def _audit_programs(
+    transcript: Transcript,
+    programs: List[Tuple[str, str, List]],
+    *,
+    year: str,
+    majors: List[str],
+    minors: List[str],
+) -> AuditResponse:
+    """Audit the transcript against each (name, type, requirements) program."""
+    audits = []
+    csv_b64 = None
+
+    for name, program_type, requirements in programs:
+        audit_results = audit_transcript(transcript, requirements, expected_major=name)
+        summary_raw = compute_credit_summary(transcript, requirements, audit_results)
+
+        results_out = [
+            AuditRequirementResult(
+                course_code=res.requirement.course_code,
+                course_name=res.requirement.course_name,
+                credits_required=format_credit(res.requirement.credits_need),
+                min_grade=res.requirement.min_grade,
+                status=res.status,
+                used_courses="; ".join(res.used_courses),
+                credits_applied=format_credit(res.credits_applied),
+                credits_remaining=format_credit(res.credits_remaining),
+                note=res.note or res.requirement.comments,
+            )
+            for res in audit_results
+        ]
+        summary = AuditSummary(**summary_raw) if summary_raw else None
+
+        if program_type == "major" and csv_b64 is None:
+            csv_data = audit_results_to_csv_string(audit_results, summary=summary_raw)
+            csv_b64 = base64.b64encode(csv_data.encode("utf-8")).decode("ascii")
+
+        audits.append(AuditProgramResult(
+            name=name,
+            type=program_type,
+            results=results_out,
+            summary=summary,
+            warnings=[],
+        ))
+
+    return AuditResponse(
+        year=year,
+        majors=majors,
+        minors=minors,
+        audits=audits,
+        csv_base64=csv_b64,
+    )
+
+
+PARSE_TRANSCRIPT_JOB = CpuJob("parse_transcript", _parse_transcript_payload, timeout=60.0)
+RUN_AUDITS_JOB = CpuJob("degree_audit", _audit_programs, timeout=60.0)
+
+
 def _normalize_pdf_bytes(pdf_bytes: bytes) -> bytes:
     """Normalize JSON/base64 payloads into raw PDF bytes for parsing.
 
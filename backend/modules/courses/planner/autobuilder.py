@@ -38,11 +38,61 @@ class AutoBuildResult:
         return self.assignments.get(key)
 
 
+@dataclass(frozen=True)
+class SectionSnapshot:
+    id: int
+    planner_schedule_course_id: int
+    section_code: Optional[str]
+    days: Optional[str]
+    times: Optional[str]
+
+
+@dataclass(frozen=True)
+class CourseSnapshot:
+    id: int
+    course_code: str
+    sections: Tuple[SectionSnapshot, ...]
+
+
+@dataclass(frozen=True)
+class ScheduleSnapshot:
+    """Plain, picklable copy of a planner schedule for building off the event loop."""
+
+    courses: Tuple[CourseSnapshot, ...]
+
+    @classmethod
+    def from_schedule(cls, schedule: PlannerSchedule) -> "ScheduleSnapshot":
+        return cls(
+            courses=tuple(
+                CourseSnapshot(
+                    id=course.id,
+                    course_code=course.course_code,
+                    sections=tuple(
+                        SectionSnapshot(
+                            id=section.id,
+                            planner_schedule_course_id=section.planner_schedule_course_id,
+                            section_code=section.section_code,
+                            days=section.days,
+                            times=section.times,
+                        )
+                        for section in course.sections
+                    ),
+                )
+                for course in schedule.courses
+            )
+        )
+
+
+def build_schedule_assignments(snapshot: ScheduleSnapshot) -> AutoBuildResult:
+    """CPU executor entrypoint for the auto builder."""
+    return PlannerAutoBuilder().build(snapshot)
+
+
 class PlannerAutoBuilder:
-    def build(self, schedule: PlannerSchedule) -> AutoBuildResult:
+    def build(self, schedule: PlannerSchedule | ScheduleSnapshot) -> AutoBuildResult:
         return self._run_autobuilder(schedule)
 
-    def _run_autobuilder(self, schedule: PlannerSchedule) -> AutoBuildResult:
+    def _run_autobuilder(self, schedule: PlannerSchedule | ScheduleSnapshot) -> AutoBuildResult:
         courses = schedule.courses
         if not courses:
             return AutoBuildResult(
@@ -5,14 +5,30 @@ from backend.common.dependencies import get_db_session, get_infra
 from backend.common.schemas import Infra
 from backend.modules.courses.planner.repository import PlannerRepository
 from backend.modules.courses.planner.service import PlannerService
+from backend.modules.courses.registrar.dependencies import (
+    get_schedule_code_index,
+    get_semester_registry,
+)
+from backend.modules.courses.registrar.schedule_index import ScheduleCodeIndex
+from backend.modules.courses.registrar.semester_registry import ActiveSemesterRegistry
 from backend.modules.courses.registrar.service import RegistrarService
 
 
 async def get_planner_service(
     db_session: AsyncSession = Depends(get_db_session),
     infra: Infra = Depends(get_infra),
+    semester_registry: ActiveSemesterRegistry | None = Depends(get_semester_registry),
+    schedule_code_index: ScheduleCodeIndex | None = Depends(get_schedule_code_index),
 ) -> PlannerService:
     repository = PlannerRepository(db_session)
-    registrar_service = RegistrarService(meilisearch_client=infra.meilisearch_client)
-    return PlannerService(repository=repository, course_catalog=registrar_service)
+    registrar_service = RegistrarService(
+        meilisearch_client=infra.meilisearch_client,
+        semester_registry=semester_registry,
+        schedule_code_index=schedule_code_index,
+    )
+    return PlannerService(
+        repository=repository,
+        course_catalog=registrar_service,
+        cpu_executor=infra.cpu_executor,
+    )
 
@@ -5,7 +5,11 @@ from typing import Dict, Iterable, List, Optional, Sequence
 
 from fastapi import HTTPException
 
-from backend.modules.courses.planner.autobuilder import PlannerAutoBuilder
+from backend.core.executor.pool import CpuExecutor, CpuJob
+from backend.modules.courses.planner.autobuilder import (
+    ScheduleSnapshot,
+    build_schedule_assignments,
+)
 from backend.modules.courses.planner.constants import (
     DEFAULT_SCHEDULE_NAME,
     MAX_PLANNER_SCHEDULES_PER_STUDENT,
@@ -44,16 +48,19 @@ from backend.modules.courses.models.grade_report import (
 
 logger = logging.getLogger(__name__)
 
+AUTO_BUILD_JOB = CpuJob("planner_auto_build", build_schedule_assignments, timeout=20.0)
+
 
 class PlannerService:
     def __init__(
         self,
         repository: PlannerRepository,
         course_catalog: CourseCatalogLookup,
+        cpu_executor: CpuExecutor | None = None,
     ):
         self.repository = repository
         self.course_catalog = course_catalog
-        self.autobuilder = PlannerAutoBuilder()
+        self.cpu_executor = cpu_executor or CpuExecutor.unwired("PlannerService")
         self.serializer = PlannerSerializer(course_catalog)
         self._active_semester: SemesterOption | None = None
 
@@ -476,7 +483,9 @@ class PlannerService:
                 )
         schedule = await self._resolve_schedule(student_sub, schedule.id)
 
-        builder_result = self.autobuilder.build(schedule)
+        builder_result = await self.cpu_executor.run(
+            AUTO_BUILD_JOB, ScheduleSnapshot.from_schedule(schedule)
+        )
 
         for course in schedule.courses:
             chosen_section_ids = builder_result.get(course.id)
@@ -0,0 +1,14 @@
+from fastapi import Request
+
+from backend.modules.courses.registrar.schedule_index import ScheduleCodeIndex
+from backend.modules.courses.registrar.semester_registry import ActiveSemesterRegistry
+
+
+def get_semester_registry(request: Request) -> ActiveSemesterRegistry | None:
+    """App-scoped active semester registry (created in ``lifespan``)."""
+    return getattr(request.app.state, "semester_registry", None)
+
+
+def get_schedule_code_index(request: Request) -> ScheduleCodeIndex | None:
+    """App-scoped exact-code index over the schedule catalog (created in ``lifespan``)."""
+    return getattr(request.app.state, "schedule_code_index", None)
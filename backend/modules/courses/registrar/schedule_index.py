@@ -0,0 +1,170 @@
+"""In-process exact-code index over the registrar schedule catalog.
+
+Section fetches, priority lookups and calendar-window lookups all resolve one
+exact course code. Full-text searching the Meilisearch catalog and post-filtering
+the hits is a network hop per code and can pick a near miss. The catalog is a
+single GCS artifact of a few thousand documents, so every API process keeps an
+immutable ``ScheduleCatalogSnapshot`` keyed by normalized code, each cross-listed
+part (``WCS 210/ASC 200`` → ``WCS210``, ``ASC200``) and ``abbr``.
+
+``ScheduleCodeIndex`` lives on ``app.state``. ``sync_schedule_catalog`` swaps in a
+new snapshot and publishes its digest to Redis (``registrar:catalog:digest``).
+A GCS finalize is handled by one replica only, so the other replicas compare that
+digest at most every ``check_interval`` seconds and reload the catalog in the
+background when it changed. Lookups never wait for a reload; callers fall back to
+Meilisearch when the snapshot is missing or has no entry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from types import MappingProxyType
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+CATALOG_DIGEST_KEY = "registrar:catalog:digest"
+
+CatalogLoader = Callable[[], Awaitable[list[dict] | None]]
+
+
+def normalize_course_code(value: str | None) -> str:
+    """``"wcs 210 / asc-200"`` → ``"WCS210/ASC200"``; cross-list parts stay ``/``-separated."""
+    if not value:
+        return ""
+    normalized = re.sub(r"\s+", " ", value).strip().upper()
+    normalized = re.sub(r"\s*/\s*", "/", normalized)
+    normalized = normalized.replace("-", "").replace(" ", "")
+    return normalized
+
+
+def matches_term(document: Mapping, term: str | None) -> bool:
+    """True if ``term`` is empty or equals the document's ``term_id`` or ``term`` label."""
+    if not term:
+        return True
+    term_str = str(term).strip()
+    doc_term_id = str(document.get("term_id") or "").strip()
+    doc_term_label = str(document.get("term") or "").strip()
+    return term_str == doc_term_id or term_str == doc_term_label
+
+
+def catalog_digest(documents: Iterable[Mapping]) -> str:
+    raw = json.dumps(list(documents), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _keys(code: str | None) -> list[str]:
+    normalized = normalize_course_code(code)
+    if not normalized:
+        return []
+    return [normalized] + [part for part in normalized.split("/") if part and part != normalized]
+
+
+class ScheduleCatalogSnapshot:
+    """Immutable view of one catalog generation."""
+
+    def __init__(self, documents: Iterable[Mapping], digest: str | None = None) -> None:
+        documents = list(documents)
+        by_key: dict[str, list[Mapping]] = {}
+        for document in documents:
+            seen: set[str] = set()
+            for field in ("course_code", "abbr"):
+                for key in _keys(document.get(field)):
+                    if key not in seen:
+                        seen.add(key)
+                        by_key.setdefault(key, []).append(document)
+        self._by_key = MappingProxyType({key: tuple(docs) for key, docs in by_key.items()})
+        self.digest = digest or catalog_digest(documents)
+        self.size = len(documents)
+
+    def find(self, course_code: str | None, term: str | None = None) -> Mapping | None:
+        """Catalog document for ``course_code`` (or one of its cross-list parts) in ``term``."""
+        for key in _keys(course_code):
+            for document in self._by_key.get(key, ()):
+                if matches_term(document, term):
+                    return document
+        return None
+
+
+class ScheduleCodeIndex:
+    """Holds the current snapshot for the lifetime of the API process."""
+
+    def __init__(self, redis: Redis | None = None, *, check_interval: float = 30.0) -> None:
+        self.redis = redis
+        self.check_interval = check_interval
+        self._snapshot: ScheduleCatalogSnapshot | None = None
+        self._loader: CatalogLoader | None = None
+        self._checked_at = 0.0
+        self._reload_task: asyncio.Task | None = None
+
+    @property
+    def snapshot(self) -> ScheduleCatalogSnapshot | None:
+        return self._snapshot
+
+    def set_loader(self, loader: CatalogLoader | None) -> None:
+        """How to fetch the catalog when another replica published a newer one."""
+        self._loader = loader
+
+    def swap(self, documents: Iterable[Mapping]) -> ScheduleCatalogSnapshot:
+        snapshot = ScheduleCatalogSnapshot(documents)
+        self._snapshot = snapshot
+        self._checked_at = time.monotonic()
+        logger.info("Schedule code index swapped (%s docs)", snapshot.size)
+        return snapshot
+
+    async def publish(self) -> None:
+        """Tell other replicas which catalog generation is current."""
+        if self.redis is None or self._snapshot is None:
+            return
+        try:
+            await self.redis.set(CATALOG_DIGEST_KEY, self._snapshot.digest)
+        except Exception as exc:
+            logger.warning("Failed to publish schedule catalog digest: %s", exc)
+
+    async def current(self) -> ScheduleCatalogSnapshot | None:
+        """Current snapshot; may start a background reload if a newer one was published."""
+        snapshot = self._snapshot
+        if self.redis is None or self._loader is None:
+            return snapshot
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return snapshot
+        self._checked_at = now
+        try:
+            published = await self.redis.get(CATALOG_DIGEST_KEY)
+        except Exception as exc:
+            logger.warning("Failed to read schedule catalog digest: %s", exc)
+            return snapshot
+        stale = published and (snapshot is None or published != snapshot.digest)
+        if stale and (self._reload_task is None or self._reload_task.done()):
+            self._reload_task = asyncio.create_task(self._reload())
+        return snapshot
+
+    async def find(self, course_code: str | None, term: str | None = None) -> Mapping | None:
+        snapshot = await self.current()
+        return snapshot.find(course_code, term) if snapshot is not None else None
+
+    async def _reload(self) -> None:
+        try:
+            documents = await self._loader()
+        except Exception:
+            logger.exception("Failed to reload schedule catalog for the code index")
+            return
+        if documents:
+            self.swap(documents)
+
+    async def aclose(self) -> None:
+        task = self._reload_task
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -1,22 +1,28 @@
 import logging
 from typing import Sequence
 
+from backend.common.utils.meilisearch import drop_shadow_indexes, rebuild_index
+from backend.common.utils.meilisearch_sync import acquire_sync_lock, release_sync_lock
 from backend.modules.courses.registrar.schedule_gcs import (
     SCHEDULE_GCS_OBJECT,
     download_schedule_catalog,
     load_local_schedule_catalog_fixture,
 )
+from backend.modules.courses.registrar.schedule_index import ScheduleCodeIndex
 from backend.modules.courses.registrar.schedule_sync_worker import (
     merge_priorities_into_schedule,
 )
+from backend.modules.courses.registrar.semester_registry import ActiveSemesterRegistry
 from google.cloud import storage
 from httpx import AsyncClient
+from redis.asyncio import Redis
 
 logger = logging.getLogger(__name__)
 
 SCHEDULE_PDF_URL = None  # legacy; PDF parsing lives in Cloud Run Job
 SCHEDULE_INDEX_UID = "course_schedule_catalog"
 SCHEDULE_PRIMARY_KEY = "id"
+SCHEDULE_SYNC_LOCK_TTL = 600
 
 # Re-export for tests / callers that imported merge from this module
 _merge_priorities_into_schedule = merge_priorities_into_schedule
@@ -35,30 +41,19 @@ SCHEDULE_FILTERABLE_ATTRIBUTES: Sequence[str] = ("term", "term_id", "school", "l
 async def _recreate_schedule_index(
     meilisearch_client: AsyncClient, documents: Sequence[dict]
 ) -> None:
-    delete_response = await meilisearch_client.delete(f"/indexes/{SCHEDULE_INDEX_UID}")
-    if delete_response.status_code not in (200, 202, 204, 404):
-        delete_response.raise_for_status()
-
-    create_response = await meilisearch_client.post(
-        "/indexes", json={"uid": SCHEDULE_INDEX_UID, "primaryKey": SCHEDULE_PRIMARY_KEY}
-    )
-    create_response.raise_for_status()
-
-    if documents:
-        upload_response = await meilisearch_client.post(
-            f"/indexes/{SCHEDULE_INDEX_UID}/documents", json=documents
-        )
-        upload_response.raise_for_status()
-
+    """Build the catalog in a shadow index and swap it in; the live one stays searchable."""
+    await drop_shadow_indexes(meilisearch_client, SCHEDULE_INDEX_UID)
     settings_payload = {
         "searchableAttributes": list(SCHEDULE_SEARCHABLE_ATTRIBUTES),
         "filterableAttributes": list(SCHEDULE_FILTERABLE_ATTRIBUTES),
     }
-    settings_response = await meilisearch_client.patch(
-        f"/indexes/{SCHEDULE_INDEX_UID}/settings",
-        json=settings_payload,
+    await rebuild_index(
+        meilisearch_client,
+        SCHEDULE_INDEX_UID,
+        [documents],
+        primary_key=SCHEDULE_PRIMARY_KEY,
+        settings=settings_payload,
     )
-    settings_response.raise_for_status()
 
 
 async def sync_schedule_catalog(
@@ -68,7 +63,10 @@ async def sync_schedule_catalog(
     bucket_name: str,
     gcs_object: str = SCHEDULE_GCS_OBJECT,
     prefer_local_fixture: bool = False,
-) -> int:
+    semester_registry: ActiveSemesterRegistry | None = None,
+    code_index: ScheduleCodeIndex | None = None,
+    redis: Redis | None = None,
+) -> int | None:
     """
     Load pre-parsed registrar schedule JSON from GCS and upload into Meilisearch.
 
@@ -76,7 +74,49 @@ async def sync_schedule_catalog(
     lightweight I/O only so API restarts do not spike CPU.
 
     When prefer_local_fixture is True (local IS_DEBUG), load committed fixture first.
+    When semester_registry is given, it is updated with the term of the new catalog.
+    When code_index is given, the new catalog is swapped in and its digest published.
+    When redis is given, the rebuild holds the index's Meilisearch sync lock; if
+    another replica holds it, nothing is done and ``None`` is returned.
     """
+    lock_token: str | None = None
+    if redis is not None:
+        try:
+            lock_token = await acquire_sync_lock(
+                redis, SCHEDULE_INDEX_UID, lock_ttl=SCHEDULE_SYNC_LOCK_TTL
+            )
+        except Exception as exc:
+            logger.warning("Schedule catalog sync lock unavailable, rebuilding anyway: %s", exc)
+            redis = None
+        else:
+            if lock_token is None:
+                logger.info("Schedule catalog is being rebuilt by another replica; skipping")
+                return None
+    try:
+        return await _sync_schedule_catalog(
+            meilisearch_client,
+            storage_client=storage_client,
+            bucket_name=bucket_name,
+            gcs_object=gcs_object,
+            prefer_local_fixture=prefer_local_fixture,
+            semester_registry=semester_registry,
+            code_index=code_index,
+        )
+    finally:
+        if redis is not None and lock_token is not None:
+            await release_sync_lock(redis, SCHEDULE_INDEX_UID, lock_token)
+
+
+async def _sync_schedule_catalog(
+    meilisearch_client: AsyncClient,
+    *,
+    storage_client: storage.Client,
+    bucket_name: str,
+    gcs_object: str,
+    prefer_local_fixture: bool,
+    semester_registry: ActiveSemesterRegistry | None,
+    code_index: ScheduleCodeIndex | None,
+) -> int:
     documents: list[dict] | None = None
     if prefer_local_fixture:
         documents = load_local_schedule_catalog_fixture()
@@ -105,5 +145,10 @@ async def sync_schedule_catalog(
         return 0
 
     await _recreate_schedule_index(meilisearch_client, documents)
+    if semester_registry is not None:
+        semester_registry.update_from_documents(documents)
+    if code_index is not None:
+        code_index.swap(documents)
+        await code_index.publish()
     logger.info("Synced %s registrar schedule entries from GCS", len(documents))
     return len(documents)
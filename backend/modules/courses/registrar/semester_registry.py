@@ -0,0 +1,81 @@
+"""Process-wide registry of the active registrar semester.
+
+The schedule catalog only ever holds one term at a time, so the active semester
+is known the moment the catalog is synced. ``ActiveSemesterRegistry`` lives on
+``app.state`` and is filled from the synced documents (or ``meta.json``), so
+request-scoped ``RegistrarService`` instances do not have to scan the
+Meilisearch index to learn the current term.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, Mapping
+
+from backend.modules.courses.registrar.schemas import SemesterOption
+
+logger = logging.getLogger(__name__)
+
+
+def _semester_sort_key(option: SemesterOption) -> tuple[int, str]:
+    try:
+        numeric_value = int(option.value)
+    except (TypeError, ValueError):
+        numeric_value = -1
+    return (numeric_value, option.label)
+
+
+def latest_semester(documents: Iterable[Mapping]) -> SemesterOption | None:
+    """Return the semester with the highest ``term_id`` among catalog documents/hits."""
+    unique_terms: dict[str, str] = {}
+    for doc in documents:
+        term_id = doc.get("term_id")
+        term_label = doc.get("term")
+        if term_id and term_label:
+            unique_terms[str(term_id)] = str(term_label)
+
+    if not unique_terms:
+        return None
+
+    semesters = [SemesterOption(label=label, value=id) for id, label in unique_terms.items()]
+    return max(semesters, key=_semester_sort_key)
+
+
+class ActiveSemesterRegistry:
+    """Holds the active semester for the lifetime of the API process."""
+
+    def __init__(self) -> None:
+        self._semester: SemesterOption | None = None
+
+    def get(self) -> SemesterOption | None:
+        return self._semester
+
+    def set(self, semester: SemesterOption | None) -> None:
+        if semester is None:
+            return
+        if semester != self._semester:
+            logger.info(
+                "Active registrar semester set to %s (term_id=%s)", semester.label, semester.value
+            )
+        self._semester = semester
+
+    def update_from_documents(self, documents: Iterable[Mapping]) -> SemesterOption | None:
+        """Swap in the latest term found in freshly synced catalog documents."""
+        semester = latest_semester(documents)
+        self.set(semester)
+        return semester
+
+    def update_from_meta(self, meta: Mapping | None) -> SemesterOption | None:
+        """Fill from the catalog ``meta.json`` sidecar (``term_id`` / ``term_label``)."""
+        if not meta:
+            return None
+        term_id = meta.get("term_id")
+        term_label = meta.get("term_label")
+        if not term_id or not term_label:
+            return None
+        semester = SemesterOption(label=str(term_label), value=str(term_id))
+        self.set(semester)
+        return semester
+
+    def clear(self) -> None:
+        self._semester = None
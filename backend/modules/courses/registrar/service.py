@@ -1,10 +1,10 @@
 import asyncio
 import logging
-import re
 from dataclasses import dataclass
 from typing import Dict, Sequence
 
 from backend.common.utils import meilisearch as meilisearch_utils
+from backend.core.executor.pool import CpuExecutor, CpuJob
 from backend.modules.courses.registrar.clients.public_course_catalog import (
     PublicCourseCatalogClient,
 )
@@ -15,10 +15,19 @@ from backend.modules.courses.registrar.parsers.registrar_parser import (
     parse_schedule,
 )
 from backend.modules.courses.registrar.schedule_gcs import SCHEDULE_GCS_OBJECT
+from backend.modules.courses.registrar.schedule_index import (
+    ScheduleCodeIndex,
+    matches_term,
+    normalize_course_code,
+)
 from backend.modules.courses.registrar.schedule_sync import (
     SCHEDULE_INDEX_UID,
     sync_schedule_catalog,
 )
+from backend.modules.courses.registrar.semester_registry import (
+    ActiveSemesterRegistry,
+    latest_semester,
+)
 from backend.modules.courses.registrar.schemas import (
     CourseScheduleEntry,
     CourseSearchRequest,
@@ -36,6 +45,8 @@ logger = logging.getLogger(__name__)
 _CATALOG_SYNC_LOCK_TTL_SECONDS = 120
 _CATALOG_SYNC_PROCESSED_TTL_SECONDS = 86_400
 
+PARSE_SCHEDULE_PDF_JOB = CpuJob("parse_schedule_pdf", parse_personal_schedule_pdf, timeout=30.0)
+
 
 @dataclass
 class CoursePriorityRecord:
@@ -69,6 +80,9 @@ class RegistrarService:
 
     Args:
         client_factory: Factory function for creating registrar clients (default: RegistrarClient)
+        semester_registry: App-scoped active semester registry shared across requests
+        schedule_code_index: App-scoped exact-code index over the schedule catalog
+        cpu_executor: Shared process pool for PDF parsing (inline, with a warning, when omitted)
     """
 
     def __init__(
@@ -81,6 +95,9 @@ class RegistrarService:
         storage_client: storage.Client | None = None,
         bucket_name: str | None = None,
         schedule_gcs_object: str = SCHEDULE_GCS_OBJECT,
+        semester_registry: ActiveSemesterRegistry | None = None,
+        schedule_code_index: ScheduleCodeIndex | None = None,
+        cpu_executor: CpuExecutor | None = None,
     ) -> None:
         self.client_factory = client_factory
         self.public_client_factory = public_client_factory
@@ -90,6 +107,9 @@ class RegistrarService:
         self.bucket_name = bucket_name
         self.schedule_gcs_object = schedule_gcs_object
         self.schedule_index_uid = SCHEDULE_INDEX_UID
+        self.semester_registry = semester_registry
+        self.schedule_code_index = schedule_code_index
+        self.cpu_executor = cpu_executor or CpuExecutor.unwired("RegistrarService")
         self._active_semester: SemesterOption | None = None
 
     async def sync_schedule(self, username: str, password: str) -> ScheduleResponse:
@@ -98,8 +118,8 @@ class RegistrarService:
         schedule: ScheduleResponse = parse_schedule(raw)
         return schedule
 
-    def parse_schedule_pdf(self, pdf_file: bytes) -> ScheduleResponse:
-        return parse_personal_schedule_pdf(pdf_file)
+    async def parse_schedule_pdf(self, pdf_file: bytes) -> ScheduleResponse:
+        return await self.cpu_executor.run(PARSE_SCHEDULE_PDF_JOB, pdf_file)
 
     async def list_semesters(self) -> list[SemesterOption]:
         async with self.public_client_factory() as client:
@@ -128,12 +148,21 @@ class RegistrarService:
 
     async def get_active_semester(self) -> SemesterOption:
         """
-        Return the most recent registrar semester found within the search index.
-        Result is cached per service instance to avoid redundant HTTP calls.
+        Return the most recent registrar semester of the synced schedule catalog.
+
+        Served from the app-scoped semester registry, which is filled on catalog sync.
+        Falls back to scanning the search index only when the registry is still empty
+        (e.g. startup sync has not finished yet) and stores the result back.
         """
         if self._active_semester:
             return self._active_semester
 
+        if self.semester_registry is not None:
+            registered = self.semester_registry.get()
+            if registered is not None:
+                self._active_semester = registered
+                return registered
+
         if not self.meilisearch_client:
             raise HTTPException(status_code=503, detail="Meilisearch client not available")
 
@@ -145,30 +174,15 @@ class RegistrarService:
             page=1,
             size=1000,  # Get up to 1000 docs to find terms
         )
-        hits = search_result.get("hits", [])
-        unique_terms: dict[str, str] = {}
-        for hit in hits:
-            term_id = hit.get("term_id")
-            term_label = hit.get("term")
-            if term_id and term_label:
-                unique_terms[str(term_id)] = str(term_label)
-
-        if not unique_terms:
+        latest = latest_semester(search_result.get("hits", []))
+        if latest is None:
             raise HTTPException(
                 status_code=404, detail="No synced registrar semesters found in the index."
             )
 
-        semesters = [SemesterOption(label=label, value=id) for id, label in unique_terms.items()]
-
-        def _semester_sort_key(option: SemesterOption) -> tuple[int, str]:
-            try:
-                numeric_value = int(option.value)
-            except (TypeError, ValueError):
-                numeric_value = -1
-            return (numeric_value, option.label)
-
-        latest = max(semesters, key=_semester_sort_key)
         self._active_semester = latest
+        if self.semester_registry is not None:
+            self.semester_registry.set(latest)
         return latest
 
     async def search_courses(self, request: CourseSearchRequest) -> CourseSearchResponse:
@@ -256,12 +270,11 @@ class RegistrarService:
             return {}
 
         results: Dict[str, CoursePriorityRecord] = {}
-        sem = asyncio.Semaphore(5)
 
+        # Lookups are batched into /multi-search calls, so no client-side throttle.
         async def _fetch_one(raw_code: str, normalized: str):
-            async with sem:
-                record = await self._fetch_priority_record(raw_code, normalized)
-                return normalized, record
+            record = await self._fetch_priority_record(raw_code, normalized)
+            return normalized, record
 
         fetch_results = await asyncio.gather(
             *(_fetch_one(code, self.normalize_course_code(code)) for code in course_codes)
@@ -277,7 +290,15 @@ class RegistrarService:
         course_code: str | None,
         normalized: str,
     ) -> CoursePriorityRecord | None:
-        if not course_code or not self.meilisearch_client:
+        if not course_code:
+            return None
+
+        match = await self.find_catalog_entry(course_code)
+        if match is None and normalized:
+            match = await self.find_catalog_entry(normalized)
+        if match is not None:
+            return self._priority_record_from_hit(match)
+        if not self.meilisearch_client:
             return None
 
         keyword = course_code.strip()
@@ -288,6 +309,7 @@ class RegistrarService:
                 keyword=keyword or course_code,
                 page=1,
                 size=3,
+                batched=True,
             )
         except Exception:
             return None
@@ -307,6 +329,10 @@ class RegistrarService:
         if not match:
             return None
 
+        return self._priority_record_from_hit(match)
+
+    @staticmethod
+    def _priority_record_from_hit(match: dict) -> CoursePriorityRecord:
         return CoursePriorityRecord(
             prerequisite=match.get("prerequisite"),
             corequisite=match.get("corequisite"),
@@ -323,15 +349,20 @@ class RegistrarService:
         course_code: str,
         term: str | None,
     ) -> list[CourseScheduleEntry]:
+        document = await self.find_catalog_entry(course_code, term)
+        if document is not None:
+            return self._map_sections_from_hit(document)
+
         result = await meilisearch_utils.get(
             client=self.meilisearch_client,
             storage_name=self.schedule_index_uid,
             keyword=course_code or "",
             page=1,
             size=5,
+            batched=True,
         )
-        hits = result.get("hits", [])
-        if not hits:
+        if "hits" not in result:
+            # Error body rather than an empty result: retry once.
             result = await meilisearch_utils.get(
                 client=self.meilisearch_client,
                 storage_name=self.schedule_index_uid,
@@ -339,7 +370,7 @@ class RegistrarService:
                 page=1,
                 size=5,
             )
-            hits = result.get("hits", [])
+        hits = result.get("hits", [])
 
         for hit in hits:
             if not self._matches_term(hit, term):
@@ -409,21 +440,24 @@ class RegistrarService:
 
     @staticmethod
     def _matches_term(hit: dict, term: str | None) -> bool:
-        if not term:
-            return True
-        term_str = str(term).strip()
-        hit_term_id = str(hit.get("term_id") or "").strip()
-        hit_term_label = str(hit.get("term") or "").strip()
-        return term_str == hit_term_id or term_str == hit_term_label
+        return matches_term(hit, term)
 
     @staticmethod
     def normalize_course_code(value: str | None) -> str:
-        if not value:
-            return ""
-        normalized = re.sub(r"\s+", " ", value).strip().upper()
-        normalized = re.sub(r"\s*/\s*", "/", normalized)
-        normalized = normalized.replace("-", "").replace(" ", "")
-        return normalized
+        return normalize_course_code(value)
+
+    async def find_catalog_entry(
+        self, course_code: str | None, term: str | None = None
+    ) -> dict | None:
+        """Exact (cross-list aware) catalog document from the in-process code index.
+
+        None when the index is not loaded or has no such code; callers then fall
+        back to searching Meilisearch.
+        """
+        if self.schedule_code_index is None or not course_code:
+            return None
+        document = await self.schedule_code_index.find(course_code, term)
+        return dict(document) if document is not None else None
 
     @classmethod
     def course_codes_match(cls, left: str | None, right: str | None) -> bool:
@@ -480,7 +514,13 @@ class RegistrarService:
                 bucket_name=self.bucket_name,
                 gcs_object=self.schedule_gcs_object,
                 prefer_local_fixture=False,
+                semester_registry=self.semester_registry,
+                code_index=self.schedule_code_index,
+                redis=self.redis,
             )
+            if count is None:
+                # Another replica is rebuilding the index; Pub/Sub redelivers this event.
+                raise ScheduleCatalogFinalizeError("schedule_catalog_sync_in_progress")
             await self._mark_catalog_sync_done(token)
             logger.info(
                 "Schedule catalog reindexed from GCS finalize (%s docs, gen=%s)",
@@ -1,5 +1,20 @@
+import asyncio
+import json
+
+from backend.common.utils.meilisearch_sync import wait_for_sync_lock
 from backend.core.configs.config import config
-from backend.modules.courses.registrar.schedule_sync import sync_schedule_catalog
+from backend.modules.courses.registrar.schedule_gcs import (
+    SCHEDULE_FIXTURE_META,
+    download_schedule_catalog,
+    download_schedule_meta,
+)
+from backend.modules.courses.registrar.schedule_index import ScheduleCodeIndex
+from backend.modules.courses.registrar.schedule_sync import (
+    SCHEDULE_INDEX_UID,
+    SCHEDULE_SYNC_LOCK_TTL,
+    sync_schedule_catalog,
+)
+from backend.modules.courses.registrar.semester_registry import ActiveSemesterRegistry
 from fastapi import FastAPI
 
 
@@ -7,9 +22,34 @@ async def setup_schedule_catalog(app: FastAPI) -> None:
     """Pull schedule catalog from GCS into Meilisearch on API startup.
 
     Subsequent updates arrive via Pub/Sub GCS OBJECT_FINALIZE → /api/bucket/gcs-hook
-    (no periodic in-process refresher).
+    (no periodic in-process refresher). The active semester registry is filled from
+    the synced documents, or from ``meta.json`` when the catalog sync is skipped.
+    The exact-code index is swapped in from the same documents; replicas that did
+    not handle a finalize reload it through the loader set here.
+
+    Only one replica rebuilds the Meilisearch index at a time (the index's sync
+    lock). Replicas that boot while it is held wait for the rebuild to finish and
+    then fill their code index from the published digest through the loader.
     """
     storage_client = app.state.storage_client
+    redis = getattr(app.state, "redis", None)
+    semester_registry: ActiveSemesterRegistry = app.state.semester_registry
+    code_index: ScheduleCodeIndex | None = getattr(app.state, "schedule_code_index", None)
+
+    if code_index is not None:
+
+        async def _reload_catalog() -> list[dict] | None:
+            documents = await asyncio.to_thread(
+                download_schedule_catalog,
+                storage_client,
+                config.BUCKET_NAME,
+                object_name=config.SCHEDULE_SYNC_GCS_OBJECT,
+            )
+            if documents:
+                semester_registry.update_from_documents(documents)
+            return documents
+
+        code_index.set_loader(_reload_catalog)
 
     try:
         count = await sync_schedule_catalog(
@@ -18,13 +58,40 @@ async def setup_schedule_catalog(app: FastAPI) -> None:
             bucket_name=config.BUCKET_NAME,
             gcs_object=config.SCHEDULE_SYNC_GCS_OBJECT,
             prefer_local_fixture=config.IS_DEBUG,
+            semester_registry=semester_registry,
+            code_index=code_index,
+            redis=redis,
         )
-        source = "local fixture" if config.IS_DEBUG else "GCS"
-        print(f"Synced schedule catalog docs from {source}: {count}")
+        if count is None:
+            await wait_for_sync_lock(redis, SCHEDULE_INDEX_UID, timeout=SCHEDULE_SYNC_LOCK_TTL)
+            if code_index is not None:
+                # Starts a background reload once the digest of the new catalog is published.
+                await code_index.current()
+            print("Schedule catalog rebuilt by another replica; loading it via the digest")
+        else:
+            source = "local fixture" if config.IS_DEBUG else "GCS"
+            print(f"Synced schedule catalog docs from {source}: {count}")
     except Exception as exc:
         print(f"Error syncing registrar course schedule from GCS: {exc}")
 
+    if semester_registry.get() is None:
+        _load_semester_from_meta(app, semester_registry)
+
+
+def _load_semester_from_meta(app: FastAPI, semester_registry: ActiveSemesterRegistry) -> None:
+    meta = None
+    try:
+        if config.IS_DEBUG and SCHEDULE_FIXTURE_META.is_file():
+            meta = json.loads(SCHEDULE_FIXTURE_META.read_text(encoding="utf-8"))
+        else:
+            meta = download_schedule_meta(app.state.storage_client, config.BUCKET_NAME)
+    except Exception as exc:
+        print(f"Error loading registrar schedule meta: {exc}")
+    semester_registry.update_from_meta(meta)
+
 
 async def cleanup_schedule_catalog(app: FastAPI) -> None:
-    """No background refresher to stop; hook kept for lifespan symmetry."""
-    return
+    """Stop an in-flight code index reload; there is no periodic refresher."""
+    code_index: ScheduleCodeIndex | None = getattr(app.state, "schedule_code_index", None)
+    if code_index is not None:
+        await code_index.aclose()
@@ -121,3 +121,22 @@ async def test_finalize_releases_lock_on_sync_error():
             await service.on_catalog_object_finalize(generation="g1")
 
     release.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_finalize_fails_for_redelivery_while_index_rebuild_in_progress():
+    service = _service()
+    with (
+        patch.object(service, "_try_acquire_catalog_sync", new=AsyncMock(return_value=True)),
+        patch(
+            "backend.modules.courses.registrar.service.sync_schedule_catalog",
+            new=AsyncMock(return_value=None),
+        ),
+        patch.object(service, "_mark_catalog_sync_done", new=AsyncMock()) as done,
+        patch.object(service, "_release_catalog_sync_lock", new=AsyncMock()) as release,
+    ):
+        with pytest.raises(ScheduleCatalogFinalizeError):
+            await service.on_catalog_object_finalize(generation="g1")
+
+    done.assert_not_awaited()
+    release.assert_awaited_once()
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from backend.modules.courses.registrar import service as registrar_service
+from backend.modules.courses.registrar.schedule_index import (
+    CATALOG_DIGEST_KEY,
+    ScheduleCatalogSnapshot,
+    ScheduleCodeIndex,
+)
+from backend.modules.courses.registrar.service import RegistrarService
+
+CATALOG = [
+    {
+        "id": "1",
+        "course_code": "WCS 210/ASC 200",
+        "term_id": "825",
+        "term": "Fall 2026",
+        "prerequisite": "None",
+        "sections": [{"section_code": "1L", "days": "MWF", "time": "10:00-10:50"}],
+    },
+    {"id": "2", "course_code": "CSCI 151", "abbr": "CSCI 151", "term_id": "825"},
+    {"id": "3", "course_code": "CSCI 152", "abbr": "MATH 162", "term_id": "825"},
+]
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value):
+        self.data[key] = value
+        return True
+
+
+def test_snapshot_resolves_cross_lists_abbr_and_term():
+    snapshot = ScheduleCatalogSnapshot(CATALOG)
+
+    assert snapshot.find("asc-200")["id"] == "1"
+    assert snapshot.find("WCS 210 / ASC 200")["id"] == "1"
+    assert snapshot.find("wcs210", term="Fall 2026")["id"] == "1"
+    assert snapshot.find("WCS 210", term="826") is None
+    assert snapshot.find("MATH 162")["id"] == "3"
+    assert snapshot.find("CSCI 15") is None
+
+
+@pytest.mark.asyncio
+async def test_service_lookups_skip_meilisearch_when_indexed(monkeypatch):
+    index = ScheduleCodeIndex()
+    index.swap(CATALOG)
+    service = RegistrarService(meilisearch_client=object(), schedule_code_index=index)
+
+    async def fail_get(*args, **kwargs):
+        raise AssertionError("Meilisearch should not be queried")
+
+    monkeypatch.setattr(registrar_service.meilisearch_utils, "get", fail_get)
+
+    sections = await service.get_course_schedule(course_code="ASC 200", term="825")
+    priorities = await service.fetch_course_priorities(["WCS 210"])
+
+    assert [section.section_code for section in sections] == ["1L"]
+    assert priorities["WCS210"].prerequisite == "None"
+
+
+@pytest.mark.asyncio
+async def test_replica_reloads_when_another_published_a_new_catalog():
+    redis = _Redis()
+    leader, follower = ScheduleCodeIndex(redis), ScheduleCodeIndex(redis, check_interval=0)
+    follower.swap(CATALOG[:1])
+    updated = CATALOG + [{"id": "4", "course_code": "PHYS 161", "term_id": "825"}]
+
+    async def loader():
+        return updated
+
+    follower.set_loader(loader)
+    leader.swap(updated)
+    await leader.publish()
+
+    assert await follower.find("PHYS 161") is None
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert (await follower.find("PHYS 161"))["id"] == "4"
+    assert redis.data[CATALOG_DIGEST_KEY] == follower.snapshot.digest
@@ -0,0 +1,74 @@
+"""Unit tests for the lock around the schedule catalog Meilisearch rebuild."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from backend.common.utils.meilisearch_sync import SYNC_LOCK_KEY_PREFIX
+from backend.modules.courses.registrar import schedule_sync
+from backend.modules.courses.registrar.schedule_sync import (
+    SCHEDULE_INDEX_UID,
+    sync_schedule_catalog,
+)
+
+LOCK_KEY = f"{SYNC_LOCK_KEY_PREFIX}{SCHEDULE_INDEX_UID}"
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def eval(self, _script, _numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+async def _sync(redis):
+    return await sync_schedule_catalog(
+        AsyncMock(), storage_client=MagicMock(), bucket_name="bucket", redis=redis
+    )
+
+
+@pytest.mark.asyncio
+async def test_rebuild_holds_the_index_lock_and_releases_it():
+    redis = _Redis()
+    held_during_rebuild = []
+
+    async def _recreate(_client, _documents):
+        held_during_rebuild.append(LOCK_KEY in redis.data)
+
+    with (
+        patch.object(schedule_sync, "download_schedule_catalog", return_value=[{"id": "1"}]),
+        patch.object(schedule_sync, "_recreate_schedule_index", new=_recreate),
+    ):
+        assert await _sync(redis) == 1
+
+    assert held_during_rebuild == [True]
+    assert LOCK_KEY not in redis.data
+
+
+@pytest.mark.asyncio
+async def test_replica_skips_rebuild_while_another_holds_the_lock():
+    redis = _Redis()
+    redis.data[LOCK_KEY] = "other"
+    download = MagicMock()
+    recreate = AsyncMock()
+
+    with (
+        patch.object(schedule_sync, "download_schedule_catalog", new=download),
+        patch.object(schedule_sync, "_recreate_schedule_index", new=recreate),
+    ):
+        assert await _sync(redis) is None
+
+    download.assert_not_called()
+    recreate.assert_not_awaited()
+    assert redis.data[LOCK_KEY] == "other"
@@ -0,0 +1,69 @@
+"""Unit tests for the app-scoped active semester registry."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.modules.courses.registrar import service as registrar_service
+from backend.modules.courses.registrar.schemas import SemesterOption
+from backend.modules.courses.registrar.semester_registry import (
+    ActiveSemesterRegistry,
+    latest_semester,
+)
+from backend.modules.courses.registrar.service import RegistrarService
+
+
+def test_latest_semester_picks_highest_term_id():
+    docs = [
+        {"term_id": "824", "term": "Summer 2026"},
+        {"term_id": "825", "term": "Fall 2026"},
+        {"term_id": None, "term": "Unknown"},
+    ]
+
+    assert latest_semester(docs) == SemesterOption(label="Fall 2026", value="825")
+    assert latest_semester([]) is None
+
+
+def test_registry_swaps_in_new_catalog_term():
+    registry = ActiveSemesterRegistry()
+    registry.update_from_documents([{"term_id": "825", "term": "Fall 2026"}])
+    registry.update_from_documents([{"term_id": "826", "term": "Spring 2027"}])
+
+    assert registry.get() == SemesterOption(label="Spring 2027", value="826")
+
+
+def test_registry_update_from_meta():
+    registry = ActiveSemesterRegistry()
+
+    assert registry.update_from_meta({"term_id": "825", "term_label": "Fall 2026"}) is not None
+    assert registry.get() == SemesterOption(label="Fall 2026", value="825")
+    assert registry.update_from_meta({"doc_count": 0}) is None
+    assert registry.get() == SemesterOption(label="Fall 2026", value="825")
+
+
+@pytest.mark.asyncio
+async def test_get_active_semester_served_from_registry(monkeypatch):
+    registry = ActiveSemesterRegistry()
+    registry.set(SemesterOption(label="Fall 2026", value="825"))
+    service = RegistrarService(meilisearch_client=object(), semester_registry=registry)
+
+    async def fail_get(*args, **kwargs):
+        raise AssertionError("index scan should not run when registry is filled")
+
+    monkeypatch.setattr(registrar_service.meilisearch_utils, "get", fail_get)
+
+    assert (await service.get_active_semester()).value == "825"
+
+
+@pytest.mark.asyncio
+async def test_get_active_semester_fills_empty_registry_from_index(monkeypatch):
+    registry = ActiveSemesterRegistry()
+    service = RegistrarService(meilisearch_client=object(), semester_registry=registry)
+
+    async def fake_get(*args, **kwargs):
+        return {"hits": [{"term_id": "825", "term": "Fall 2026"}]}
+
+    monkeypatch.setattr(registrar_service.meilisearch_utils, "get", fake_get)
+
+    assert (await service.get_active_semester()).value == "825"
+    assert registry.get() == SemesterOption(label="Fall 2026", value="825")
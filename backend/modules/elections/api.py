@@ -1,10 +1,16 @@
 import asyncio
 from typing import Annotated
 
+import httpx
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
 
+from backend.common.dependencies import get_http_clients
+from backend.core.http.clients import HttpClientRegistry
+from backend.core.http.upstreams import QUALTRICS
 from backend.modules.auth.dependencies import get_creds_or_guest
+from backend.modules.elections.counter import ElectionCounterFeed
+from backend.modules.elections.dependencies import get_election_counter_feed
 from backend.modules.elections.schemas import SurveyResponseCount
 from backend.modules.elections.service import get_survey_responses_count
 
@@ -14,16 +20,26 @@ router = APIRouter(
 )
 
 
-async def survey_event_generator(request: Request):
+async def survey_event_generator(request: Request, feed: ElectionCounterFeed):
+    """
+    Yields the survey response count whenever the shared poller publishes a change.
+    """
+    async for count in feed.stream(request.is_disconnected):
+        yield f"data: {count}\n\n"
+
+
+async def polling_event_generator(request: Request, client: httpx.AsyncClient):
     """
     Yields the survey response count every 2 seconds if it has changed.
+
+    Fallback for when no shared feed is configured (no Redis).
     """
     last_count = -1
     while True:
         if await request.is_disconnected():
             break
 
-        count = await get_survey_responses_count()
+        count = await get_survey_responses_count(client)
         if count != last_count:
             yield f"data: {count}\n\n"
             last_count = count
@@ -34,20 +50,30 @@ async def survey_event_generator(request: Request):
 async def stream_election_counter(
     request: Request,
     _user: Annotated[tuple[dict, dict], Depends(get_creds_or_guest)],
+    http_clients: Annotated[HttpClientRegistry, Depends(get_http_clients)],
+    feed: Annotated[ElectionCounterFeed | None, Depends(get_election_counter_feed)],
 ):
     """
     Stream the number of submitted responses for the election survey.
     """
-    event_generator = survey_event_generator(request)
+    if feed is not None:
+        event_generator = survey_event_generator(request, feed)
+    else:
+        event_generator = polling_event_generator(request, http_clients.get(QUALTRICS))
     return StreamingResponse(event_generator, media_type="text/event-stream")
 
 
 @router.get("/counter", response_model=SurveyResponseCount)
 async def get_election_counter(
     _user: Annotated[tuple[dict, dict], Depends(get_creds_or_guest)],
+    http_clients: Annotated[HttpClientRegistry, Depends(get_http_clients)],
+    feed: Annotated[ElectionCounterFeed | None, Depends(get_election_counter_feed)],
 ) -> SurveyResponseCount:
     """
     Get the number of submitted responses for the election survey.
     """
-    count = await get_survey_responses_count()
+    if feed is not None:
+        count = await feed.current()
+    else:
+        count = await get_survey_responses_count(http_clients.get(QUALTRICS))
     return SurveyResponseCount(survey_responses=count)
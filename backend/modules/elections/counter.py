@@ -0,0 +1,165 @@
+"""Shared Qualtrics poller behind the elections counter endpoints.
+
+Every open SSE tab used to poll Qualtrics every two seconds on its own, so an
+election with a few thousand tabs open meant thousands of upstream calls a
+minute. ``ElectionCounterFeed`` polls once for the whole deployment:
+
+- one replica holds the ``elections:counter:leader`` lease and is the only one
+  that calls Qualtrics, every ``interval`` seconds;
+- it polls only while someone is watching: replicas with open streams (or a
+  recent counter read) keep ``elections:counter:demand`` alive;
+- the count is cached in Redis and every change is published on the
+  ``elections:counter`` channel;
+- each replica runs a single subscription and fans changes out to its local SSE
+  streams, so open tabs cost no Redis connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from redis.asyncio import Redis
+
+from backend.core.background.periodic import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+COUNTER_KEY = "elections:counter:value"
+COUNTER_CHANNEL = "elections:counter"
+LEADER_KEY = "elections:counter:leader"
+DEMAND_KEY = "elections:counter:demand"
+
+_RENEW_LEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_LEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class ElectionCounterFeed:
+    """Leader-elected poller plus per-process fan-out of the survey response count."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        fetch: Callable[[], Awaitable[int]],
+        *,
+        interval: float = 2.0,
+        leader_ttl: float = 10.0,
+        demand_ttl: float = 30.0,
+    ) -> None:
+        self.redis = redis
+        self._fetch = fetch
+        self.interval = interval
+        self.leader_ttl = leader_ttl
+        self.demand_ttl = demand_ttl
+        # Outlives a few missed polls, but a cold cache after demand lapses forces a fresh read.
+        self.value_ttl = max(leader_ttl, 3 * interval)
+        self._token = uuid.uuid4().hex
+        self._streams: set[asyncio.Queue[int]] = set()
+        self._refresh_lock = asyncio.Lock()
+        self._demand_touched_at: float | None = None
+        self._loops = [
+            PeriodicTask("Elections counter poll", self._poll_step, interval=interval),
+            # Each step holds one subscription until it drops; then it is re-opened.
+            PeriodicTask("Elections counter subscription", self._listen, interval=interval),
+        ]
+
+    def start(self) -> None:
+        for loop in self._loops:
+            loop.start()
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(loop.aclose() for loop in self._loops))
+        try:
+            await self.redis.eval(_RELEASE_LEASE_SCRIPT, 1, LEADER_KEY, self._token)
+        except Exception as exc:
+            logger.debug("Could not release elections counter lease: %s", exc)
+
+    async def current(self) -> int:
+        """Latest count: the cached value, or one upstream read when the cache is cold."""
+        await self._touch_demand()
+        value = await self.redis.get(COUNTER_KEY)
+        if value is not None:
+            return int(value)
+        async with self._refresh_lock:
+            value = await self.redis.get(COUNTER_KEY)
+            if value is not None:
+                return int(value)
+            return await self._poll_once()
+
+    async def stream(self, is_disconnected: Callable[[], Awaitable[bool]]) -> AsyncIterator[int]:
+        """Yield the current count, then every change, until the client disconnects."""
+        queue: asyncio.Queue[int] = asyncio.Queue(maxsize=1)
+        self._streams.add(queue)
+        try:
+            last = await self.current()
+            yield last
+            while True:
+                try:
+                    count = await asyncio.wait_for(queue.get(), self.interval)
+                except asyncio.TimeoutError:
+                    if await is_disconnected():
+                        return
+                    continue
+                if count != last:
+                    last = count
+                    yield count
+        finally:
+            self._streams.discard(queue)
+
+    def _deliver(self, count: int) -> None:
+        # Streams only care about the newest value; replace anything not yet consumed.
+        for queue in self._streams:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(count)
+
+    async def _touch_demand(self) -> None:
+        now = asyncio.get_running_loop().time()
+        if self._demand_touched_at is not None and now - self._demand_touched_at < self.interval:
+            return
+        self._demand_touched_at = now
+        await self.redis.set(DEMAND_KEY, "1", px=int(self.demand_ttl * 1000))
+
+    async def _is_leader(self) -> bool:
+        ttl_ms = int(self.leader_ttl * 1000)
+        if await self.redis.set(LEADER_KEY, self._token, nx=True, px=ttl_ms):
+            return True
+        return bool(await self.redis.eval(_RENEW_LEASE_SCRIPT, 1, LEADER_KEY, self._token, ttl_ms))
+
+    async def _poll_once(self) -> int:
+        count = await self._fetch()
+        previous = await self.redis.set(
+            COUNTER_KEY, str(count), ex=max(int(self.value_ttl), 1), get=True
+        )
+        if previous != str(count):
+            await self.redis.publish(COUNTER_CHANNEL, str(count))
+        return count
+
+    async def _poll_step(self) -> None:
+        if self._streams:
+            await self._touch_demand()
+        if await self.redis.exists(DEMAND_KEY) and await self._is_leader():
+            await self._poll_once()
+
+    async def _listen(self) -> None:
+        pubsub = self.redis.pubsub()
+        try:
+            await pubsub.subscribe(COUNTER_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self._deliver(int(message["data"]))
+        finally:
+            await pubsub.aclose()
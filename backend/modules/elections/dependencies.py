@@ -0,0 +1,8 @@
+from fastapi import Request
+
+from backend.modules.elections.counter import ElectionCounterFeed
+
+
+def get_election_counter_feed(request: Request) -> ElectionCounterFeed | None:
+    """App-scoped shared Qualtrics counter feed (created in ``lifespan``)."""
+    return getattr(request.app.state, "election_counter", None)
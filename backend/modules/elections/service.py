@@ -9,7 +9,7 @@ from backend.core.configs.config import config
 logger = logging.getLogger(__name__)
 
 
-async def get_survey_responses_count() -> int:
+async def get_survey_responses_count(client: httpx.AsyncClient) -> int:
     """
     Fetches the number of submitted responses for a Qualtrics survey.
     """
@@ -32,25 +32,24 @@ async def get_survey_responses_count() -> int:
         f"surveys/{config.QUALTRICS_SURVEY_ID}"
     )
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            # The 'auditable' field in responseCounts represents the number of
-            # completed, valid survey responses.
-            if 'result' in data and 'responseCounts' in data['result']:
-                return data['result']['responseCounts'].get('auditable', 0)
-            
-            return 0
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Qualtrics API error: {e.response.text}",
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Error connecting to Qualtrics API: {e}",
-            )
+    try:
+        response = await client.get(url, headers=headers)
+        response.raise_for_status()
+        data = response.json()
+        
+        # The 'auditable' field in responseCounts represents the number of
+        # completed, valid survey responses.
+        if 'result' in data and 'responseCounts' in data['result']:
+            return data['result']['responseCounts'].get('auditable', 0)
+        
+        return 0
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Qualtrics API error: {e.response.text}",
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error connecting to Qualtrics API: {e}",
+        )
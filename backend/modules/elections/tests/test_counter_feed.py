@@ -0,0 +1,128 @@
+"""Unit tests for the shared elections counter poller."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.modules.elections.counter import COUNTER_CHANNEL, ElectionCounterFeed
+
+
+class _PubSub:
+    def __init__(self, redis: "_Redis") -> None:
+        self.redis = redis
+        self.queue: asyncio.Queue[dict] = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        for queues in self.redis.subscribers.values():
+            if self.queue in queues:
+                queues.remove(self.queue)
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.subscribers: dict[str, list[asyncio.Queue]] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, px=None, ex=None, get=False):
+        previous = self.data.get(key)
+        if nx and previous is not None:
+            return None
+        self.data[key] = value
+        return previous if get else True
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def eval(self, _script, _numkeys, key, token, *args):
+        if self.data.get(key) != token:
+            return 0
+        if not args:
+            del self.data[key]
+        return 1
+
+    async def publish(self, channel, message):
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+
+    def pubsub(self):
+        return _PubSub(self)
+
+
+class _Qualtrics:
+    def __init__(self, count: int = 0) -> None:
+        self.count = count
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.count
+
+
+async def _connected() -> bool:
+    return False
+
+
+@pytest.mark.asyncio
+async def test_only_one_replica_holds_the_poller_lease():
+    redis = _Redis()
+    leader = ElectionCounterFeed(redis, _Qualtrics())
+    follower = ElectionCounterFeed(redis, _Qualtrics())
+
+    assert await leader._is_leader()
+    assert not await follower._is_leader()
+    assert await leader._is_leader()
+
+    await leader.aclose()
+    assert await follower._is_leader()
+
+
+@pytest.mark.asyncio
+async def test_cold_reads_fetch_once_then_hit_the_cache():
+    qualtrics = _Qualtrics(count=41)
+    feed = ElectionCounterFeed(_Redis(), qualtrics)
+
+    counts = await asyncio.gather(*(feed.current() for _ in range(20)))
+
+    assert counts == [41] * 20
+    assert qualtrics.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_streams_receive_published_changes_without_polling_upstream():
+    redis = _Redis()
+    qualtrics = _Qualtrics(count=1)
+    replicas = [ElectionCounterFeed(redis, qualtrics, interval=0.01) for _ in range(2)]
+    for feed in replicas:
+        feed.start()
+    streams = [feed.stream(_connected) for feed in replicas for _ in range(3)]
+    try:
+        assert [await anext(stream) for stream in streams] == [1] * 6
+        calls_before = qualtrics.calls
+
+        qualtrics.count = 2
+        updates = await asyncio.wait_for(
+            asyncio.gather(*(anext(stream) for stream in streams)), timeout=1
+        )
+
+        assert updates == [2] * 6
+        # Six open streams on two replicas, yet a single poller reached upstream.
+        assert qualtrics.calls - calls_before <= 3
+        assert len(redis.subscribers[COUNTER_CHANNEL]) == 2
+    finally:
+        for stream in streams:
+            await stream.aclose()
+        for feed in replicas:
+            await feed.aclose()
@@ -0,0 +1,173 @@
+"""Background queue for GCS object deletions.
+
+``blob.delete()`` and ``storage_client.batch()`` are blocking HTTP calls. Run on
+the event loop, deleting an event or community with media stalled every request
+in the process. ``GcsDeletionQueue`` takes filenames without blocking and deletes
+them from one worker task:
+
+- filenames queued within ``linger`` seconds are coalesced, up to ``max_batch``
+  per GCS batch request, and the request runs in a worker thread;
+- names that fail are retried with exponential backoff (``base_backoff`` doubling
+  up to ``max_backoff``) and dropped after ``max_attempts``; objects that are
+  already gone count as deleted;
+- ``aclose`` drains what is queued (pending retries included) within a timeout.
+
+The queue is in-process: deletions still queued when the process is killed are
+lost and leave orphaned blobs behind.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import Callable, Iterable
+
+from google.api_core.exceptions import NotFound
+from google.cloud import storage
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+GCS_DELETIONS = Counter(
+    "gcs_deletions_total",
+    "GCS object deletions processed by the background queue",
+    ["outcome"],  # deleted | retried | dropped
+)
+
+# Deletes a batch of object names synchronously; returns the names that failed.
+DeleteBatch = Callable[[list[str]], list[str]]
+
+
+def gcs_batch_deleter(storage_client: storage.Client, bucket_name: str) -> DeleteBatch:
+    """Delete through one GCS batch request, falling back to per-object deletes."""
+
+    def delete_batch(filenames: list[str]) -> list[str]:
+        bucket = storage_client.bucket(bucket_name)
+        try:
+            with storage_client.batch():
+                for filename in filenames:
+                    bucket.blob(filename).delete()
+            return []
+        except Exception:
+            # The batch raises on any failed sub-request (including 404); sort it out per object.
+            failed: list[str] = []
+            for filename in filenames:
+                try:
+                    bucket.blob(filename).delete()
+                except NotFound:
+                    pass
+                except Exception:
+                    failed.append(filename)
+            return failed
+
+    return delete_batch
+
+
+class GcsDeletionQueue:
+    """Coalescing, retrying deletion worker; ``enqueue`` never blocks."""
+
+    def __init__(
+        self,
+        delete_batch: DeleteBatch,
+        *,
+        max_batch: int = 100,
+        linger: float = 0.5,
+        max_attempts: int = 5,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self._delete_batch = delete_batch
+        self.max_batch = max(max_batch, 1)
+        self.linger = linger
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue()
+        self._retries: dict[asyncio.TimerHandle, tuple[str, int]] = {}
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    def enqueue(self, filenames: Iterable[str]) -> None:
+        for filename in filenames:
+            if filename:
+                self._queue.put_nowait((filename, 1))
+
+    async def aclose(self, timeout: float = 10.0) -> None:
+        """Flush pending retries and wait up to ``timeout`` for the queue to drain."""
+        for handle, item in list(self._retries.items()):
+            handle.cancel()
+            self._queue.put_nowait(item)
+        self._retries.clear()
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "GCS deletion queue closed with %s objects pending", self._queue.qsize()
+            )
+        if self._retries:
+            logger.warning("GCS deletion queue closed with %s retries pending", len(self._retries))
+            for handle in self._retries:
+                handle.cancel()
+            self._retries.clear()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.linger
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._process(batch)
+            except Exception:
+                logger.exception("GCS deletion batch crashed")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _process(self, batch: list[tuple[str, int]]) -> None:
+        filenames = list(dict.fromkeys(filename for filename, _ in batch))
+        try:
+            failed = set(await asyncio.to_thread(self._delete_batch, filenames))
+        except Exception as exc:
+            logger.warning("GCS deletion batch failed: %s", exc)
+            failed = set(filenames)
+        GCS_DELETIONS.labels(outcome="deleted").inc(len(filenames) - len(failed))
+
+        attempts = {filename: attempt for filename, attempt in batch}
+        for filename in failed:
+            self._retry(filename, attempts[filename])
+
+    def _retry(self, filename: str, attempt: int) -> None:
+        if attempt >= self.max_attempts:
+            GCS_DELETIONS.labels(outcome="dropped").inc()
+            logger.error("Giving up deleting gs object %s after %s attempts", filename, attempt)
+            return
+        GCS_DELETIONS.labels(outcome="retried").inc()
+        delay = min(self.base_backoff * 2 ** (attempt - 1), self.max_backoff)
+        delay *= random.uniform(0.8, 1.2)
+        item = (filename, attempt + 1)
+
+        def _requeue() -> None:
+            self._retries.pop(handle, None)
+            self._queue.put_nowait(item)
+
+        handle = asyncio.get_running_loop().call_later(delay, _requeue)
+        self._retries[handle] = item
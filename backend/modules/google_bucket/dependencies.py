@@ -7,6 +7,10 @@ from google.oauth2 import id_token
 
 from backend.core.configs.config import Config
 from backend.modules.auth.dependencies import set_request_access_actor
+from backend.modules.courses.registrar.dependencies import (
+    get_schedule_code_index,
+    get_semester_registry,
+)
 from backend.modules.courses.registrar.service import (
     RegistrarService,
     ScheduleCatalogFinalizeError,
@@ -60,6 +64,8 @@ def get_schedule_catalog_on_finalize(request: Request) -> ScheduleCatalogOnFinal
         storage_client=request.app.state.storage_client,
         bucket_name=config.BUCKET_NAME,
         schedule_gcs_object=config.SCHEDULE_SYNC_GCS_OBJECT,
+        semester_registry=get_semester_registry(request),
+        schedule_code_index=get_schedule_code_index(request),
     )
     return _ScheduleCatalogOnFinalizeAdapter(registrar)
 
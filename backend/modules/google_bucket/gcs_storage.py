@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
+import logging
 
 from google.auth.credentials import Credentials
 from google.cloud import storage
 
 from backend.core.configs.config import Config
+from backend.modules.google_bucket.deletion_queue import GcsDeletionQueue, gcs_batch_deleter
+from backend.modules.google_bucket.signed_url_cache import URL_VALIDITY, SignedUrlCache
 from backend.modules.media.interfaces import ObjectStorage
 
+logger = logging.getLogger(__name__)
+
 
 class GcsObjectStorage:
     """GCS adapter implementing the media module's ObjectStorage port."""
@@ -18,10 +22,14 @@ class GcsObjectStorage:
         storage_client: storage.Client,
         config: Config,
         signing_credentials: Credentials | None,
+        url_cache: SignedUrlCache | None = None,
+        deletion_queue: GcsDeletionQueue | None = None,
     ):
         self.storage_client = storage_client
         self.config = config
         self.signing_credentials = signing_credentials
+        self.url_cache = url_cache
+        self.deletion_queue = deletion_queue
 
     async def generate_download_urls(self, filenames: list[str]) -> list[str]:
         if not filenames:
@@ -32,42 +40,38 @@ class GcsObjectStorage:
             return [f"{base_url}/{filename}" for filename in filenames]
 
         bucket = self.storage_client.bucket(self.config.BUCKET_NAME)
-        blobs = [bucket.blob(filename) for filename in filenames]
 
-        async def sign_single_blob(blob: storage.Blob) -> str:
-            return await asyncio.to_thread(
-                blob.generate_signed_url,
+        def sign(filename: str) -> str:
+            return bucket.blob(filename).generate_signed_url(
                 version="v4",
-                expiration=timedelta(minutes=15),
+                expiration=URL_VALIDITY,
                 method="GET",
                 credentials=self.signing_credentials,
             )
 
-        return list(await asyncio.gather(*[sign_single_blob(blob) for blob in blobs]))
+        if self.url_cache is not None:
+            return await self.url_cache.get_many(filenames, sign)
+        return list(
+            await asyncio.gather(*[asyncio.to_thread(sign, filename) for filename in filenames])
+        )
 
     async def delete_object(self, filename: str) -> None:
-        blob = self.storage_client.bucket(self.config.BUCKET_NAME).blob(filename)
-        try:
-            blob.delete()
-        except Exception:
-            pass
+        await self.delete_objects([filename])
 
     async def delete_objects(self, filenames: list[str]) -> None:
+        """Queue deletion in the background; never blocks on GCS."""
         if not filenames:
             return
+        if self.url_cache is not None:
+            for filename in filenames:
+                self.url_cache.invalidate(filename)
+        if self.deletion_queue is not None:
+            self.deletion_queue.enqueue(filenames)
+            return
 
-        bucket = self.storage_client.bucket(self.config.BUCKET_NAME)
-        blobs = [bucket.blob(filename) for filename in filenames]
-
-        for i in range(0, len(blobs), 100):
-            batch = blobs[i : i + 100]
-            try:
-                with self.storage_client.batch():
-                    for blob in batch:
-                        blob.delete()
-            except Exception:
-                for blob in batch:
-                    try:
-                        blob.delete()
-                    except Exception:
-                        pass
+        # No queue (e.g. bot-side services): delete off the event loop right away.
+        failed = await asyncio.to_thread(
+            gcs_batch_deleter(self.storage_client, self.config.BUCKET_NAME), list(filenames)
+        )
+        if failed:
+            logger.warning("Failed to delete %s GCS objects", len(failed))
@@ -0,0 +1,137 @@
+"""Process-wide cache of V4 signed download URLs.
+
+List endpoints (events, communities, OG pages) sign a URL for every media blob
+on every request: an RSA signature plus a thread hop per image. A signed URL is
+valid for ``URL_VALIDITY`` no matter who receives it, so ``SignedUrlCache`` keeps
+each one per object name and hands it out again until ``safety_margin`` before
+it expires. Clients therefore always get at least ``safety_margin`` of validity.
+
+Misses from one call are signed in a few batched thread hops instead of one per
+blob, and concurrent calls (e.g. the sections of one bundle response) share
+signatures that are still in flight. Hit/miss counts are exported as ``gcs_signed_url_cache_total``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+
+from cachetools import TTLCache
+from prometheus_client import Counter
+
+URL_VALIDITY = timedelta(minutes=15)
+
+SIGNED_URL_LOOKUPS = Counter(
+    "gcs_signed_url_cache_total",
+    "Signed download URL lookups by cache outcome",
+    ["outcome"],  # hit | miss
+)
+
+# Signs one object name synchronously; run inside a worker thread.
+SignOne = Callable[[str], str]
+
+
+class SignedUrlCache:
+    """Reuses signed URLs per object name until shortly before they expire."""
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 50_000,
+        validity: timedelta = URL_VALIDITY,
+        safety_margin: timedelta = timedelta(minutes=5),
+        sign_chunk_size: int = 16,
+    ) -> None:
+        ttl = (validity - safety_margin).total_seconds()
+        if ttl <= 0:
+            raise ValueError("safety_margin must be shorter than the URL validity")
+        self.validity = validity
+        self.sign_chunk_size = max(sign_chunk_size, 1)
+        self._urls: TTLCache[str, str] = TTLCache(maxsize=maxsize, ttl=ttl, timer=time.monotonic)
+        self._pending: dict[str, asyncio.Future[str]] = {}
+
+    async def get_many(self, names: Sequence[str], sign: SignOne) -> list[str]:
+        """Signed URLs for ``names`` in order, signing only the ones not cached.
+
+        Names another call is already signing are awaited rather than signed twice;
+        if that call fails, its error is raised here too, and if it is cancelled the
+        names are signed by this call instead.
+        """
+        found: dict[str, str] = {}
+        misses: list[str] = []
+        waiting: dict[str, asyncio.Future[str]] = {}
+        for name in names:
+            if name in found or name in waiting or name in misses:
+                continue
+            url = self._urls.get(name)
+            if url is not None:
+                found[name] = url
+            elif name in self._pending:
+                waiting[name] = self._pending[name]
+            else:
+                misses.append(name)
+        SIGNED_URL_LOOKUPS.labels(outcome="hit").inc(len(names) - len(misses))
+        SIGNED_URL_LOOKUPS.labels(outcome="miss").inc(len(misses))
+
+        if misses:
+            loop = asyncio.get_running_loop()
+            owned = {name: loop.create_future() for name in misses}
+            self._pending.update(owned)
+
+            def _sign_chunk(chunk: list[str]) -> list[str]:
+                return [sign(name) for name in chunk]
+
+            chunks = [
+                misses[i : i + self.sign_chunk_size]
+                for i in range(0, len(misses), self.sign_chunk_size)
+            ]
+            try:
+                signed = await asyncio.gather(
+                    *(asyncio.to_thread(_sign_chunk, chunk) for chunk in chunks)
+                )
+            except Exception as exc:
+                for name, future in owned.items():
+                    self._pending.pop(name, None)
+                    future.set_exception(exc)
+                    future.exception()  # retrieved here; waiters re-raise it
+                raise
+            except BaseException:
+                # This call was cancelled, the waiters were not: they sign these themselves.
+                for name, future in owned.items():
+                    self._pending.pop(name, None)
+                    future.cancel()
+                raise
+            for chunk, urls in zip(chunks, signed):
+                for name, url in zip(chunk, urls):
+                    self._urls[name] = url
+                    found[name] = url
+                    self._pending.pop(name, None)
+                    owned[name].set_result(url)
+
+        if waiting:
+            # shield: cancelling this call must not cancel futures other calls await.
+            results = await asyncio.gather(
+                *(asyncio.shield(future) for future in waiting.values()),
+                return_exceptions=True,
+            )
+            orphaned: list[str] = []
+            for name, result in zip(waiting, results):
+                if isinstance(result, asyncio.CancelledError):
+                    orphaned.append(name)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    found[name] = result
+            if orphaned:
+                found.update(zip(orphaned, await self.get_many(orphaned, sign)))
+
+        return [found[name] for name in names]
+
+    def invalidate(self, name: str) -> None:
+        """Forget the URL of a deleted object."""
+        self._urls.pop(name, None)
+
+    def clear(self) -> None:
+        self._urls.clear()
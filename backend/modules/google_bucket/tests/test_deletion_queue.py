@@ -0,0 +1,61 @@
+"""Unit tests for the background GCS deletion queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.modules.google_bucket.deletion_queue import GcsDeletionQueue
+
+
+class _Deleter:
+    def __init__(self, fail_times: int = 0) -> None:
+        self.batches: list[list[str]] = []
+        self.fail_times = fail_times
+
+    def __call__(self, filenames: list[str]) -> list[str]:
+        self.batches.append(list(filenames))
+        if self.fail_times:
+            self.fail_times -= 1
+            return [name for name in filenames if name.startswith("flaky")]
+        return []
+
+
+@pytest.mark.asyncio
+async def test_enqueued_names_are_coalesced_into_one_batch():
+    deleter = _Deleter()
+    queue = GcsDeletionQueue(deleter, linger=0.05)
+    queue.start()
+
+    queue.enqueue(["a.jpg", "b.jpg"])
+    queue.enqueue(["c.jpg", "a.jpg"])
+    await queue.aclose()
+
+    assert deleter.batches == [["a.jpg", "b.jpg", "c.jpg"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_names_are_retried_with_backoff():
+    deleter = _Deleter(fail_times=2)
+    queue = GcsDeletionQueue(deleter, linger=0.01, base_backoff=0.01)
+    queue.start()
+
+    queue.enqueue(["flaky.jpg", "ok.jpg"])
+    await asyncio.sleep(0.2)
+    await queue.aclose()
+
+    assert deleter.batches == [["flaky.jpg", "ok.jpg"], ["flaky.jpg"], ["flaky.jpg"]]
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts():
+    deleter = _Deleter(fail_times=10)
+    queue = GcsDeletionQueue(deleter, linger=0.01, base_backoff=0.01, max_attempts=2)
+    queue.start()
+
+    queue.enqueue(["flaky.jpg"])
+    await asyncio.sleep(0.2)
+    await queue.aclose()
+
+    assert deleter.batches == [["flaky.jpg"], ["flaky.jpg"]]
@@ -0,0 +1,130 @@
+"""Unit tests for the signed download URL cache."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import timedelta
+
+import pytest
+
+from backend.modules.google_bucket.signed_url_cache import SignedUrlCache
+
+
+class _Signer:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.threads: set[int] = set()
+
+    def __call__(self, name: str) -> str:
+        self.calls.append(name)
+        self.threads.add(threading.get_ident())
+        return f"https://signed/{name}?v={len(self.calls)}"
+
+
+@pytest.mark.asyncio
+async def test_urls_are_reused_until_invalidated():
+    cache = SignedUrlCache()
+    sign = _Signer()
+
+    first = await cache.get_many(["a.jpg", "b.jpg", "a.jpg"], sign)
+    second = await cache.get_many(["b.jpg", "a.jpg"], sign)
+    cache.invalidate("a.jpg")
+    third = await cache.get_many(["a.jpg"], sign)
+
+    assert first == ["https://signed/a.jpg?v=1", "https://signed/b.jpg?v=2", first[0]]
+    assert second == [first[1], first[0]]
+    assert third == ["https://signed/a.jpg?v=3"]
+    assert sign.calls == ["a.jpg", "b.jpg", "a.jpg"]
+
+
+@pytest.mark.asyncio
+async def test_misses_are_signed_in_chunks():
+    cache = SignedUrlCache(sign_chunk_size=10)
+    sign = _Signer()
+
+    urls = await cache.get_many([f"{i}.jpg" for i in range(25)], sign)
+
+    assert len(urls) == 25
+    assert len(sign.calls) == 25
+    assert len(sign.threads) <= 3
+
+
+def test_safety_margin_must_leave_a_positive_ttl():
+    with pytest.raises(ValueError):
+        SignedUrlCache(validity=timedelta(minutes=5), safety_margin=timedelta(minutes=5))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_in_flight_signatures():
+    cache = SignedUrlCache()
+    sign = _Signer()
+
+    first, second = await asyncio.gather(
+        cache.get_many(["a.jpg", "b.jpg"], sign),
+        cache.get_many(["b.jpg", "c.jpg"], sign),
+    )
+
+    assert sorted(sign.calls) == ["a.jpg", "b.jpg", "c.jpg"]
+    assert first[1] == second[0]
+
+
+@pytest.mark.asyncio
+async def test_signing_error_reaches_callers_sharing_it():
+    cache = SignedUrlCache()
+
+    def failing(name: str) -> str:
+        raise RuntimeError("signer down")
+
+    results = await asyncio.gather(
+        cache.get_many(["a.jpg"], failing),
+        cache.get_many(["a.jpg"], failing),
+        return_exceptions=True,
+    )
+
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+    assert cache._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_owner_leaves_waiters_to_sign_themselves():
+    cache = SignedUrlCache()
+    sign = _Signer()
+    release = threading.Event()
+
+    def blocking(name: str) -> str:
+        release.wait(5)
+        return sign(name)
+
+    owner = asyncio.create_task(cache.get_many(["a.jpg"], blocking))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(cache.get_many(["a.jpg"], sign))
+    await asyncio.sleep(0.01)
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    assert (await waiter)[0].startswith("https://signed/a.jpg")
+    release.set()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_disturb_the_owner():
+    cache = SignedUrlCache()
+    sign = _Signer()
+    release = threading.Event()
+
+    def blocking(name: str) -> str:
+        release.wait(5)
+        return sign(name)
+
+    owner = asyncio.create_task(cache.get_many(["a.jpg"], blocking))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(cache.get_many(["a.jpg"], sign))
+    await asyncio.sleep(0.01)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+    assert await owner == ["https://signed/a.jpg?v=1"]
@@ -13,10 +13,13 @@ def build_media_service(db_session: AsyncSession, infra: Infra) -> MediaService:
         storage_client=infra.storage_client,
         config=infra.config,
         signing_credentials=infra.signing_credentials,
+        url_cache=infra.signed_url_cache,
+        deletion_queue=infra.gcs_deletion_queue,
     )
     return MediaService(
         repository=MediaRepository(db_session),
         storage=storage,
+        event_listing_cache=infra.event_listing_cache,
     )
 
 
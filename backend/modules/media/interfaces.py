@@ -10,8 +10,8 @@ class ObjectStorage(Protocol):
         """Return download URLs in the same order as filenames."""
 
     async def delete_object(self, filename: str) -> None:
-        """Delete a single stored object."""
+        """Delete a single stored object (may complete in the background)."""
 
     async def delete_objects(self, filenames: list[str]) -> None:
-        """Delete multiple stored objects."""
+        """Delete multiple stored objects (may complete in the background)."""
 
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from typing import List, Sequence, TypeVar
+from typing import TYPE_CHECKING, List, Sequence, TypeVar
 
 from collections import defaultdict
 
 from sqlalchemy.orm import DeclarativeMeta
 
-from backend.modules.media.models import Media
+from backend.modules.media.models import EntityType, Media
 from backend.modules.media.interfaces import ObjectStorage
 from backend.modules.media.repository import MediaRepository
 from backend.modules.media.schemas import MediaResponse, MediaUpsertData
 
+if TYPE_CHECKING:
+    from backend.modules.campuscurrent.events.listing_cache import EventListingCache
+
 T = TypeVar("T", bound=DeclarativeMeta)
 
 
@@ -19,16 +22,26 @@ class MediaService:
         self,
         repository: MediaRepository,
         storage: ObjectStorage,
+        event_listing_cache: EventListingCache | None = None,
     ):
         self.repository = repository
         self.storage = storage
+        # Cached event listings embed media URLs; any event media change drops them.
+        self.event_listing_cache = event_listing_cache
+
+    async def _media_changed(self, entity_types: Sequence[EntityType]) -> None:
+        if self.event_listing_cache is not None and EntityType.community_events in entity_types:
+            await self.event_listing_cache.invalidate()
 
     async def upsert(self, data: MediaUpsertData) -> Media:
-        return await self.repository.upsert(data)
+        media = await self.repository.upsert(data)
+        await self._media_changed([data.entity_type])
+        return media
 
     async def delete(self, media: Media) -> None:
         await self.storage.delete_object(media.name)
         await self.repository.delete(media)
+        await self._media_changed([media.entity_type])
 
     async def delete_many(self, media_objects: List[Media]) -> None:
         if not media_objects:
@@ -36,6 +49,7 @@ class MediaService:
         await self.storage.delete_objects([media.name for media in media_objects])
         for media in media_objects:
             await self.repository.delete(media)
+        await self._media_changed([media.entity_type for media in media_objects])
 
     async def list_by_ids(self, media_ids: list[int]) -> list[Media]:
         return await self.repository.list_by_ids(media_ids)
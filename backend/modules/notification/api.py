@@ -1,13 +1,14 @@
 from typing import Annotated, List
 
-from fastapi import APIRouter, Depends, Request
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.common.dependencies import get_db_session
 from backend.modules.auth.dependencies import get_creds_or_401
 from backend.modules.notification.models import Notification
 from backend.modules.notification import schemas
+from backend.modules.notification.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(tags=["Notifications"])
 
@@ -31,3 +32,36 @@ async def get(
     result = await session.execute(stmt)
     notifications: List[Notification] = list(result.scalars().all())
     return [schemas.BaseNotification.model_validate(notification) for notification in notifications]
+
+
+@router.get("/notification/cursor", response_model=schemas.NotificationCursorPage)
+async def get_by_cursor(
+    request: Request,
+    user: Annotated[tuple[dict, dict], Depends(get_creds_or_401)],
+    cursor: str | None = None,
+    size: int = Query(10, ge=1, le=100),
+    session: AsyncSession = Depends(get_db_session),
+) -> schemas.NotificationCursorPage:
+    """Newest-first notification history using keyset pagination.
+
+    Pass the returned ``next_cursor`` back to get the following page; it is ``None``
+    on the last page.
+    """
+    stmt = select(Notification).where(Notification.receiver_sub == user[0]["sub"])
+    if cursor is not None:
+        created_at, notification_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Notification.created_at, Notification.id) < (created_at, notification_id)
+        )
+    stmt = stmt.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(size + 1)
+    notifications: List[Notification] = list((await session.scalars(stmt)).all())
+
+    next_cursor = None
+    if len(notifications) > size:
+        notifications = notifications[:size]
+        last = notifications[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return schemas.NotificationCursorPage(
+        items=[schemas.BaseNotification.model_validate(n) for n in notifications],
+        next_cursor=next_cursor,
+    )
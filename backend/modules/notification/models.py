@@ -2,7 +2,7 @@ from datetime import datetime
 from backend.common.datetime_utils import utc_now
 from enum import Enum as PyEnum
 
-from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.core.database.models.base import Base
@@ -27,6 +27,10 @@ class NotificationType(str, PyEnum):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    # Seek key for cursor pagination of a user's notification history.
+    __table_args__ = (
+        Index("ix_notifications_receiver_created_id", "receiver_sub", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
@@ -0,0 +1,34 @@
+"""Opaque cursors for keyset pagination of notification history.
+
+``OFFSET`` pagination makes Postgres walk and discard every earlier row, so deep
+pages of a busy inbox get slower and slower. A cursor instead records the
+``(created_at, id)`` of the last row served, and the next page seeks straight to
+it through ``ix_notifications_receiver_created_id``. Cursors are URL-safe base64
+JSON; clients should treat them as opaque.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(created_at: datetime, notification_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), notification_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of ``encode_cursor``; malformed cursors are a 400."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, notification_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(notification_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor"
+        )
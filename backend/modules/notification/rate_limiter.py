@@ -1,107 +1,167 @@
-"""Async helpers for throttling Telegram bot sends."""
+"""Redis-backed throttling for Telegram bot sends.
 
-from __future__ import annotations
-
-import asyncio
-from collections import deque
-from dataclasses import dataclass
-from time import monotonic
-from typing import Deque, Dict
+Telegram allows roughly ``global_rate_per_sec`` messages per second per bot and
+one message per ``per_chat_min_interval`` in the same chat. Every process that
+consumes the ``notifications`` queue sends as the same bot, so the limits have
+to be shared: both buckets live in Redis and are checked and debited together
+by one Lua script, timed with the Redis server clock so replicas agree.
 
+Per-chat buckets expire once they would be full again, so idle chats leave no
+state behind. When Telegram answers with ``RetryAfter``, ``pause`` empties the
+global bucket for that long so every consumer backs off, not just the one that
+was refused. Wait time and throttling are exported as
+``telegram_rate_limit_wait_seconds`` and ``telegram_rate_limit_throttled_total``.
+"""
 
-@dataclass
-class _ChatState:
-    """Mutable state for a single chat 
-    used to enforce per-chat pacing."""
+from __future__ import annotations
 
-    lock: asyncio.Lock
-    last_sent_at: float | None = None
+import asyncio
+import logging
+
+from prometheus_client import Counter, Histogram
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_WAIT = Histogram(
+    "telegram_rate_limit_wait_seconds",
+    "Time a Telegram send waited for the shared rate limiter",
+    buckets=(0, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+RATE_LIMIT_THROTTLED = Counter(
+    "telegram_rate_limit_throttled_total",
+    "Telegram send attempts delayed by the shared rate limiter",
+    ["scope"],  # global | chat
+)
+
+_KEY_PREFIX = "telegram:ratelimit"
+
+# KEYS: bucket keys (global first, then optionally the chat).
+# ARGV: capacity and refill rate (tokens per millisecond) for each key, in order.
+# Returns {0, 0} when a token was taken from every bucket, otherwise
+# {milliseconds to wait, 1-based index of the bucket that is empty}; nothing is
+# debited unless all buckets have a token.
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tokens = {}
+local wait, scope = 0, 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local available = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    available = math.min(capacity, available + math.max(0, now - ts) * rate)
+    tokens[i] = available
+    if available < 1 then
+        local needed = math.ceil((1 - available) / rate)
+        if needed > wait then
+            wait, scope = needed, i
+        end
+    end
+end
+if wait > 0 then
+    return {wait, scope}
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    redis.call('HSET', key, 'tokens', tostring(tokens[i] - 1), 'ts', now)
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate) + 1000)
+end
+return {0, 0}
+"""
+
+# KEYS: the global bucket. ARGV: capacity, refill rate (tokens per ms), pause (ms).
+# Lowers the bucket so its next token appears only after the pause; never raises it.
+_PAUSE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local target = 1 - tonumber(ARGV[3]) * rate
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local available = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+available = math.min(capacity, available + math.max(0, now - ts) * rate)
+if target < available then
+    redis.call('HSET', KEYS[1], 'tokens', tostring(target), 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - target) / rate) + 1000)
+end
+return 0
+"""
+
+_SCOPES = {1: "global", 2: "chat"}
 
 
 class TelegramRateLimiter:
-    """Enforces global and per-chat Telegram rate limits.
+    """Enforces global and per-chat Telegram rate limits across all consumers.
 
-    The limiter respects Telegram's documented constraints:
-    - A maximum global throughput of ``global_rate_per_sec`` messages per second across chats.
-    - A minimum delay of ``per_chat_min_interval`` seconds between messages in the same chat.
+    - The global bucket holds ``global_rate_per_sec`` tokens and refills at that
+      rate, so short bursts up to the limit are allowed.
+    - Each chat's bucket holds one token and refills every ``per_chat_min_interval``.
 
-    Calls to ``wait`` block (async) until both constraints are satisfied, at which point the
-    caller is allowed to proceed with sending a message.
+    ``wait`` blocks (async) until a token is taken from both buckets. If Redis is
+    unreachable the send proceeds unthrottled rather than stalling the consumer.
     """
 
-    def __init__(self, *, global_rate_per_sec: int, per_chat_min_interval: float) -> None:
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        global_rate_per_sec: int,
+        per_chat_min_interval: float,
+        key_prefix: str = _KEY_PREFIX,
+    ) -> None:
         if global_rate_per_sec <= 0:
             raise ValueError("global_rate_per_sec must be positive")
         if per_chat_min_interval < 0:
             raise ValueError("per_chat_min_interval must be non-negative")
 
-        self._global_rate_per_sec = global_rate_per_sec
-        self._global_window_seconds = 1.0
-        self._global_timestamps: Deque[float] = deque()
-        self._global_lock = asyncio.Lock()
-
-        self._per_chat_min_interval = per_chat_min_interval
-        self._chat_states: Dict[int, _ChatState] = {}
-        self._chat_states_lock = asyncio.Lock()
+        self.redis = redis
+        self.key_prefix = key_prefix
+        self._global_bucket = (global_rate_per_sec, global_rate_per_sec / 1000)
+        self._chat_bucket = (
+            (1, 1 / (per_chat_min_interval * 1000)) if per_chat_min_interval else None
+        )
 
     async def wait(self, chat_id: int | None) -> None:
-        """Block until sending to ``chat_id`` respects both 
-        global and per-chat limits."""
-
-        if chat_id is None:
-            await self._reserve_global_slot()
-            return
-
-        chat_state = await self._get_chat_state(chat_id)
-        async with chat_state.lock:
-            await self._respect_limits(chat_state)
-
-    async def _get_chat_state(self, chat_id: int) -> _ChatState:
-        """Return the state associated with ``chat_id``, 
-        creating it if necessary."""
-
-        async with self._chat_states_lock:
-            state = self._chat_states.get(chat_id)
-            if state is None:
-                state = _ChatState(lock=asyncio.Lock())
-                self._chat_states[chat_id] = state
-            return state
-
-    async def _respect_limits(self, chat_state: _ChatState) -> None:
-        """Wait until both per-chat and global 
-        constraints permit sending."""
-
+        """Block until sending to ``chat_id`` respects both global and per-chat limits."""
+        keys = [f"{self.key_prefix}:global"]
+        args: list[float] = [*self._global_bucket]
+        if chat_id is not None and self._chat_bucket is not None:
+            keys.append(f"{self.key_prefix}:chat:{chat_id}")
+            args.extend(self._chat_bucket)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
         while True:
-            if chat_state.last_sent_at is not None and self._per_chat_min_interval > 0:
-                now = monotonic()
-                elapsed = now - chat_state.last_sent_at
-                wait_time = self._per_chat_min_interval - elapsed
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
-                    continue
-
-            sent_at = await self._reserve_global_slot()
-            chat_state.last_sent_at = sent_at
+            try:
+                wait_ms, scope = await self.redis.eval(_ACQUIRE_SCRIPT, len(keys), *keys, *args)
+            except RedisError as exc:
+                logger.warning("Telegram rate limiter unavailable, sending unthrottled: %s", exc)
+                break
+            if not wait_ms:
+                break
+            RATE_LIMIT_THROTTLED.labels(scope=_SCOPES.get(int(scope), "global")).inc()
+            await asyncio.sleep(int(wait_ms) / 1000)
+        RATE_LIMIT_WAIT.observe(loop.time() - started)
+
+    async def pause(self, seconds: float) -> None:
+        """Stop every consumer from sending for ``seconds`` (Telegram's ``retry_after``)."""
+        if seconds <= 0:
             return
-
-    async def _reserve_global_slot(self) -> float:
-        """Reserve a slot within the global rate limit 
-        and return the timestamp of the grant."""
-
-        async with self._global_lock:
-            while True:
-                now = monotonic()
-
-                while self._global_timestamps and now - self._global_timestamps[0] >= self._global_window_seconds:
-                    self._global_timestamps.popleft()
-
-                if len(self._global_timestamps) < self._global_rate_per_sec:
-                    self._global_timestamps.append(now)
-                    return now
-
-                wait_time = self._global_window_seconds - (now - self._global_timestamps[0])
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
-                else:
-                    await asyncio.sleep(0)
-
+        capacity, rate = self._global_bucket
+        try:
+            await self.redis.eval(
+                _PAUSE_SCRIPT,
+                1,
+                f"{self.key_prefix}:global",
+                capacity,
+                rate,
+                int(seconds * 1000),
+            )
+        except RedisError as exc:
+            logger.warning("Could not pause the Telegram rate limiter: %s", exc)
@@ -0,0 +1,90 @@
+"""Delayed redelivery for notifications Telegram refused with ``RetryAfter``.
+
+Nacking a flood-limited message makes RabbitMQ redeliver it immediately, so the
+consumer spins against Telegram for the whole ``retry_after``. Instead the message
+is republished to a per-delay TTL queue (``notifications.retry.<n>s``) with no
+consumers; when the TTL runs out RabbitMQ dead-letters it back onto the
+``notifications`` queue. The delay is the shortest tier that covers
+``retry_after``. The attempt count travels in the ``x-notification-attempt``
+header, and after ``MAX_ATTEMPTS`` the message is parked in
+``notifications.parking`` for inspection instead of being retried again.
+
+Queues are declared lazily on first use; the broker caches declarations.
+"""
+
+from __future__ import annotations
+
+from faststream.rabbit import RabbitBroker, RabbitQueue
+from prometheus_client import Counter
+
+from backend.modules.notification import schemas
+
+NOTIFICATIONS_QUEUE = "notifications"
+ATTEMPT_HEADER = "x-notification-attempt"
+MAX_ATTEMPTS = 5
+RETRY_DELAYS = (1, 5, 15, 60, 300)  # seconds
+
+PARKING_QUEUE = RabbitQueue(f"{NOTIFICATIONS_QUEUE}.parking", durable=True)
+
+NOTIFICATION_RETRIES = Counter(
+    "notification_retries_total",
+    "Notifications rescheduled after a Telegram RetryAfter",
+    ["outcome"],  # retried | parked
+)
+
+
+def retry_queue(delay: int) -> RabbitQueue:
+    """TTL queue that dead-letters back onto ``notifications`` after ``delay`` seconds."""
+    return RabbitQueue(
+        f"{NOTIFICATIONS_QUEUE}.retry.{delay}s",
+        durable=True,
+        arguments={
+            "x-message-ttl": delay * 1000,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": NOTIFICATIONS_QUEUE,
+        },
+    )
+
+
+RETRY_QUEUES = {delay: retry_queue(delay) for delay in RETRY_DELAYS}
+
+
+def retry_delay_for(retry_after: float) -> int:
+    """Shortest delay tier that is at least ``retry_after`` (capped at the longest)."""
+    for delay in RETRY_DELAYS:
+        if delay >= retry_after:
+            return delay
+    return RETRY_DELAYS[-1]
+
+
+def attempt_from_headers(headers: dict | None) -> int:
+    try:
+        return max(int((headers or {}).get(ATTEMPT_HEADER, 1)), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+async def schedule_retry(
+    broker: RabbitBroker,
+    notification: schemas._RequestNotification,
+    *,
+    attempt: int,
+    retry_after: float,
+) -> str:
+    """Republish ``notification`` for a delayed retry, or park it once attempts run out.
+
+    Returns ``"retried"`` or ``"parked"``.
+    """
+    if attempt >= MAX_ATTEMPTS:
+        queue, outcome = PARKING_QUEUE, "parked"
+    else:
+        queue, outcome = RETRY_QUEUES[retry_delay_for(retry_after)], "retried"
+    await broker.declare_queue(queue)
+    await broker.publish(
+        notification,
+        queue=queue,
+        headers={ATTEMPT_HEADER: attempt + 1 if outcome == "retried" else attempt},
+        persist=True,
+    )
+    NOTIFICATION_RETRIES.labels(outcome=outcome).inc()
+    return outcome
@@ -38,5 +38,10 @@ class BaseNotification(BaseModel):
         from_attributes = True
 
 
+class NotificationCursorPage(BaseModel):
+    items: list[BaseNotification]
+    next_cursor: str | None = None
+
+
 class _RequestNotification(BaseNotification):
     switch: bool
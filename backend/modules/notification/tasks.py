@@ -1,37 +1,103 @@
+"""RabbitMQ consumer that delivers notifications through the Telegram bot.
+
+Each process keeps one sender ``Bot`` (and its HTTP connection pool) for its
+whole lifetime instead of opening a session per message. RabbitMQ hands the
+consumer up to ``NOTIFICATIONS_PREFETCH`` unacked messages and each one runs as
+its own task, so sends overlap and throughput is bounded by the shared rate
+limiter rather than by connection setup.
+"""
+
 from aiogram import Bot
 from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+from faststream.rabbit import Channel
 from faststream.rabbit.annotations import RabbitMessage
+from prometheus_client import Counter, Gauge
+from redis.asyncio import Redis
 
 from backend.bootstrap.rbq import broker
 from backend.core.configs.config import config
 from backend.modules.notification import schemas
 from backend.modules.notification.rate_limiter import TelegramRateLimiter
+from backend.modules.notification.retry import attempt_from_headers, schedule_retry
+
+NOTIFICATIONS_IN_FLIGHT = Gauge(
+    "notifications_in_flight",
+    "Notifications currently being delivered by this process",
+)
+NOTIFICATIONS_PROCESSED = Counter(
+    "notifications_processed_total",
+    "Notifications handled by the consumer",
+    ["outcome"],  # sent | muted | no_chat | forbidden | retry_after
+)
+
+rate_limiter: TelegramRateLimiter | None = None
+_sender_bot: Bot | None = None
+
+
+def configure_rate_limiter(redis: Redis | None) -> None:
+    """Share Telegram send limits through ``redis``; must run before the broker starts."""
+    global rate_limiter
+    rate_limiter = (
+        TelegramRateLimiter(redis, global_rate_per_sec=30, per_chat_min_interval=1.0)
+        if redis is not None
+        else None
+    )
 
-rate_limiter = TelegramRateLimiter(global_rate_per_sec=30, per_chat_min_interval=1.0)
 
+def get_sender_bot() -> Bot:
+    """Long-lived bot used for every notification this process sends."""
+    global _sender_bot
+    if _sender_bot is None:
+        _sender_bot = Bot(token=config.TELEGRAM_BOT_TOKEN)
+    return _sender_bot
 
-@broker.subscriber("notifications")
+
+async def close_sender_bot() -> None:
+    global _sender_bot
+    if _sender_bot is not None:
+        await _sender_bot.session.close()
+        _sender_bot = None
+
+
+@broker.subscriber(
+    "notifications",
+    channel=Channel(prefetch_count=config.NOTIFICATIONS_PREFETCH),
+)
 async def process_notification(notification: schemas._RequestNotification, msg: RabbitMessage):
     from backend.modules.bot.keyboards.kb import kb_url
 
     if not notification.switch:
+        NOTIFICATIONS_PROCESSED.labels(outcome="muted").inc()
         return
     if not notification.tg_id:
+        NOTIFICATIONS_PROCESSED.labels(outcome="no_chat").inc()
         await msg.ack()
         return
-    bot = Bot(token=config.TELEGRAM_BOT_TOKEN)
     message = f"{notification.title}\n\n{notification.message}"
+    NOTIFICATIONS_IN_FLIGHT.inc()
     try:
-        await rate_limiter.wait(notification.tg_id)
-        await bot.send_message(
+        if rate_limiter is not None:
+            await rate_limiter.wait(notification.tg_id)
+        await get_sender_bot().send_message(
             notification.tg_id,
             message,
             reply_markup=kb_url(notification.url) if notification.url else None,
         )
+        NOTIFICATIONS_PROCESSED.labels(outcome="sent").inc()
         await msg.ack()
     except TelegramForbiddenError:
+        NOTIFICATIONS_PROCESSED.labels(outcome="forbidden").inc()
         await msg.reject()
-    except TelegramRetryAfter:
-        await msg.nack()
+    except TelegramRetryAfter as exc:
+        NOTIFICATIONS_PROCESSED.labels(outcome="retry_after").inc()
+        if rate_limiter is not None:
+            await rate_limiter.pause(exc.retry_after)
+        await schedule_retry(
+            broker,
+            notification,
+            attempt=attempt_from_headers(msg.headers),
+            retry_after=exc.retry_after,
+        )
+        await msg.ack()
     finally:
-        await bot.session.close()
+        NOTIFICATIONS_IN_FLIGHT.dec()
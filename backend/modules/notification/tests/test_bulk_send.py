@@ -0,0 +1,103 @@
+"""Unit tests for the bulk notification fan-out path."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.core.database.model_registry import import_models
+from backend.modules.media.models import EntityType
+from backend.modules.notification import schemas, utils
+from backend.modules.notification.models import Notification, NotificationType
+
+
+class _Redis:
+    def __init__(self, muted: set[int]) -> None:
+        self.muted = muted
+        self.mget_calls = 0
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return ["1" if int(key.split(":")[1]) in self.muted else None for key in keys]
+
+    async def exists(self, key):
+        raise AssertionError("bulk path must not issue per-recipient EXISTS")
+
+
+class _Broker:
+    def __init__(self) -> None:
+        self.published: list[schemas._RequestNotification] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def publish(self, message, queue):
+        assert queue == "notifications"
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)  # let the rest of the chunk start
+            self.published.append(message)
+        finally:
+            self.in_flight -= 1
+
+
+@pytest_asyncio.fixture
+async def session():
+    import_models()  # resolves the type of the users.sub foreign key
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Notification.__table__.create)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def _request(tg_id: int | None) -> schemas.RequestNotiification:
+    return schemas.RequestNotiification(
+        title="Event",
+        message=f"hello {tg_id}",
+        notification_source=EntityType.community_events,
+        receiver_sub=f"sub-{tg_id}",
+        telegram_id=tg_id,
+        type=NotificationType.info,
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_send_uses_inserted_ids_and_skips_muted(session):
+    redis, broker = _Redis(muted={2}), _Broker()
+    infra = SimpleNamespace(redis=redis, broker=broker)
+
+    sent = await utils.send(
+        infra=infra,
+        notification_data=[_request(1), _request(None), _request(2), _request(3), _request(1)],
+        session=session,
+    )
+
+    rows = (await session.scalars(select(Notification).order_by(Notification.id))).all()
+    assert [n.id for n in sent] == [row.id for row in rows]
+    assert [n.tg_id for n in sent] == [1, 2, 3, 1]
+    assert [n.switch for n in sent] == [True, False, True, True]
+    assert all(n.id > 0 for n in sent)
+    assert redis.mget_calls == 1
+    assert [n.tg_id for n in broker.published] == [1, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_bulk_send_publishes_in_chunks(session, monkeypatch):
+    monkeypatch.setattr(utils, "PUBLISH_CHUNK_SIZE", 7)
+    broker = _Broker()
+    infra = SimpleNamespace(redis=_Redis(muted=set()), broker=broker)
+
+    sent = await utils.send(
+        infra=infra, notification_data=[_request(i) for i in range(1, 21)], session=session
+    )
+
+    assert len(sent) == 20
+    assert sorted(n.id for n in broker.published) == sorted(n.id for n in sent)
+    assert broker.max_in_flight == 7
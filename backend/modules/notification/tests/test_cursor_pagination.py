@@ -0,0 +1,84 @@
+"""Unit tests for keyset pagination of notification history."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.core.database.model_registry import import_models
+from backend.modules.media.models import EntityType
+from backend.modules.notification import api
+from backend.modules.notification.models import Notification, NotificationType
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_USER = ({"sub": "me"}, {})
+
+
+@pytest_asyncio.fixture
+async def session():
+    import_models()  # resolves the type of the users.sub foreign key
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Notification.__table__.create)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        # Two rows share a timestamp so the id tiebreak is exercised.
+        stamps = [_T0 + timedelta(minutes=i // 2) for i in range(7)]
+        session.add_all(
+            [
+                Notification(
+                    id=i + 1,
+                    title="t",
+                    message=f"m{i}",
+                    notification_source=EntityType.community_events,
+                    receiver_sub="me",
+                    type=NotificationType.info,
+                    tg_id=1,
+                    created_at=stamp,
+                )
+                for i, stamp in enumerate(stamps)
+            ]
+            + [
+                Notification(
+                    id=100,
+                    title="t",
+                    message="other",
+                    notification_source=EntityType.community_events,
+                    receiver_sub="someone-else",
+                    type=NotificationType.info,
+                    tg_id=2,
+                    created_at=_T0,
+                )
+            ]
+        )
+        await session.flush()
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_walk_history_newest_first(session):
+    seen: list[int] = []
+    cursor = None
+    while True:
+        page = await api.get_by_cursor(
+            request=None, user=_USER, cursor=cursor, size=3, session=session
+        )
+        seen.extend(item.id for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [7, 6, 5, 4, 3, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_rejected(session):
+    with pytest.raises(HTTPException) as exc_info:
+        await api.get_by_cursor(
+            request=None, user=_USER, cursor="not-a-cursor", size=3, session=session
+        )
+    assert exc_info.value.status_code == 400
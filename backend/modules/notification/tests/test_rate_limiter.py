@@ -0,0 +1,96 @@
+"""Unit tests for the Redis-backed Telegram rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from backend.modules.notification import rate_limiter as rate_limiter_module
+from backend.modules.notification.rate_limiter import TelegramRateLimiter
+
+
+class _Redis:
+    """Replays scripted ``[wait_ms, scope]`` answers and records each call."""
+
+    def __init__(self, answers) -> None:
+        self.answers = list(answers)
+        self.calls: list[tuple] = []
+
+    async def eval(self, script, numkeys, *keys_and_args):
+        self.calls.append((numkeys, keys_and_args))
+        answer = self.answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded: list[float] = []
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_wait_checks_global_and_chat_buckets_together(sleeps):
+    redis = _Redis([[0, 0]])
+    limiter = TelegramRateLimiter(redis, global_rate_per_sec=30, per_chat_min_interval=1.0)
+
+    await limiter.wait(42)
+
+    numkeys, keys_and_args = redis.calls[0]
+    assert numkeys == 2
+    assert keys_and_args == (
+        "telegram:ratelimit:global",
+        "telegram:ratelimit:chat:42",
+        30,
+        0.03,
+        1,
+        0.001,
+    )
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_wait_sleeps_for_the_time_redis_reports(sleeps):
+    redis = _Redis([[250, 2], [40, 1], [0, 0]])
+    limiter = TelegramRateLimiter(redis, global_rate_per_sec=30, per_chat_min_interval=1.0)
+
+    await limiter.wait(42)
+
+    assert sleeps == [0.25, 0.04]
+    assert len(redis.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_wait_without_chat_only_uses_the_global_bucket(sleeps):
+    redis = _Redis([[0, 0]])
+    limiter = TelegramRateLimiter(redis, global_rate_per_sec=30, per_chat_min_interval=1.0)
+
+    await limiter.wait(None)
+
+    assert redis.calls[0] == (1, ("telegram:ratelimit:global", 30, 0.03))
+
+
+@pytest.mark.asyncio
+async def test_wait_fails_open_when_redis_is_down(sleeps):
+    redis = _Redis([RedisConnectionError("down")])
+    limiter = TelegramRateLimiter(redis, global_rate_per_sec=30, per_chat_min_interval=1.0)
+
+    await limiter.wait(42)
+
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_pause_drains_the_global_bucket_for_retry_after(sleeps):
+    redis = _Redis([0])
+    limiter = TelegramRateLimiter(redis, global_rate_per_sec=30, per_chat_min_interval=1.0)
+
+    await limiter.pause(7)
+
+    assert redis.calls == [(1, ("telegram:ratelimit:global", 30, 0.03, 7000))]
@@ -0,0 +1,73 @@
+"""Unit tests for delayed redelivery of flood-limited notifications."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.modules.media.models import EntityType
+from backend.modules.notification import schemas
+from backend.modules.notification.models import NotificationType
+from backend.modules.notification.retry import (
+    ATTEMPT_HEADER,
+    MAX_ATTEMPTS,
+    PARKING_QUEUE,
+    attempt_from_headers,
+    retry_delay_for,
+    schedule_retry,
+)
+
+
+class _Broker:
+    def __init__(self) -> None:
+        self.declared: list[str] = []
+        self.published: list[tuple[str, dict]] = []
+
+    async def declare_queue(self, queue):
+        self.declared.append(queue.name)
+
+    async def publish(self, message, queue, headers, persist):
+        self.published.append((queue.name, headers))
+
+
+def _notification() -> schemas._RequestNotification:
+    return schemas._RequestNotification(
+        id=1,
+        title="t",
+        message="m",
+        notification_source=EntityType.community_events,
+        receiver_sub="sub",
+        tg_id=42,
+        type=NotificationType.info,
+        created_at=datetime.now(timezone.utc),
+        switch=True,
+    )
+
+
+def test_retry_delay_covers_retry_after():
+    assert retry_delay_for(0) == 1
+    assert retry_delay_for(3) == 5
+    assert retry_delay_for(60) == 60
+    assert retry_delay_for(10_000) == 300
+
+
+def test_attempt_header_defaults_to_first_attempt():
+    assert attempt_from_headers(None) == 1
+    assert attempt_from_headers({ATTEMPT_HEADER: "3"}) == 3
+    assert attempt_from_headers({ATTEMPT_HEADER: "junk"}) == 1
+
+
+@pytest.mark.asyncio
+async def test_schedule_retry_uses_ttl_queue_then_parks():
+    broker = _Broker()
+
+    first = await schedule_retry(broker, _notification(), attempt=1, retry_after=12)
+    last = await schedule_retry(broker, _notification(), attempt=MAX_ATTEMPTS, retry_after=12)
+
+    assert (first, last) == ("retried", "parked")
+    assert broker.published == [
+        ("notifications.retry.15s", {ATTEMPT_HEADER: 2}),
+        (PARKING_QUEUE.name, {ATTEMPT_HEADER: MAX_ATTEMPTS}),
+    ]
+    assert broker.declared == ["notifications.retry.15s", PARKING_QUEUE.name]
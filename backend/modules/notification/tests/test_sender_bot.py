@@ -0,0 +1,87 @@
+"""Unit tests for the process-wide sender bot used by the notifications consumer."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.modules.media.models import EntityType
+from backend.modules.notification import schemas, tasks
+from backend.modules.notification.models import NotificationType
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _Bot:
+    instances: list[_Bot] = []
+
+    def __init__(self, token: str) -> None:
+        self.session = _Session()
+        self.sent: list[int] = []
+        _Bot.instances.append(self)
+
+    async def send_message(self, chat_id, text, reply_markup=None):
+        self.sent.append(chat_id)
+
+
+class _Message:
+    headers: dict = {}
+
+    def __init__(self) -> None:
+        self.acked = False
+
+    async def ack(self) -> None:
+        self.acked = True
+
+
+def _notification(tg_id: int) -> schemas._RequestNotification:
+    return schemas._RequestNotification(
+        id=tg_id,
+        title="t",
+        message="m",
+        notification_source=EntityType.community_events,
+        receiver_sub=f"sub-{tg_id}",
+        tg_id=tg_id,
+        type=NotificationType.info,
+        created_at=datetime.now(timezone.utc),
+        switch=True,
+    )
+
+
+@pytest.fixture
+def fake_bot(monkeypatch):
+    _Bot.instances = []
+    monkeypatch.setattr(tasks, "Bot", _Bot)
+    monkeypatch.setattr(tasks, "_sender_bot", None)
+    monkeypatch.setattr(tasks, "rate_limiter", None)
+    return _Bot
+
+
+@pytest.mark.asyncio
+async def test_messages_share_one_sender_bot(fake_bot):
+    first, second = _Message(), _Message()
+
+    await tasks.process_notification(_notification(1), first)
+    await tasks.process_notification(_notification(2), second)
+
+    assert len(fake_bot.instances) == 1
+    assert fake_bot.instances[0].sent == [1, 2]
+    assert first.acked and second.acked
+
+
+@pytest.mark.asyncio
+async def test_close_sender_bot_closes_session_and_resets(fake_bot):
+    bot = tasks.get_sender_bot()
+
+    await tasks.close_sender_bot()
+
+    assert bot.session.closed
+    assert tasks._sender_bot is None
+    assert tasks.get_sender_bot() is not bot
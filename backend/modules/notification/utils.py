@@ -1,11 +1,14 @@
+import asyncio
 from typing import Union, List
-from datetime import datetime, timezone
 from backend.common.utils.response_builder import build_schema
 from backend.modules.notification.models import Notification
 from backend.modules.notification import schemas
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.common.schemas import Infra
 
+# Upper bound on publishes in flight at once during a bulk fan-out.
+PUBLISH_CHUNK_SIZE = 500
 
 
 async def send(
@@ -56,56 +59,73 @@ async def send(
         return modified_notification
     
     # Handle list of notifications
-    notification_instances = []
-    for notification_schema in notification_data:
-        if notification_schema.telegram_id is None:
-            continue
-        notification_instance = Notification(
-            title=notification_schema.title,
-            message=notification_schema.message,
-            notification_source=notification_schema.notification_source,
-            receiver_sub=notification_schema.receiver_sub,
-            type=notification_schema.type,
-            tg_id=notification_schema.telegram_id,
-            url=notification_schema.url,
-        )
-        notification_instances.append(notification_instance)
-    
-    if not notification_instances:
+    return await _send_bulk(infra=infra, notification_data=notification_data, session=session)
+
+
+async def _send_bulk(
+    *,
+    infra: Infra,
+    notification_data: List[schemas.RequestNotiification],
+    session: AsyncSession,
+) -> List[schemas._RequestNotification]:
+    """
+    Fan out a list of notifications in a constant number of round-trips.
+
+    Rows go in through one multi-row ``INSERT ... RETURNING`` (SQLAlchemy pages it
+    into statements of ``insertmanyvalues_page_size`` rows), mute switches are read
+    with a single ``MGET``, and messages are published in concurrent chunks of
+    ``PUBLISH_CHUNK_SIZE``. Muted recipients still get their notification row, but
+    nothing is published for them since the consumer would drop it anyway.
+    """
+    rows = [
+        {
+            "title": notification_schema.title,
+            "message": notification_schema.message,
+            "notification_source": notification_schema.notification_source,
+            "receiver_sub": notification_schema.receiver_sub,
+            "type": notification_schema.type,
+            "tg_id": notification_schema.telegram_id,
+            "url": notification_schema.url,
+        }
+        for notification_schema in notification_data
+        if notification_schema.telegram_id is not None
+    ]
+    if not rows:
         return []
 
-    session.add_all(notification_instances)
-    await session.flush()
-    for notification_instance in notification_instances:
-        await session.refresh(notification_instance)
-    
-    modified_notifications: List[schemas._RequestNotification] = []
-    
-    # Process each notification schema for Redis check and publishing
-    for notification_schema in notification_data:
-        if notification_schema.telegram_id is None:
-            continue
-        switch: bool = not await infra.redis.exists(
-            f"notification:{notification_schema.telegram_id}"
-        )
-        base_notification = schemas.BaseNotification(
-            id=0,
-            title=notification_schema.title,
-            message=notification_schema.message,
-            notification_source=notification_schema.notification_source,
-            receiver_sub=notification_schema.receiver_sub,
-            tg_id=notification_schema.telegram_id,
-            type=notification_schema.type,
-            url=notification_schema.url,
-            created_at=datetime.now(timezone.utc)
+    notifications = (
+        await session.scalars(
+            insert(Notification).returning(Notification, sort_by_parameter_order=True),
+            rows,
         )
-        modified_notification: schemas._RequestNotification = build_schema(
+    ).all()
+
+    tg_ids = list(dict.fromkeys(row["tg_id"] for row in rows))
+    mute_flags = await infra.redis.mget([f"notification:{tg_id}" for tg_id in tg_ids])
+    muted = {tg_id for tg_id, flag in zip(tg_ids, mute_flags) if flag is not None}
+
+    modified_notifications: List[schemas._RequestNotification] = [
+        build_schema(
             schemas._RequestNotification,
-            base_notification,
-            switch=switch,
+            schemas.BaseNotification.model_validate(notification),
+            switch=notification.tg_id not in muted,
         )
-        modified_notifications.append(modified_notification)
-        await infra.broker.publish(modified_notification, queue="notifications")
-    
+        for notification in notifications
+    ]
+    await _publish_many(
+        infra.broker,
+        [notification for notification in modified_notifications if notification.switch],
+    )
     return modified_notifications
-    
\ No newline at end of file
+
+
+async def _publish_many(broker, messages: List[schemas._RequestNotification]) -> None:
+    # RabbitBroker has no publish_batch; concurrent publishes share the channel and
+    # their confirms are pipelined, so each chunk costs about one round-trip.
+    for i in range(0, len(messages), PUBLISH_CHUNK_SIZE):
+        await asyncio.gather(
+            *(
+                broker.publish(message, queue="notifications")
+                for message in messages[i : i + PUBLISH_CHUNK_SIZE]
+            )
+        )
@@ -1,7 +1,9 @@
 from fastapi import Query, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from backend.common.dependencies import get_db_session, get_infra
+from backend.common.dependencies import get_db_session, get_http_clients, get_infra
 from backend.common.schemas import Infra
+from backend.core.http.clients import HttpClientRegistry
+from backend.core.http.upstreams import GOOGLE_APIS
 from backend.modules.opportunities import schemas
 from backend.modules.opportunities.service import OpportunitiesDigestService
 from backend.modules.auth.keycloak_manager import KeyCloakManager
@@ -35,9 +37,14 @@ def get_opportunities_digest_service(
     request: Request,
     db: AsyncSession = Depends(get_db_session),
     infra: Infra = Depends(get_infra),
+    http_clients: HttpClientRegistry = Depends(get_http_clients),
 ) -> OpportunitiesDigestService:
     kc_manager: KeyCloakManager | None = request.app.state.kc_manager if request else None
-    calendar_service = GoogleCalendarService(kc_manager=kc_manager) if kc_manager else None
+    calendar_service = (
+        GoogleCalendarService(kc_manager=kc_manager, http_client=http_clients.get(GOOGLE_APIS))
+        if kc_manager
+        else None
+    )
     return OpportunitiesDigestService(
         db_session=db,
         meilisearch_client=infra.meilisearch_client,
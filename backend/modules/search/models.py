@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.core.database.models.base import Base
+
+
+class SearchTombstone(Base):
+    """Row deleted from a Meilisearch-indexed table.
+
+    Written by the ``record_search_tombstone`` trigger on every indexed table, so
+    the incremental sync can remove documents whose rows no longer exist.
+    """
+
+    __tablename__ = "search_tombstones"
+    __table_args__ = (Index("ix_search_tombstones_table_deleted_at", "table_name", "deleted_at"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    table_name: Mapped[str] = mapped_column(String(64), nullable=False)
+    document_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )